@@ -3,7 +3,7 @@
 Skill Recommender - Fetches trending and recommended skills from marketplaces.
 
 Usage:
-    python recommend_skills.py [--source <source>] [--limit <n>] [--json]
+    python recommend_skills.py [--source <source>] [--limit <n>] [--json] [--no-cache]
 
 Sources:
     - skills.sh: Community skills leaderboard
@@ -15,25 +15,143 @@ Examples:
     python recommend_skills.py --source skills.sh  # Only skills.sh
     python recommend_skills.py --limit 10          # Show top 10
     python recommend_skills.py --json              # Output as JSON
+    python recommend_skills.py --no-cache          # Bypass the page and category caches
 """
 
 import json
 import sys
 import argparse
+import codecs
+import os
 import re
+import time
 from pathlib import Path
-from typing import List, Optional, Set
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from contextlib import contextmanager
 from dataclasses import dataclass
+import http.client
 import urllib.request
 from html.parser import HTMLParser
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # Fall back to the stdlib HTMLParser
+    lxml_etree = None
+
+try:
+    import requests
+except ImportError:  # Fall back to urllib
+    requests = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to per-category regexes
+    ahocorasick = None
+
 # Import i18n module
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 from i18n import get_i18n, t  # noqa: E402
 
+# Patterns used by SkillsShParser on every text node
+_INSTALL_RE = re.compile(r"([\d,\.]+)\s*[kKmM]?\s*install", re.IGNORECASE)
+_NUM_RE = re.compile(r"^[\d,\.]+$")
+
+# Common category keywords matched against installed skill names
+_CATEGORY_KEYWORDS = {
+    "developer-tools": ("github", "git", "code", "bash", "command", "skill"),
+    "document-tools": ("doc", "pdf", "ppt", "excel", "word", "paper", "citation", "write"),
+    "testing": ("test", "qa", "playwright", "check"),
+    "frontend": ("front", "ui", "design", "css", "web", "html", "visual"),
+    "security": ("security", "safe"),
+    "learning": ("learn", "study", "explain", "academic"),
+}
+
+_CATEGORY_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+
+
+def _build_category_automaton():
+    """Build one Aho-Corasick automaton mapping each keyword to its categories."""
+    if ahocorasick is None:
+        return None
+
+    keyword_categories = {}
+    for category, keywords in _CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, []).append(category)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, categories in keyword_categories.items():
+        automaton.add_word(keyword, tuple(categories))
+    automaton.make_automaton()
+    return automaton
+
+
+# Scans each skill name once for every keyword when pyahocorasick is installed
+_CATEGORY_AUTOMATON = _build_category_automaton()
+
+# Section borders for the text output
+_BORDER_18 = "━" * 18
+_BORDER_31 = "━" * 31
+_BORDER_40 = "━" * 40
+
+# Read size used when streaming marketplace pages into the parser
+_CHUNK_SIZE = 32768
+
+# Raw skills.sh page, reused while younger than the TTL (seconds)
+SKILLS_SH_CACHE_FILE = Path.home() / ".cache" / "skills-updater" / "skills_sh.html"
+SKILLS_SH_CACHE_TTL = 3600
+
+# Installed-skill categories, keyed by plugin/skills directory mtimes
+CATEGORY_CACHE_FILE = Path.home() / ".claude" / ".skills_category_cache.json"
+
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) skills-updater/1.0"
+
+# Shared keep-alive session so repeated marketplace fetches reuse connections
+_SESSION = None
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.headers.update({"User-Agent": _USER_AGENT})
+
+
+def _json_load(path: Path):
+    """Parse the JSON document stored at ``path``."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize ``obj`` as UTF-8 JSON text indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
 
-@dataclass
+class _EnoughSkills(Exception):
+    """Raised by SkillsShParser to stop parsing once the limit is reached."""
+
+
+# Errors fetching or parsing skills.sh, after which the skills parsed so far
+# (or the hardcoded list) are used. requests' errors are OSErrors; truncated
+# urllib responses raise http.client.IncompleteRead; lxml rejects empty or
+# broken pages with XMLSyntaxError; decoding errors are ValueErrors.
+_FETCH_ERRORS: Tuple[type, ...] = (OSError, http.client.HTTPException, ValueError)
+if lxml_etree is not None:
+    _FETCH_ERRORS += (lxml_etree.LxmlError,)
+
+
+@dataclass(slots=True)
 class RecommendedSkill:
     name: str
     installs: Optional[int]
@@ -44,11 +162,20 @@ class RecommendedSkill:
     category: Optional[str] = None
 
 
+def _get_attr(attrs, name: str) -> Optional[str]:
+    """Return the value of attribute ``name`` from an HTMLParser attrs list."""
+    for key, value in attrs:
+        if key == name:
+            return value
+    return None
+
+
 class SkillsShParser(HTMLParser):
     """Parse skills.sh leaderboard page."""
 
-    def __init__(self):
+    def __init__(self, limit: Optional[int] = None):
         super().__init__()
+        self._limit = limit
         self.skills = []
         self.current_skill = {}
         self.in_skill_item = False
@@ -56,18 +183,20 @@ class SkillsShParser(HTMLParser):
         self.current_tag = None
 
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
+        # Outside a skill entry only a <div> can matter
+        if not self.in_skill_item and tag != "div":
+            return
 
         # Look for skill entries in the leaderboard
-        if tag == "div" and "class" in attrs_dict:
-            classes = attrs_dict.get("class", "")
+        if tag == "div":
+            classes = _get_attr(attrs, "class")
             if classes and ("skill" in classes.lower() or "item" in classes.lower()):
                 self.in_skill_item = True
                 self.current_skill = {}
 
         if self.in_skill_item:
-            if tag == "a" and "href" in attrs_dict:
-                href = attrs_dict.get("href", "")
+            if tag == "a":
+                href = _get_attr(attrs, "href")
                 if href and ("github.com" in href or "/" in href):
                     self.current_skill["repo"] = href
 
@@ -79,6 +208,8 @@ class SkillsShParser(HTMLParser):
         if tag == "div" and self.in_skill_item:
             if self.current_skill.get("name"):
                 self.skills.append(self.current_skill)
+                if self._limit is not None and len(self.skills) >= self._limit:
+                    raise _EnoughSkills()
             self.in_skill_item = False
             self.current_skill = {}
 
@@ -86,52 +217,187 @@ class SkillsShParser(HTMLParser):
         self.current_tag = None
 
     def handle_data(self, data):
-        if self.capture_text and self.in_skill_item:
-            text = data.strip()
-            if not text:
-                return
-
-            # Try to extract install count
-            install_match = re.search(r"([\d,\.]+)\s*[kKmM]?\s*install", text, re.IGNORECASE)
-            if install_match:
-                count_str = install_match.group(1).replace(",", "")
-                try:
-                    count = float(count_str)
-                    if "k" in text.lower():
-                        count *= 1000
-                    elif "m" in text.lower():
-                        count *= 1000000
-                    self.current_skill["installs"] = int(count)
-                except:
-                    pass
-
-            # Capture name (usually in h3/h4 or first significant text)
-            if self.current_tag in ["h3", "h4"] or "name" not in self.current_skill:
-                if len(text) > 2 and len(text) < 100 and not text.startswith("http"):
-                    if "install" not in text.lower() and not re.match(r"^[\d,\.]+$", text):
-                        self.current_skill["name"] = text
-
-
-def fetch_skills_sh(limit: int = 20) -> List[RecommendedSkill]:
-    """Fetch trending skills from skills.sh."""
-    url = "https://skills.sh/"
+        if not (self.capture_text and self.in_skill_item):
+            return
+
+        text = data.strip()
+        if not text:
+            return
+        text_lower = text.lower()
+
+        # Try to extract install count
+        install_match = _INSTALL_RE.search(text)
+        if install_match:
+            count_str = install_match.group(1).replace(",", "")
+            try:
+                count = float(count_str)
+                if "k" in text_lower:
+                    count *= 1000
+                elif "m" in text_lower:
+                    count *= 1000000
+                self.current_skill["installs"] = int(count)
+            except:
+                pass
+
+        # Capture name (usually in h3/h4 or first significant text)
+        if self.current_tag in ["h3", "h4"] or "name" not in self.current_skill:
+            if len(text) > 2 and len(text) < 100 and not text.startswith("http"):
+                if "install" not in text_lower and not _NUM_RE.match(text):
+                    self.current_skill["name"] = text
+
+
+class _LxmlTarget:
+    """Drive a SkillsShParser from lxml parser-target callbacks.
+
+    lxml may deliver one text node in several pieces, so text is buffered
+    until the next tag event to match HTMLParser's handle_data semantics.
+    """
+
+    def __init__(self, parser: SkillsShParser):
+        self.parser = parser
+        self._text = []
+
+    def _flush(self):
+        if self._text:
+            self.parser.handle_data("".join(self._text))
+            self._text = []
+
+    def start(self, tag, attrib):
+        self._flush()
+        self.parser.handle_starttag(tag, attrib.items())
+
+    def end(self, tag):
+        self._flush()
+        self.parser.handle_endtag(tag)
+
+    def data(self, data):
+        self._text.append(data)
+
+    def close(self):
+        self._flush()
+        return self.parser.skills
+
+
+@contextmanager
+def _open_stream(url: str) -> Iterator[Iterator[bytes]]:
+    """Open ``url`` and yield its body as an iterator of byte chunks."""
+    if _SESSION is not None:
+        with _SESSION.get(url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            yield response.iter_content(_CHUNK_SIZE)
+        return
+
+    req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+    with urllib.request.urlopen(req, timeout=15) as response:
+        yield iter(lambda: response.read(_CHUNK_SIZE), b"")
 
+
+def _is_fresh(path: Path, ttl: float) -> bool:
+    """Return True if ``path`` exists and was modified less than ``ttl`` seconds ago."""
     try:
-        req = urllib.request.Request(url, headers={
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) skills-updater/1.0"
-        })
-        with urllib.request.urlopen(req, timeout=15) as response:
-            html = response.read().decode("utf-8")
-    except Exception as e:
-        print(f"Warning: Could not fetch skills.sh: {e}", file=sys.stderr)
-        return get_hardcoded_skills_sh_top(limit)
+        return time.time() - path.stat().st_mtime < ttl
+    except OSError:
+        return False
 
-    # Try to parse the page
-    parser = SkillsShParser()
+
+@contextmanager
+def _cached_stream(chunks: Iterator[bytes], cache_file: Path) -> Iterator[Iterator[bytes]]:
+    """Yield ``chunks`` while copying them into ``cache_file``.
+
+    Chunks left unread when the parser stops early are drained into the file
+    on exit, so the cache always holds the complete page. If the cache file
+    cannot be created the stream is passed through unchanged.
+    """
+    tmp_file = cache_file.with_suffix(".tmp")
     try:
-        parser.feed(html)
-    except:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp_file, "wb")
+    except OSError:
+        yield chunks
+        return
+
+    def tee():
+        for chunk in chunks:
+            f.write(chunk)
+            yield chunk
+
+    teed = tee()
+
+    def drain() -> bool:
+        """Store the rest of the page and report whether it arrived intact."""
+        try:
+            for _ in teed:
+                pass
+        except OSError:
+            return False
+        return True
+
+    complete = False
+    try:
+        with f:
+            try:
+                yield teed
+            except _EnoughSkills:
+                complete = drain()
+                raise
+            complete = drain()
+    finally:
+        try:
+            if complete:
+                os.replace(tmp_file, cache_file)
+            else:
+                tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _feed_response(chunks: Iterator[bytes], parser: SkillsShParser) -> None:
+    """Stream response body chunks into the parser."""
+    if lxml_etree is not None:
+        html_parser = lxml_etree.HTMLParser(target=_LxmlTarget(parser), encoding="utf-8")
+        for chunk in chunks:
+            html_parser.feed(chunk)
+        html_parser.close()
+        return
+
+    # HTMLParser flushes text at the end of each feed, so only feed up to the
+    # last tag opening to keep text nodes whole across chunk boundaries.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        cut = pending.rfind("<")
+        if cut > 0:
+            parser.feed(pending[:cut])
+            pending = pending[cut:]
+    parser.feed(pending + decoder.decode(b"", final=True))
+    parser.close()
+
+
+def fetch_skills_sh(limit: int = 20, use_cache: bool = True) -> List[RecommendedSkill]:
+    """Fetch trending skills from skills.sh.
+
+    The downloaded page is cached on disk for SKILLS_SH_CACHE_TTL seconds.
+    """
+    url = "https://skills.sh/"
+
+    parser = SkillsShParser(limit=limit)
+    try:
+        if use_cache and _is_fresh(SKILLS_SH_CACHE_FILE, SKILLS_SH_CACHE_TTL):
+            with open(SKILLS_SH_CACHE_FILE, "rb") as f:
+                _feed_response(iter(lambda: f.read(_CHUNK_SIZE), b""), parser)
+        else:
+            with _open_stream(url) as chunks:
+                if use_cache:
+                    with _cached_stream(chunks, SKILLS_SH_CACHE_FILE) as cached_chunks:
+                        _feed_response(cached_chunks, parser)
+                else:
+                    _feed_response(chunks, parser)
+    except _EnoughSkills:
         pass
+    except _FETCH_ERRORS as e:
+        # Keep whatever was parsed before the failure
+        print(f"Warning: Could not fetch skills.sh: {e}", file=sys.stderr)
 
     skills = []
 
@@ -151,7 +417,7 @@ def fetch_skills_sh(limit: int = 20) -> List[RecommendedSkill]:
                     install_command=f"npx skills add {repo}" if repo else f"npx skills add <owner>/{item['name']}"
                 ))
     else:
-        # Fallback to hardcoded top skills if parsing fails
+        # Fallback to hardcoded top skills if fetching or parsing fails
         skills = get_hardcoded_skills_sh_top(limit)
 
     return skills
@@ -197,104 +463,147 @@ def get_hardcoded_skills_sh_top(limit: int = 20) -> List[RecommendedSkill]:
     return skills
 
 
-def get_installed_categories() -> Set[str]:
-    """Get categories of installed skills for personalized recommendations."""
-    # 1. Check standard Claude plugins
+def _classify_skill_name(name: str, categories: Set[str]) -> None:
+    """Add the categories whose keywords occur in ``name`` to ``categories``."""
+    name_lower = name.lower()
+    if _CATEGORY_AUTOMATON is not None:
+        for _, matched in _CATEGORY_AUTOMATON.iter(name_lower):
+            categories.update(matched)
+    else:
+        for category, pattern in _CATEGORY_PATTERNS.items():
+            if pattern.search(name_lower):
+                categories.add(category)
+
+
+def _mtime_ns(path: Optional[Path]) -> int:
+    """Return the mtime of ``path`` in nanoseconds, or 0 if it is missing."""
+    if path is None:
+        return 0
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_category_cache(signature: list) -> Optional[Set[str]]:
+    """Return cached categories if they were computed for ``signature``."""
+    try:
+        cached = _json_load(CATEGORY_CACHE_FILE)
+    except (OSError, ValueError):
+        return None
+    if cached.get("sig") != signature:
+        return None
+    return set(cached.get("categories", []))
+
+
+def _save_category_cache(signature: list, categories: Set[str]) -> None:
+    """Atomically write the category cache; failures are not fatal."""
+    tmp_file = CATEGORY_CACHE_FILE.with_suffix(".tmp")
+    try:
+        CATEGORY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump({"sig": signature, "categories": sorted(categories)}, f)
+        os.replace(tmp_file, CATEGORY_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def get_installed_categories(use_cache: bool = True) -> Set[str]:
+    """Get categories of installed skills for personalized recommendations.
+
+    The result is cached on disk and reused while the plugins file and the
+    local .agent/skills directory are unchanged.
+    """
     plugins_file = Path.home() / ".claude" / "plugins" / "installed_plugins.json"
-    skill_names = set()
 
+    # Locate local .agent/skills (Antigravity)
+    # Search the working directory and up to six of its parents
+    base = Path.cwd().resolve()
+    agent_skills_dir = next(
+        (p / ".agent" / "skills" for p in (base, *base.parents[:6])
+         if os.path.isdir(p / ".agent" / "skills")),
+        None,
+    )
+
+    signature = [
+        _mtime_ns(plugins_file),
+        str(agent_skills_dir) if agent_skills_dir else None,
+        _mtime_ns(agent_skills_dir),
+    ]
+    if use_cache:
+        cached = _load_category_cache(signature)
+        if cached is not None:
+            return cached
+
+    categories = set()
+
+    # 1. Check standard Claude plugins
     if plugins_file.exists():
         try:
-            with open(plugins_file) as f:
-                data = json.load(f)
-                for key in data.get("plugins", {}).keys():
-                    skill_names.add(key.split("@")[0])
+            data = _json_load(plugins_file)
+            for key in data.get("plugins", {}).keys():
+                _classify_skill_name(key.split("@")[0], categories)
         except:
             pass
 
-    # 2. Check local .agent/skills (Antigravity)
-    # Search in parents
-    curr = Path.cwd().resolve()
-    agent_skills_dir = None
-    for _ in range(7):
-        if (curr / ".agent").is_dir():
-            candidate = curr / ".agent" / "skills"
-            if candidate.exists():
-                agent_skills_dir = candidate
-                break
-        if curr.parent == curr:
-            break
-        curr = curr.parent
-
+    # 2. Check skills found in local .agent/skills
     if agent_skills_dir:
-        for skill_path in agent_skills_dir.iterdir():
-            if skill_path.is_dir() and (skill_path / "SKILL.md").exists():
-                skill_names.add(skill_path.name)
+        # DirEntry.is_dir() is answered from readdir, leaving one stat per skill
+        with os.scandir(agent_skills_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                    _classify_skill_name(entry.name, categories)
 
-    # Extract keywords from combined skill names
-    categories = set()
-    for name in skill_names:
-        name_lower = name.lower()
-        # Common category keywords
-        if any(kw in name_lower for kw in ["github", "git", "code", "bash", "command", "skill"]):
-            categories.add("developer-tools")
-        if any(kw in name_lower for kw in ["doc", "pdf", "ppt", "excel", "word", "paper", "citation", "write"]):
-            categories.add("document-tools")
-        if any(kw in name_lower for kw in ["test", "qa", "playwright", "check"]):
-            categories.add("testing")
-        if any(kw in name_lower for kw in ["front", "ui", "design", "css", "web", "html", "visual"]):
-            categories.add("frontend")
-        if any(kw in name_lower for kw in ["security", "safe"]):
-            categories.add("security")
-        if any(kw in name_lower for kw in ["learn", "study", "explain", "academic"]):
-            categories.add("learning")
+    if use_cache:
+        _save_category_cache(signature, categories)
 
     return categories
 
 
+_RECOMMENDATIONS_BY_CATEGORY: Mapping[str, Tuple[Tuple[str, str, str], ...]] = MappingProxyType({
+    "developer-tools": (
+        ("github-ops", "daymade/claude-code-skills", "GitHub CLI operations for PRs, issues, and workflows"),
+        ("commit-commands", "anthropics/claude-plugins-official", "Smart git commit message generation"),
+    ),
+    "testing": (
+        ("playwright-skill", "lackeyjb/playwright-skill", "Browser automation and web testing"),
+        ("qa-expert", "daymade/claude-code-skills", "Comprehensive QA testing infrastructure"),
+    ),
+    "frontend": (
+        ("frontend-design", "anthropics/skills", "Production-grade frontend interfaces"),
+        ("canvas-design", "anthropics/skills", "Visual design with canvas-based components"),
+    ),
+    "document-tools": (
+        ("document-skills", "anthropics/skills", "Excel, Word, PowerPoint, PDF processing"),
+        ("markdown-tools", "daymade/claude-code-skills", "Document to markdown conversion"),
+    ),
+    "security": (
+        ("security-guidance", "anthropics/claude-plugins-official", "Security best practices guidance"),
+        ("repomix-safe-mixer", "daymade/claude-code-skills", "Secure code packaging"),
+    ),
+    "learning": (
+        ("learning-output-style", "anthropics/claude-plugins-official", "Educational explanations style"),
+        ("explanatory-output-style", "anthropics/claude-plugins-official", "Detailed explanatory output"),
+    ),
+})
+
+# Default recommendations if no categories matched
+_DEFAULT_RECOMMENDATIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("skill-creator", "daymade/claude-code-skills", "Create effective Claude Code skills"),
+    ("superpowers", "obra/superpowers-marketplace", "Extended Claude capabilities"),
+    ("planning-with-files", "OthmanAdi/planning-with-files", "File-based planning workflow"),
+)
+
+
 def get_personalized_recommendations(installed_categories: Set[str], limit: int = 5) -> List[RecommendedSkill]:
     """Get personalized skill recommendations based on installed categories."""
-    recommendations_by_category = {
-        "developer-tools": [
-            ("github-ops", "daymade/claude-code-skills", "GitHub CLI operations for PRs, issues, and workflows"),
-            ("commit-commands", "anthropics/claude-plugins-official", "Smart git commit message generation"),
-        ],
-        "testing": [
-            ("playwright-skill", "lackeyjb/playwright-skill", "Browser automation and web testing"),
-            ("qa-expert", "daymade/claude-code-skills", "Comprehensive QA testing infrastructure"),
-        ],
-        "frontend": [
-            ("frontend-design", "anthropics/skills", "Production-grade frontend interfaces"),
-            ("canvas-design", "anthropics/skills", "Visual design with canvas-based components"),
-        ],
-        "document-tools": [
-            ("document-skills", "anthropics/skills", "Excel, Word, PowerPoint, PDF processing"),
-            ("markdown-tools", "daymade/claude-code-skills", "Document to markdown conversion"),
-        ],
-        "security": [
-            ("security-guidance", "anthropics/claude-plugins-official", "Security best practices guidance"),
-            ("repomix-safe-mixer", "daymade/claude-code-skills", "Secure code packaging"),
-        ],
-        "learning": [
-            ("learning-output-style", "anthropics/claude-plugins-official", "Educational explanations style"),
-            ("explanatory-output-style", "anthropics/claude-plugins-official", "Detailed explanatory output"),
-        ],
-    }
-
-    # Default recommendations if no categories matched
-    default_recommendations = [
-        ("skill-creator", "daymade/claude-code-skills", "Create effective Claude Code skills"),
-        ("superpowers", "obra/superpowers-marketplace", "Extended Claude capabilities"),
-        ("planning-with-files", "OthmanAdi/planning-with-files", "File-based planning workflow"),
-    ]
-
     recommendations = []
     seen_names = set()
 
     # Add category-specific recommendations
     for category in installed_categories:
-        if category in recommendations_by_category:
-            for name, repo, desc in recommendations_by_category[category]:
+        if category in _RECOMMENDATIONS_BY_CATEGORY:
+            for name, repo, desc in _RECOMMENDATIONS_BY_CATEGORY[category]:
                 if name not in seen_names:
                     recommendations.append(RecommendedSkill(
                         name=name,
@@ -308,7 +617,7 @@ def get_personalized_recommendations(installed_categories: Set[str], limit: int
                     seen_names.add(name)
 
     # Fill with defaults if needed
-    for name, repo, desc in default_recommendations:
+    for name, repo, desc in _DEFAULT_RECOMMENDATIONS:
         if len(recommendations) >= limit:
             break
         if name not in seen_names:
@@ -330,78 +639,100 @@ def format_installs(count: Optional[int]) -> str:
     if count is None:
         return ""
 
+    # Round to one decimal place with integer arithmetic (half rounds up)
     if count >= 1000000:
-        return f"{count/1000000:.1f}M"
+        whole, tenth = divmod((count + 50000) // 100000, 10)
+        return f"{whole}.{tenth}M"
     elif count >= 1000:
-        return f"{count/1000:.1f}K"
+        whole, tenth = divmod((count + 50) // 100, 10)
+        return f"{whole}.{tenth}K"
     else:
         return str(count)
 
 
+def _write_json_section(key: str, entries: Iterable[dict]) -> None:
+    """Write one top-level ``"key": [...]`` member, one entry at a time.
+
+    The layout matches ``json.dumps(..., indent=2)`` of the enclosing object.
+    """
+    write = sys.stdout.write
+    write(f"  {json.dumps(key)}: [")
+    empty = True
+    for entry in entries:
+        write("\n    " if empty else ",\n    ")
+        write(_json_dumps(entry).replace("\n", "\n    "))
+        empty = False
+    write("]" if empty else "\n  ]")
+
+
 def print_recommendations(trending: List[RecommendedSkill],
                           personalized: List[RecommendedSkill],
                           as_json: bool = False):
     """Print skill recommendations."""
     if as_json:
-        output = {
-            "trending": [],
-            "personalized": []
-        }
-
-        for skill in trending:
-            output["trending"].append({
+        sys.stdout.write("{\n")
+        _write_json_section("trending", (
+            {
                 "name": skill.name,
                 "installs": skill.installs,
                 "source": skill.source,
                 "repo": skill.repo,
                 "install_command": skill.install_command
-            })
-
-        for skill in personalized:
-            output["personalized"].append({
+            }
+            for skill in trending
+        ))
+        sys.stdout.write(",\n")
+        _write_json_section("personalized", (
+            {
                 "name": skill.name,
                 "description": skill.description,
                 "category": skill.category,
                 "repo": skill.repo,
                 "install_command": skill.install_command
-            })
-
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+            }
+            for skill in personalized
+        ))
+        sys.stdout.write("\n}\n")
         return
 
-    print(f"🔥 {t('trending_skills')}")
-    print("━" * 18)
-    print()
+    # Collect every line and write once instead of one print per line
+    lines = []
+    lines.append(f"🔥 {t('trending_skills')}")
+    lines.append(_BORDER_18)
+    lines.append("")
 
     if trending:
-        print(f"{t('from_skills_sh')} ({t('top_n', n=len(trending))}):")
+        installs_label = t('installs')
+        lines.append(f"{t('from_skills_sh')} ({t('top_n', n=len(trending))}):")
         for i, skill in enumerate(trending, 1):
             installs_str = format_installs(skill.installs)
             if installs_str:
-                installs_str = f" ({installs_str} {t('installs')})"
-            print(f"{i:2}. {skill.name}{installs_str}")
-            print(f"    {skill.install_command}")
-            print()
+                installs_str = f" ({installs_str} {installs_label})"
+            lines.append(f"{i:2}. {skill.name}{installs_str}")
+            lines.append(f"    {skill.install_command}")
+            lines.append("")
     else:
-        print(t('could_not_fetch'))
-        print()
+        lines.append(t('could_not_fetch'))
+        lines.append("")
 
     if personalized:
-        print(f"💡 {t('personalized_recommendations')}")
-        print("━" * 31)
-        print()
-        print(t('based_on_installed'))
+        lines.append(f"💡 {t('personalized_recommendations')}")
+        lines.append(_BORDER_31)
+        lines.append("")
+        lines.append(t('based_on_installed'))
         for skill in personalized:
             category_str = f" [{skill.category}]" if skill.category else ""
-            print(f"• {skill.name}{category_str}")
+            lines.append(f"• {skill.name}{category_str}")
             if skill.description:
-                print(f"  {skill.description}")
-            print(f"  → {skill.install_command}")
-            print()
+                lines.append(f"  {skill.description}")
+            lines.append(f"  → {skill.install_command}")
+            lines.append("")
 
-    print("━" * 40)
-    print(t('install_hint'))
-    print(t('install_hint_npx'))
+    lines.append(_BORDER_40)
+    lines.append(t('install_hint'))
+    lines.append(t('install_hint_npx'))
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 def main():
@@ -414,6 +745,8 @@ def main():
                         help="Output as JSON")
     parser.add_argument("--lang", choices=["en", "zh"],
                         help="Language for output (auto-detected if not specified)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached results, refetch skills.sh and rescan installed skills")
     args = parser.parse_args()
 
     # Initialize i18n
@@ -428,10 +761,10 @@ def main():
 
     # Fetch trending skills
     if args.source in ["skills.sh", "all"]:
-        trending = fetch_skills_sh(limit=args.limit)
+        trending = fetch_skills_sh(limit=args.limit, use_cache=not args.no_cache)
 
     # Get personalized recommendations
-    installed_categories = get_installed_categories()
+    installed_categories = get_installed_categories(use_cache=not args.no_cache)
     if installed_categories:
         personalized = get_personalized_recommendations(installed_categories)
     else:
@@ -13,14 +13,35 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import time
+import sqlite3
+import asyncio
 import logging
+import aiohttp
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union
+from urllib.parse import urlencode
+
+try:
+    from lxml import etree
+    _PARSER_OPTIONS = {"recover": True, "huge_tree": False}
+except ImportError:  # Fall back to the stdlib parser
+    from xml.etree import ElementTree as etree
+    _PARSER_OPTIONS = {}
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
 
 # Add project root to path
 # Add project root to path
@@ -43,16 +64,323 @@ logger = logging.getLogger(__name__)
 # Europe PMC API Client
 # ============================================================================
 
+_USER_AGENT = "PennPRS-Agent/1.0 (Research; mailto:your-email@upenn.edu)"
+
+# Shared across clients so every Europe PMC request reuses pooled connections
+_PMC_SESSION = requests.Session()
+_PMC_SESSION.headers.update({"User-Agent": _USER_AGENT})
+_PMC_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+))
+
+# Concurrent full-text downloads (Europe PMC tolerates a handful in flight)
+MAX_CONCURRENT_FETCHES = 5
+MAX_REQUESTS_PER_SECOND = 5
+
+# Full-text downloads are parsed as they stream in and cut off past this size
+MAX_FULL_TEXT_BYTES = 5_000_000
+_CHUNK_SIZE = 65536
+
+# Papers sent to the (API-bound) extractor at once
+MAX_EXTRACTION_WORKERS = 4
+
+_WS_RE = re.compile(r"\s+")
+
+# Regex fallback for unparseable XML: only a prefix of the document is
+# scanned, oversampled since stripped markup shrinks it
+FALLBACK_TEXT_CHARS = 50000
+_FALLBACK_SCAN_BYTES = 200_000
+_TAG_BYTES_RE = re.compile(rb"<[^>]+>")
+_WS_BYTES_RE = re.compile(rb"\s+")
+
+# Europe PMC responses are cached on disk so re-runs skip the network
+HTTP_CACHE_FILE = project_root / "data" / "cache" / "europepmc_http.sqlite"
+HTTP_CACHE_TTL = 30 * 24 * 3600  # 30 days
+
+
+class HttpCache:
+    """SQLite-backed cache of successful GET response bodies, keyed by URL and params.
+    
+    Bodies are stored as given: str as TEXT, bytes as BLOB.
+    """
+    
+    def __init__(self, path: Path = HTTP_CACHE_FILE, ttl: float = HTTP_CACHE_TTL):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        row = self.conn.execute(
+            "SELECT body FROM responses WHERE key = ? AND fetched_at > ?",
+            (key, time.time() - self.ttl)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, body: Union[str, bytes]):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, fetched_at) VALUES (?, ?, ?)",
+                (key, body, time.time())
+            )
+
+
+class AsyncRateLimiter:
+    """
+    Spaces request starts at least 1/rate seconds apart.
+    
+    Unlike a fixed sleep after every request, time already spent waiting on a
+    slow response counts towards the interval, so callers only wait when they
+    are actually ahead of the rate.
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_time = 0.0
+    
+    async def acquire(self):
+        now = time.monotonic()
+        slot = max(now, self._next_time)
+        self._next_time = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_PMC_RATE_LIMITER = AsyncRateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+class _PMCTextTarget:
+    """
+    XML parser target collecting the plain text of a PMC article.
+    
+    Keeps the first article title, the first abstract and the section titles
+    and paragraphs of the first <body>; close() returns them joined with
+    normalized whitespace. Text outside those elements is never buffered, so
+    the article can be fed to the parser chunk by chunk.
+    """
+    
+    def __init__(self):
+        self.title_text = None
+        self.abstract_text = None
+        self.body_parts = []
+        
+        self._tags = []  # Open element tags
+        self._in_body = self._body_seen = False
+        self._sec_depth = self._p_depth = 0  # Open <sec>/<p> elements inside the body
+        
+        # Element whose text is being collected, as (tag, nesting depth)
+        self._capture = None
+        self._pieces = []  # Text nodes of the captured element
+        self._buffer = []  # Current text node, possibly split across data() calls
+        self._head = None  # Text before the captured element's first child
+    
+    def _flush(self):
+        if self._buffer:
+            self._pieces.append("".join(self._buffer))
+            self._buffer = []
+    
+    # Start handlers get the parent tag and return whether to capture the element;
+    # tags without a handler (the vast majority) cost a single dict lookup
+    
+    def _start_article_title(self, parent):
+        return self.title_text is None
+    
+    def _start_abstract(self, parent):
+        return self.abstract_text is None
+    
+    def _start_body(self, parent):
+        self._in_body = not self._body_seen
+        self._body_seen = True
+        return False
+    
+    def _start_sec(self, parent):
+        if self._in_body:
+            self._sec_depth += 1
+        return False
+    
+    def _start_p(self, parent):
+        if not (self._in_body and self._sec_depth):
+            return False
+        self._p_depth += 1
+        return self._p_depth == 1
+    
+    def _start_title(self, parent):
+        return self._in_body and parent == "sec"
+    
+    def _end_body(self):
+        self._in_body = False
+    
+    def _end_sec(self):
+        if self._in_body:
+            self._sec_depth -= 1
+    
+    def _end_p(self):
+        if self._in_body and self._sec_depth:
+            self._p_depth -= 1
+    
+    _START_HANDLERS = {
+        "article-title": _start_article_title,
+        "abstract": _start_abstract,
+        "body": _start_body,
+        "sec": _start_sec,
+        "p": _start_p,
+        "title": _start_title,
+    }
+    _END_HANDLERS = {"body": _end_body, "sec": _end_sec, "p": _end_p}
+    
+    def start(self, tag, attrib):
+        tags = self._tags
+        
+        # Inside a captured element only text boundaries matter
+        if self._capture is not None:
+            tags.append(tag)
+            self._flush()
+            if self._head is None:
+                self._head = self._pieces[0] if self._pieces else ""
+            return
+        
+        handler = self._START_HANDLERS.get(tag)
+        if handler is not None and handler(self, tags[-1] if tags else None):
+            self._capture = (tag, len(tags) + 1)
+            self._pieces = []
+            self._head = None
+        tags.append(tag)
+    
+    def data(self, data):
+        if self._capture is not None:
+            self._buffer.append(data)
+    
+    def end(self, tag):
+        tags = self._tags
+        
+        if self._capture is not None:
+            self._flush()
+            if self._capture != (tag, len(tags)):
+                tags.pop()
+                return
+            
+            self._capture = None
+            if tag == "article-title":
+                self.title_text = "".join(self._pieces)
+            elif tag == "abstract":
+                self.abstract_text = " ".join(self._pieces)
+            elif tag == "title":
+                head = self._head if self._head is not None else "".join(self._pieces)
+                self.body_parts.append(f"\n## {head}\n")
+            else:
+                self.body_parts.append(" ".join(self._pieces) + "\n")
+        
+        handler = self._END_HANDLERS.get(tag)
+        if handler is not None:
+            handler(self)
+        tags.pop()
+    
+    def close(self) -> str:
+        text_parts = []
+        if self.title_text is not None:
+            text_parts.append(f"TITLE: {self.title_text}\n")
+        if self.abstract_text is not None:
+            text_parts.append(f"ABSTRACT: {self.abstract_text}\n")
+        text_parts.extend(self.body_parts)
+        
+        # Join and normalize whitespace
+        return _WS_RE.sub(" ", "\n".join(text_parts)).strip()
+
+
+def _pmc_text_parser():
+    """Return an XML parser whose close() yields the article's plain text."""
+    return etree.XMLParser(target=_PMCTextTarget(), **_PARSER_OPTIONS)
+
+
+# _search_oa_papers results by (query, max_results, has_fulltext)
+_OA_SEARCH_MEMO: Dict[Tuple[str, int, bool], Tuple[Dict[str, Any], ...]] = {}
+
+
+def _search_oa_papers(
+    query: str,
+    max_results: int,
+    has_fulltext: bool,
+    cache: Optional[HttpCache] = None,
+    refresh: bool = False
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Search Europe PMC for Open Access papers, memoized for the process.
+    
+    The memo is keyed on the search alone; refresh bypasses it (and the HTTP
+    cache) and replaces the memoized results with the fresh ones. Errors
+    propagate, so failed searches are not memoized. The returned result
+    dicts are shared between callers and must not be modified.
+    """
+    memo_key = (query, max_results, has_fulltext)
+    if not refresh and memo_key in _OA_SEARCH_MEMO:
+        return _OA_SEARCH_MEMO[memo_key]
+    
+    # Add Open Access filter
+    full_query = f"({query}) AND (OPEN_ACCESS:y)"
+    if has_fulltext:
+        full_query += " AND (HAS_FT:y)"
+    
+    params = {
+        "query": full_query,
+        "resultType": "core",
+        "pageSize": max_results,
+        "format": "json"
+    }
+    
+    url = f"{EuropePMCClient.BASE_URL}/search"
+    cache_key = HttpCache.make_key(url, params)
+    
+    body = cache.get(cache_key) if cache is not None and not refresh else None
+    if body is None:
+        response = _PMC_SESSION.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        body = response.text
+        if cache is not None:
+            cache.set(cache_key, body)
+    data = orjson.loads(body) if orjson is not None else json.loads(body)
+    
+    results = tuple(data.get("resultList", {}).get("result", []))
+    _OA_SEARCH_MEMO[memo_key] = results
+    return results
+
+
 class EuropePMCClient:
     """Client for Europe PMC API to fetch Open Access full-text articles."""
     
     BASE_URL = "https://www.ebi.ac.uk/europepmc/webservices/rest"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "PennPRS-Agent/1.0 (Research; mailto:your-email@upenn.edu)"
-        })
+    def __init__(self, cache: Optional[HttpCache] = None, refresh: bool = False):
+        """
+        Args:
+            cache: Response cache to read from and write to (None disables caching)
+            refresh: Ignore cached responses but still store the fresh ones
+        """
+        self.session = _PMC_SESSION
+        self.cache = cache
+        self.refresh = refresh
+    
+    def _cache_get(self, key: str) -> Optional[Union[str, bytes]]:
+        if self.cache is None or self.refresh:
+            return None
+        return self.cache.get(key)
+    
+    def _cache_set(self, key: str, body: Union[str, bytes]):
+        if self.cache is not None:
+            self.cache.set(key, body)
     
     def search_oa_papers(
         self, 
@@ -63,6 +391,9 @@ class EuropePMCClient:
         """
         Search for Open Access papers with full text available.
         
+        Repeated searches in the same process are answered from memory,
+        see _search_oa_papers.
+        
         Args:
             query: Search query string
             max_results: Maximum number of results to return
@@ -71,26 +402,8 @@ class EuropePMCClient:
         Returns:
             List of paper metadata dicts
         """
-        # Add Open Access filter
-        full_query = f"({query}) AND (OPEN_ACCESS:y)"
-        if has_fulltext:
-            full_query += " AND (HAS_FT:y)"
-        
-        params = {
-            "query": full_query,
-            "resultType": "core",
-            "pageSize": max_results,
-            "format": "json"
-        }
-        
-        url = f"{self.BASE_URL}/search"
-        
         try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            results = data.get("resultList", {}).get("result", [])
+            results = list(_search_oa_papers(query, max_results, has_fulltext, self.cache, self.refresh))
             logger.info(f"Found {len(results)} Open Access papers for query: {query}")
             return results
             
@@ -98,15 +411,18 @@ class EuropePMCClient:
             logger.error(f"Search error: {e}")
             return []
     
-    def get_full_text_xml(self, pmcid: str) -> Optional[str]:
+    def get_full_text_xml(self, pmcid: str) -> Optional[bytes]:
         """
         Fetch full-text XML for a PMC article.
         
+        The raw response bytes are returned undecoded so the XML parser can
+        honour the document's own encoding declaration.
+        
         Args:
             pmcid: PMC ID (e.g., "PMC1234567")
             
         Returns:
-            Full-text XML string or None if not available
+            Full-text XML bytes or None if not available
         """
         # Ensure PMC prefix
         if not pmcid.startswith("PMC"):
@@ -114,11 +430,17 @@ class EuropePMCClient:
         
         url = f"{self.BASE_URL}/{pmcid}/fullTextXML"
         
+        # Entries cached as decoded text by earlier versions are refetched
+        cached = self._cache_get(url)
+        if isinstance(cached, bytes):
+            return cached
+        
         try:
             response = self.session.get(url, timeout=60)
             
             if response.status_code == 200:
-                return response.text
+                self._cache_set(url, response.content)
+                return response.content
             else:
                 logger.warning(f"Full text not available for {pmcid}: HTTP {response.status_code}")
                 return None
@@ -127,93 +449,133 @@ class EuropePMCClient:
             logger.error(f"Error fetching full text for {pmcid}: {e}")
             return None
     
-    def extract_text_from_xml(self, xml_content: str) -> str:
+    async def get_full_text_async(
+        self,
+        pmcid: str,
+        session: aiohttp.ClientSession,
+        sem: asyncio.Semaphore
+    ) -> Optional[str]:
         """
-        Extract plain text content from PMC XML.
+        Download a PMC article on a shared aiohttp session and extract its text.
+        
+        The XML is fed to the parser chunk by chunk as it arrives, so the raw
+        document is never held in memory; downloads larger than
+        MAX_FULL_TEXT_BYTES are cut off and the text read so far is returned.
         
         Args:
-            xml_content: Full PMC XML string
+            pmcid: PMC ID (e.g., "PMC1234567")
+            session: Open aiohttp session to issue the request on
+            sem: Semaphore bounding the number of requests in flight
             
         Returns:
-            Plain text extracted from the article
+            Plain text extracted from the article or None if not available
         """
-        import re
-        from xml.etree import ElementTree as ET
+        if not pmcid.startswith("PMC"):
+            pmcid = f"PMC{pmcid}"
         
-        try:
-            # Parse XML
-            root = ET.fromstring(xml_content)
-            
-            # Extract text from body sections
-            text_parts = []
-            
-            # Get article title
-            title_elem = root.find(".//article-title")
-            if title_elem is not None:
-                title_text = "".join(title_elem.itertext())
-                text_parts.append(f"TITLE: {title_text}\n")
-            
-            # Get abstract
-            abstract = root.find(".//abstract")
-            if abstract is not None:
-                abstract_text = " ".join(abstract.itertext())
-                text_parts.append(f"ABSTRACT: {abstract_text}\n")
-            
-            # Get body text
-            body = root.find(".//body")
-            if body is not None:
-                for section in body.findall(".//sec"):
-                    # Get section title
-                    sec_title = section.find("title")
-                    if sec_title is not None:
-                        text_parts.append(f"\n## {sec_title.text}\n")
+        url = f"{self.BASE_URL}/{pmcid}/fullTextXML"
+        cache_key = f"{url}#text"
+        
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        async with sem:
+            await _PMC_RATE_LIMITER.acquire()
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
+                    if response.status != 200:
+                        logger.warning(f"Full text not available for {pmcid}: HTTP {response.status}")
+                        return None
                     
-                    # Get paragraphs
-                    for p in section.findall(".//p"):
-                        p_text = " ".join(p.itertext())
-                        text_parts.append(p_text + "\n")
-            
-            # Join and clean
-            full_text = "\n".join(text_parts)
-            full_text = re.sub(r'\s+', ' ', full_text)  # Normalize whitespace
-            full_text = re.sub(r'\n\s*\n', '\n\n', full_text)  # Normalize paragraphs
+                    parser = _pmc_text_parser()
+                    total = 0
+                    truncated = False
+                    async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                        total += len(chunk)
+                        if total > MAX_FULL_TEXT_BYTES:
+                            logger.warning(f"Full text for {pmcid} exceeds {MAX_FULL_TEXT_BYTES:,} bytes - Truncating")
+                            truncated = True
+                            break
+                        parser.feed(chunk)
+                    try:
+                        full_text = parser.close()
+                    except etree.ParseError:
+                        if not truncated:
+                            raise
+                        # The stdlib parser (no recover mode) rejects the
+                        # unfinished document; keep the text collected so far
+                        full_text = parser.target.close()
+                
+                self._cache_set(cache_key, full_text)
+                return full_text
+                    
+            except Exception as e:
+                logger.error(f"Error fetching full text for {pmcid}: {e}")
+                return None
+    
+    def extract_text_from_xml(self, xml_content: bytes) -> str:
+        """
+        Extract plain text content from PMC XML.
+        
+        No tree is built: the parser streams events into _PMCTextTarget, which
+        keeps only the text it needs. Paragraphs are emitted once each, in
+        document order.
+        
+        Args:
+            xml_content: Full PMC XML document, as returned by get_full_text_xml
             
-            return full_text.strip()
+        Returns:
+            Plain text extracted from the article
+        """
+        try:
+            parser = _pmc_text_parser()
+            parser.feed(xml_content)
+            return parser.close()
             
-        except ET.ParseError as e:
+        except etree.ParseError as e:
             logger.error(f"XML parsing error: {e}")
             # Fallback: extract text via regex
-            text = re.sub(r'<[^>]+>', ' ', xml_content)
-            text = re.sub(r'\s+', ' ', text)
-            return text[:50000]  # Limit length
+            raw = xml_content[:_FALLBACK_SCAN_BYTES]
+            text = _WS_BYTES_RE.sub(b" ", _TAG_BYTES_RE.sub(b" ", raw))
+            return text.decode("utf-8", "ignore")[:FALLBACK_TEXT_CHARS]  # Limit length
 
 
-def fetch_alzheimer_heritability_papers(n_papers: int = 5) -> List[Dict]:
+async def fetch_alzheimer_heritability_papers(n_papers: int = 5, refresh: bool = False) -> List[Dict]:
     """
     Fetch Open Access papers about Alzheimer's and heritability from Europe PMC.
+    
+    Full-text downloads run concurrently, at most MAX_CONCURRENT_FETCHES at a time
+    and MAX_REQUESTS_PER_SECOND overall. Responses are served from the on-disk
+    HTTP cache unless refresh is set.
     """
-    client = EuropePMCClient()
+    client = EuropePMCClient(cache=HttpCache(), refresh=refresh)
     
     # Search query for heritability + Alzheimer's
     query = '(heritability OR "SNP heritability" OR "h2" OR "LDSC") AND (Alzheimer OR "Alzheimer\'s disease" OR AD)'
     
     papers = client.search_oa_papers(query, max_results=n_papers * 2)  # Get extra in case some fail
+    papers = [paper for paper in papers if paper.get("pmcid")]
+    
+    logger.info(f"Fetching full text for {len(papers)} papers...")
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    connector = aiohttp.TCPConnector(limit=10, limit_per_host=MAX_CONCURRENT_FETCHES)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": _USER_AGENT}
+    ) as session:
+        full_texts = await asyncio.gather(*[
+            client.get_full_text_async(paper["pmcid"], session, sem)
+            for paper in papers
+        ])
     
     result = []
-    for paper in papers:
+    for paper, full_text in zip(papers, full_texts):
         if len(result) >= n_papers:
             break
-            
-        pmcid = paper.get("pmcid")
-        if not pmcid:
-            continue
         
-        logger.info(f"Fetching full text for {pmcid}...")
-        xml_content = client.get_full_text_xml(pmcid)
-        
-        if xml_content:
-            full_text = client.extract_text_from_xml(xml_content)
-            
+        pmcid = paper["pmcid"]
+        if full_text is not None:
             # Filter out short papers (e.g. posters/abstracts only)
             if len(full_text) > 5000:
                 result.append({
@@ -227,18 +589,45 @@ def fetch_alzheimer_heritability_papers(n_papers: int = 5) -> List[Dict]:
                     "full_text": full_text,
                     "full_text_length": len(full_text)
                 })
-                logger.info(f"  ✓ Got {len(full_text):,} chars of full text")
+                logger.info(f"  ✓ {pmcid}: Got {len(full_text):,} chars of full text")
             else:
-                logger.warning(f"  ✗ Full text too short ({len(full_text)} chars) - Skipping")
-        
-        time.sleep(0.5)  # Rate limiting
+                logger.warning(f"  ✗ {pmcid}: Full text too short ({len(full_text)} chars) - Skipping")
     
     return result
 
 
-def test_heritability_extraction(papers: List[Dict]) -> Dict:
+def _json_line(obj: Dict[str, Any]) -> bytes:
+    """Serialize obj as one line of newline-delimited JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str) + b"\n"
+    return json.dumps(obj, default=str).encode("utf-8") + b"\n"
+
+
+def _print_paper_result(paper: Dict[str, Any]):
+    """Print the extractions of one paper's result record."""
+    print(f"\n{paper['pmcid']}: {paper['title'][:60]}...")
+    for ext in paper['extractions']:
+        print(f"  • [ID: {ext.get('id')}] Trait: {ext['trait']}")
+        print(f"    h² = {ext['h2']} (SE={ext['se']}, p={ext['p_value']}, z={ext['z_score']})")
+        print(f"    Method: {ext['method']} ({ext['method_detail']}), Scale: {ext['scale']}")
+        print(f"    QC: Intercept={ext['intercept']}, LambdaGC={ext['lambda_gc']}")
+        print(f"    Pop: N={ext['sample_size']}, Ancestry={ext['ancestry']}, Prev={ext['prevalence']}")
+        print(f"    Pub: {ext['publication']} ({ext['publication_year']})")
+        print(f"    Confidence: {ext['confidence']}")
+        print(f"    Evidence HTML: {'✓ Present' if ext['evidence_html'] else '✗ Missing'}")
+        if ext['evidence_html']:
+            print(f"    (HTML snippet length: {len(ext['evidence_html'])})")
+
+
+def test_heritability_extraction(papers: List[Dict], records_file: Optional[Path] = None) -> Dict:
     """
     Run HeritabilityExtractor on the fetched papers.
+    
+    Extractions run concurrently on up to MAX_EXTRACTION_WORKERS threads (the
+    extractor mostly waits on the LLM API); results are reported in paper order.
+    Each paper's result is printed, and appended to records_file (if given)
+    as an NDJSON line, as soon as it is available; only the counts are kept
+    in memory.
     """
     from src.modules.literature.entities import PaperMetadata
     from src.modules.literature.information_extractor import HeritabilityExtractor
@@ -249,16 +638,10 @@ def test_heritability_extraction(papers: List[Dict]) -> Dict:
         "total_papers": len(papers),
         "successful_extractions": 0,
         "failed_extractions": 0,
-        "total_estimates": 0,
-        "extractions": []
+        "total_estimates": 0
     }
     
-    for i, paper in enumerate(papers, 1):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Paper {i}/{len(papers)}: {paper['title'][:80]}...")
-        logger.info(f"PMID: {paper['pmid']}, PMCID: {paper['pmcid']}")
-        logger.info(f"Full text length: {paper['full_text_length']:,} chars")
-        
+    def extract_one(paper: Dict):
         # Create PaperMetadata with full_text
         paper_metadata = PaperMetadata(
             pmid=paper['pmid'] or paper['pmcid'],
@@ -268,70 +651,80 @@ def test_heritability_extraction(papers: List[Dict]) -> Dict:
             journal=paper.get('journal', ''),
             publication_date=None
         )
+        return extractor.extract(paper_metadata)
+    
+    with ThreadPoolExecutor(max_workers=MAX_EXTRACTION_WORKERS) as executor, \
+            (open(records_file, 'wb') if records_file else nullcontext()) as records:
+        futures = [executor.submit(extract_one, paper) for paper in papers]
         
-        try:
-            extractions = extractor.extract(paper_metadata)
+        for i, (paper, future) in enumerate(zip(papers, futures), 1):
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Paper {i}/{len(papers)}: {paper['title'][:80]}...")
+            logger.info(f"PMID: {paper['pmid']}, PMCID: {paper['pmcid']}")
+            logger.info(f"Full text length: {paper['full_text_length']:,} chars")
             
-            if extractions:
-                results["successful_extractions"] += 1
-                results["total_estimates"] += len(extractions)
+            try:
+                extractions = future.result()
                 
-                paper_result = {
-                    "pmid": paper['pmid'],
-                    "pmcid": paper['pmcid'],
-                    "title": paper['title'],
-                    "num_extractions": len(extractions),
-                    "extractions": []
-                }
+                if extractions:
+                    results["successful_extractions"] += 1
+                    results["total_estimates"] += len(extractions)
                 
-                for ext in extractions:
-                    ext_dict = {
-                        "id": ext.id,
-                        "trait": ext.trait,
-                        "trait_efo": ext.trait_efo,
-                        "h2": ext.h2,
-                        "se": ext.se,
-                        "scale": ext.scale,
-                        "p_value": ext.p_value,
-                        "z_score": ext.z_score,
-                        "method": ext.method.value if ext.method else None,
-                        "method_detail": ext.method_detail,
-                        "intercept": ext.intercept,
-                        "lambda_gc": ext.lambda_gc,
-                        "sample_size": ext.sample_size,
-                        "ancestry": ext.ancestry,
-                        "prevalence": ext.prevalence,
-                        "publication": ext.publication,
-                        "publication_year": ext.publication_year,
-                        "confidence": ext.extraction_confidence,
-                        "source_text": ext.raw_text_snippet[:200] if ext.raw_text_snippet else "",
-                        "evidence_html": ext.evidence_html  # Check if this is populated
+                    paper_result = {
+                        "pmid": paper['pmid'],
+                        "pmcid": paper['pmcid'],
+                        "title": paper['title'],
+                        "num_extractions": len(extractions),
+                        "extractions": []
                     }
-                    paper_result["extractions"].append(ext_dict)
+                
+                    for ext in extractions:
+                        ext_dict = {
+                            "id": ext.id,
+                            "trait": ext.trait,
+                            "trait_efo": ext.trait_efo,
+                            "h2": ext.h2,
+                            "se": ext.se,
+                            "scale": ext.scale,
+                            "p_value": ext.p_value,
+                            "z_score": ext.z_score,
+                            "method": ext.method.value if ext.method else None,
+                            "method_detail": ext.method_detail,
+                            "intercept": ext.intercept,
+                            "lambda_gc": ext.lambda_gc,
+                            "sample_size": ext.sample_size,
+                            "ancestry": ext.ancestry,
+                            "prevalence": ext.prevalence,
+                            "publication": ext.publication,
+                            "publication_year": ext.publication_year,
+                            "confidence": ext.extraction_confidence,
+                            "source_text": ext.raw_text_snippet[:200] if ext.raw_text_snippet else "",
+                            "evidence_html": ext.evidence_html  # Check if this is populated
+                        }
+                        paper_result["extractions"].append(ext_dict)
                     
-                    logger.info(f"  ✓ Extracted: {ext.trait}")
-                    logger.info(f"    - h²: {ext.h2} (SE: {ext.se}, p: {ext.p_value})")
-                    logger.info(f"    - Method: {ext.method}, Scale: {ext.scale}")
-                    logger.info(f"    - Pop: N={ext.sample_size}, Ancestry={ext.ancestry}")
-                    logger.info(f"    - QC: Intercept={ext.intercept}, LambdaGC={ext.lambda_gc}")
-                    logger.info(f"    - Evidence HTML present: {bool(ext.evidence_html)}")
+                        logger.info(f"  ✓ Extracted: {ext.trait}")
+                        logger.info(f"    - h²: {ext.h2} (SE: {ext.se}, p: {ext.p_value})")
+                        logger.info(f"    - Method: {ext.method}, Scale: {ext.scale}")
+                        logger.info(f"    - Pop: N={ext.sample_size}, Ancestry={ext.ancestry}")
+                        logger.info(f"    - QC: Intercept={ext.intercept}, LambdaGC={ext.lambda_gc}")
+                        logger.info(f"    - Evidence HTML present: {bool(ext.evidence_html)}")
                 
-                results["extractions"].append(paper_result)
-            else:
-                results["failed_extractions"] += 1
-                logger.warning(f"  ✗ No heritability estimates extracted")
+                    if records is not None:
+                        records.write(_json_line(paper_result))
+                    _print_paper_result(paper_result)
+                else:
+                    results["failed_extractions"] += 1
+                    logger.warning(f"  ✗ No heritability estimates extracted")
                 
-        except Exception as e:
-            results["failed_extractions"] += 1
-            logger.error(f"  ✗ Extraction error: {e}")
-        
-        # Small delay between papers
-        time.sleep(1)
+            except Exception as e:
+                results["failed_extractions"] += 1
+                logger.error(f"  ✗ Extraction error: {e}")
     
     return results
 
 
-def main():
+def main(refresh: bool = False):
     """Main function to run the PMC heritability extraction test."""
     
     print("\n" + "="*70)
@@ -343,7 +736,7 @@ def main():
     print("Query: heritability + Alzheimer's disease")
     print("-"*50)
     
-    papers = fetch_alzheimer_heritability_papers(n_papers=5)
+    papers = asyncio.run(fetch_alzheimer_heritability_papers(n_papers=5, refresh=refresh))
     
     if not papers:
         print("ERROR: No papers found. Check your internet connection.")
@@ -361,7 +754,13 @@ def main():
     print("Step 2: Running HeritabilityExtractor on papers...")
     print("-"*50)
     
-    results = test_heritability_extraction(papers)
+    output_dir = project_root / "data" / "test_results"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"pmc_heritability_extraction_test_{timestamp}.ndjson"
+    
+    results = test_heritability_extraction(papers, records_file=output_file)
     
     # Step 3: Summary
     print("\n" + "="*70)
@@ -377,38 +776,25 @@ def main():
         print(f"\nSuccess Rate: {results['successful_extractions']/results['total_papers']*100:.1f}%")
         print(f"Avg Estimates per Paper: {results['total_estimates']/max(results['successful_extractions'],1):.1f}")
     
-    # Detailed results
-    if results['extractions']:
-        print("\n" + "-"*50)
-        print("DETAILED EXTRACTIONS:")
-        print("-"*50)
-        
-        for paper in results['extractions']:
-            print(f"\n{paper['pmcid']}: {paper['title'][:60]}...")
-            for ext in paper['extractions']:
-                print(f"  • [ID: {ext.get('id')}] Trait: {ext['trait']}")
-                print(f"    h² = {ext['h2']} (SE={ext['se']}, p={ext['p_value']}, z={ext['z_score']})")
-                print(f"    Method: {ext['method']} ({ext['method_detail']}), Scale: {ext['scale']}")
-                print(f"    QC: Intercept={ext['intercept']}, LambdaGC={ext['lambda_gc']}")
-                print(f"    Pop: N={ext['sample_size']}, Ancestry={ext['ancestry']}, Prev={ext['prevalence']}")
-                print(f"    Pub: {ext['publication']} ({ext['publication_year']})")
-                print(f"    Confidence: {ext['confidence']}")
-                print(f"    Evidence HTML: {'✓ Present' if ext['evidence_html'] else '✗ Missing'}")
-                if ext['evidence_html']:
-                    print(f"    (HTML snippet length: {len(ext['evidence_html'])})")
-    
-    # Save results
-    output_dir = project_root / "data" / "test_results"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Save summary (per-paper records were streamed to output_file)
+    summary_file = output_dir / f"pmc_heritability_extraction_test_{timestamp}_summary.json"
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"pmc_heritability_extraction_test_{timestamp}.json"
-    
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    if orjson is not None:
+        summary_file.write_bytes(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
     
     print(f"\n✓ Results saved to: {output_file}")
+    print(f"✓ Summary saved to: {summary_file}")
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Test heritability extraction on PMC full texts")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached Europe PMC responses and re-download them")
+    
+    args = parser.parse_args()
+    
+    main(refresh=args.refresh)
@@ -15,14 +15,23 @@ Usage:
 import sys
 import os
 import json
-import csv
 import re
+import random
 import asyncio
+import functools
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import BinaryIO, Iterable, List, Dict, Any, Optional, Tuple
 import logging
 
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -40,10 +49,17 @@ logger = logging.getLogger(__name__)
 # Constants
 # ============================================================================
 
+# PMID column of the PGS Catalog publications export
+PGS_PMID_COLUMN = "PubMed ID (PMID)"
+
 # Target counts
 TARGET_POSITIVE_SAMPLES = 100
 TARGET_NEGATIVE_SAMPLES = 100
 
+# Search hits fetched for positive samples (limit to avoid too many API calls)
+MAX_POSITIVE_PMIDS = 200
+EFETCH_BATCH_SIZE = 200
+
 # PubMed search queries for heritability papers
 HERITABILITY_SEARCH_QUERIES = [
     # Primary: Papers explicitly mentioning SNP heritability in abstract
@@ -67,6 +83,17 @@ HERITABILITY_KEYWORDS = [
     r'GREML.*heritab',                # GREML...heritability
 ]
 
+# Compiled once and matched against the lowercased abstract: re.IGNORECASE
+# disables re's literal-prefix scan and is an order of magnitude slower
+_HERITABILITY_RES = [(pattern, re.compile(pattern.lower())) for pattern in HERITABILITY_KEYWORDS]
+
+# Every heritability pattern needs one of these substrings, so abstracts
+# without any of them are rejected before running the regexes
+_HERITABILITY_TRIGGERS = ('heritab', 'h2', 'h²')
+
+# Lowercased PRS indicators for is_prs_paper_without_heritability
+_PRS_KEYWORDS = ('polygenic risk score', 'polygenic score', 'prs', 'genetic risk score')
+
 # Keywords that indicate a paper is likely NOT about heritability
 NON_HERITABILITY_INDICATORS = [
     'polygenic risk score',
@@ -80,26 +107,80 @@ NON_HERITABILITY_INDICATORS = [
 ]
 
 
+# ============================================================================
+# Data Model
+# ============================================================================
+
+@dataclass(slots=True)
+class Sample:
+    """A labelled paper in the ground truth dataset."""
+    pmid: str
+    title: str
+    abstract: str
+    publication_date: Optional[str]
+    is_heritability: bool
+    source: str
+    validation_status: str
+    matched_patterns: Optional[List[str]] = None
+    reason: Optional[str] = None
+    
+    @classmethod
+    def from_paper(cls, paper: PaperMetadata, **fields) -> "Sample":
+        # Convert date to string for JSON serialization
+        pub_date = paper.publication_date
+        pub_date_str = (pub_date.isoformat() if hasattr(pub_date, 'isoformat') else str(pub_date)) if pub_date else None
+        return cls(
+            pmid=paper.pmid,
+            title=paper.title,
+            abstract=paper.abstract,
+            publication_date=pub_date_str,
+            **fields
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the gold standard JSON layout."""
+        sample = {
+            "pmid": self.pmid,
+            "title": self.title,
+            "abstract": self.abstract,
+            "publication_date": self.publication_date,
+            "expected_classification": {
+                "is_heritability": self.is_heritability,
+                "confidence": "high"
+            }
+        }
+        if self.matched_patterns is not None:
+            sample["matched_patterns"] = self.matched_patterns
+        if self.reason is not None:
+            sample["reason"] = self.reason
+        sample["source"] = self.source
+        sample["validation_status"] = self.validation_status
+        return sample
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
-def has_heritability_in_abstract(abstract: str) -> Tuple[bool, List[str]]:
+def has_heritability_in_abstract(abstract: str, abstract_lower: Optional[str] = None) -> Tuple[bool, List[str]]:
     """
     Check if abstract contains heritability-related content.
     
+    Args:
+        abstract: Abstract text
+        abstract_lower: abstract.lower(), if the caller has already computed it
+    
     Returns:
         Tuple of (is_heritability, matched_patterns)
     """
     if not abstract:
         return False, []
     
-    abstract_lower = abstract.lower()
-    matched = []
-    
-    for pattern in HERITABILITY_KEYWORDS:
-        if re.search(pattern, abstract, re.IGNORECASE):
-            matched.append(pattern)
+    if abstract_lower is None:
+        abstract_lower = abstract.lower()
+    if not any(trigger in abstract_lower for trigger in _HERITABILITY_TRIGGERS):
+        return False, []
+    matched = [pattern for pattern, regex in _HERITABILITY_RES if regex.search(abstract_lower)]
     
     return len(matched) > 0, matched
 
@@ -115,10 +196,10 @@ def is_prs_paper_without_heritability(abstract: str) -> bool:
     abstract_lower = abstract.lower()
     
     # Must have PRS indicators
-    has_prs = any(kw.lower() in abstract_lower for kw in ['polygenic risk score', 'polygenic score', 'PRS', 'genetic risk score'])
+    has_prs = any(kw in abstract_lower for kw in _PRS_KEYWORDS)
     
     # Must NOT have heritability indicators
-    has_herit, _ = has_heritability_in_abstract(abstract)
+    has_herit, _ = has_heritability_in_abstract(abstract, abstract_lower)
     
     return has_prs and not has_herit
 
@@ -129,77 +210,113 @@ def load_pgs_catalog_pmids() -> List[str]:
     
     pmids = []
     if csv_path.exists():
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                pmid = row.get('PubMed ID (PMID)', '').strip()
-                if pmid and pmid.isdigit():
-                    pmids.append(pmid)
+        # Only the PMID column is parsed; pyarrow's reader is used when available
+        try:
+            column = pd.read_csv(csv_path, usecols=[PGS_PMID_COLUMN], dtype="string", engine="pyarrow")[PGS_PMID_COLUMN]
+        except ImportError:
+            column = pd.read_csv(csv_path, usecols=[PGS_PMID_COLUMN], dtype="string")[PGS_PMID_COLUMN]
+        column = column.str.strip()
+        pmids = column[column.str.fullmatch(r"\d+", na=False)].tolist()
     
     logger.info(f"Loaded {len(pmids)} PMIDs from PGS Catalog publications")
     return pmids
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as UTF-8 JSON with 2-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_samples(f: BinaryIO, key: str, samples: Iterable[Sample]):
+    """
+    Write one top-level "key": [...] member, one sample at a time.
+    
+    The layout matches an indent=2 dump of the enclosing dataset object.
+    """
+    f.write(b'  "' + key.encode() + b'": [')
+    empty = True
+    for sample in samples:
+        f.write(b"\n    " if empty else b",\n    ")
+        f.write(_dumps(sample.to_dict()).replace(b"\n", b"\n    "))
+        empty = False
+    f.write(b"]" if empty else b"\n  ]")
+
+
 # ============================================================================
 # Main Dataset Building Functions
 # ============================================================================
 
-async def collect_positive_samples(client: PubMedClient, target_count: int) -> List[Dict[str, Any]]:
+async def collect_positive_samples(client: PubMedClient, target_count: int) -> List[Sample]:
     """
     Collect positive samples (papers with heritability in abstract).
     
     Uses PubMed search to find papers that explicitly mention heritability.
+    Searches and metadata fetches are pipelined through a queue: a batch of
+    PMIDs is fetched as soon as it is full, while later searches still run.
     """
     logger.info(f"Collecting ~{target_count} positive samples (heritability papers)...")
     
-    all_pmids = set()
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=500)
     
-    # Search using each query
-    for query in HERITABILITY_SEARCH_QUERIES:
-        try:
-            result = client.search(
-                query=query,
-                max_results=100,
-                date_from="2015/01/01",  # LDSC first published in 2015
-                sort="relevance"
-            )
-            logger.info(f"Query '{query[:50]}...' returned {len(result.pmids)} results")
-            all_pmids.update(result.pmids)
-        except Exception as e:
-            logger.error(f"Error searching with query '{query}': {e}")
-    
-    logger.info(f"Total unique PMIDs from searches: {len(all_pmids)}")
+    async def search_producer():
+        seen = set()
+        
+        # Search using each query
+        for query in HERITABILITY_SEARCH_QUERIES:
+            try:
+                result = await loop.run_in_executor(None, functools.partial(
+                    client.search,
+                    query=query,
+                    max_results=100,
+                    date_from="2015/01/01",  # LDSC first published in 2015
+                    sort="relevance"
+                ))
+                logger.info(f"Query '{query[:50]}...' returned {len(result.pmids)} results")
+            except Exception as e:
+                logger.error(f"Error searching with query '{query}': {e}")
+                continue
+            
+            for pmid in result.pmids:
+                if pmid not in seen and len(seen) < MAX_POSITIVE_PMIDS:
+                    seen.add(pmid)
+                    await queue.put(pmid)
+            if len(seen) >= MAX_POSITIVE_PMIDS:
+                break
+        
+        logger.info(f"Total unique PMIDs from searches: {len(seen)}")
+        await queue.put(None)  # No more PMIDs
     
-    # Fetch paper metadata
-    pmid_list = list(all_pmids)[:200]  # Limit to avoid too many API calls
-    papers = client.fetch_papers(pmid_list)
+    async def fetch_consumer() -> List[PaperMetadata]:
+        fetches = []
+        batch = []
+        while (pmid := await queue.get()) is not None:
+            batch.append(pmid)
+            if len(batch) == EFETCH_BATCH_SIZE:
+                fetches.append(loop.run_in_executor(None, client.fetch_papers, batch))
+                batch = []
+        if batch:
+            fetches.append(loop.run_in_executor(None, client.fetch_papers, batch))
+        return [paper for batch_papers in await asyncio.gather(*fetches) for paper in batch_papers]
+    
+    _, papers = await asyncio.gather(search_producer(), fetch_consumer())
     logger.info(f"Fetched metadata for {len(papers)} papers")
     
     # Filter to papers that definitely have heritability in abstract
-    positive_samples = []
-    for paper in papers:
-        has_herit, patterns = has_heritability_in_abstract(paper.abstract)
-        if has_herit:
-            # Convert date to string for JSON serialization
-            pub_date = paper.publication_date
-            if pub_date:
-                pub_date_str = pub_date.isoformat() if hasattr(pub_date, 'isoformat') else str(pub_date)
-            else:
-                pub_date_str = None
-            
-            positive_samples.append({
-                "pmid": paper.pmid,
-                "title": paper.title,
-                "abstract": paper.abstract,
-                "publication_date": pub_date_str,
-                "expected_classification": {
-                    "is_heritability": True,
-                    "confidence": "high"
-                },
-                "matched_patterns": patterns,
-                "source": "pubmed_search",
-                "validation_status": "auto_keyword_match"
-            })
+    checked = [(paper, has_heritability_in_abstract(paper.abstract)) for paper in papers]
+    positive_samples = [
+        Sample.from_paper(
+            paper,
+            is_heritability=True,
+            matched_patterns=patterns,
+            source="pubmed_search",
+            validation_status="auto_keyword_match"
+        )
+        for paper, (has_herit, patterns) in checked
+        if has_herit
+    ]
     
     logger.info(f"Filtered to {len(positive_samples)} papers with confirmed heritability keywords in abstract")
     
@@ -207,7 +324,7 @@ async def collect_positive_samples(client: PubMedClient, target_count: int) -> L
     return positive_samples[:target_count]
 
 
-async def collect_negative_samples(client: PubMedClient, target_count: int) -> List[Dict[str, Any]]:
+async def collect_negative_samples(client: PubMedClient, target_count: int) -> List[Sample]:
     """
     Collect negative samples (papers without heritability in abstract).
     
@@ -225,45 +342,26 @@ async def collect_negative_samples(client: PubMedClient, target_count: int) -> L
     
     # Sample more than needed to account for filtering
     sample_size = min(len(pgs_pmids), target_count * 2)
-    import random
     random.seed(42)  # Reproducible sampling
     sampled_pmids = random.sample(pgs_pmids, sample_size)
     
     # Fetch paper metadata
-    papers = client.fetch_papers(sampled_pmids)
+    papers = await asyncio.get_running_loop().run_in_executor(None, client.fetch_papers, sampled_pmids)
     logger.info(f"Fetched metadata for {len(papers)} PGS Catalog papers")
     
     # Filter to papers that don't mention heritability
-    negative_samples = []
-    skipped_has_heritability = 0
-    
-    for paper in papers:
-        has_herit, _ = has_heritability_in_abstract(paper.abstract)
-        
-        if has_herit:
-            skipped_has_heritability += 1
-            continue
-        
-        # Convert date to string for JSON serialization
-        pub_date = paper.publication_date
-        if pub_date:
-            pub_date_str = pub_date.isoformat() if hasattr(pub_date, 'isoformat') else str(pub_date)
-        else:
-            pub_date_str = None
-        
-        negative_samples.append({
-            "pmid": paper.pmid,
-            "title": paper.title,
-            "abstract": paper.abstract,
-            "publication_date": pub_date_str,
-            "expected_classification": {
-                "is_heritability": False,
-                "confidence": "high"
-            },
-            "reason": "PGS Catalog paper without heritability keywords in abstract",
-            "source": "pgs_catalog",
-            "validation_status": "auto_keyword_absence"
-        })
+    negative_samples = [
+        Sample.from_paper(
+            paper,
+            is_heritability=False,
+            reason="PGS Catalog paper without heritability keywords in abstract",
+            source="pgs_catalog",
+            validation_status="auto_keyword_absence"
+        )
+        for paper in papers
+        if not has_heritability_in_abstract(paper.abstract)[0]
+    ]
+    skipped_has_heritability = len(papers) - len(negative_samples)
     
     logger.info(f"Filtered to {len(negative_samples)} papers without heritability keywords")
     logger.info(f"Skipped {skipped_has_heritability} papers that mentioned heritability")
@@ -287,31 +385,31 @@ async def build_ground_truth_dataset():
     client = PubMedClient()
     
     try:
-        # Collect positive samples
-        positive_samples = await collect_positive_samples(client, TARGET_POSITIVE_SAMPLES)
+        # Collect positive and negative samples concurrently (the client's
+        # rate limiter is shared, so NCBI limits still hold)
+        positive_samples, negative_samples = await asyncio.gather(
+            collect_positive_samples(client, TARGET_POSITIVE_SAMPLES),
+            collect_negative_samples(client, TARGET_NEGATIVE_SAMPLES)
+        )
         
-        # Collect negative samples
-        negative_samples = await collect_negative_samples(client, TARGET_NEGATIVE_SAMPLES)
-        
-        # Build final dataset
-        dataset = {
-            "metadata": {
-                "created": datetime.now().isoformat(),
-                "version": "1.0",
-                "description": "Ground truth dataset for validating Heritability classifier",
-                "positive_sample_source": "PubMed search for heritability keywords in abstract",
-                "negative_sample_source": "PGS Catalog publications without heritability keywords",
-                "total_positive": len(positive_samples),
-                "total_negative": len(negative_samples),
-                "total_papers": len(positive_samples) + len(negative_samples)
-            },
-            "positive_samples": positive_samples,
-            "negative_samples": negative_samples
+        metadata = {
+            "created": datetime.now().isoformat(),
+            "version": "1.0",
+            "description": "Ground truth dataset for validating Heritability classifier",
+            "positive_sample_source": "PubMed search for heritability keywords in abstract",
+            "negative_sample_source": "PGS Catalog publications without heritability keywords",
+            "total_positive": len(positive_samples),
+            "total_negative": len(negative_samples),
+            "total_papers": len(positive_samples) + len(negative_samples)
         }
         
-        # Save dataset
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(dataset, f, indent=2, ensure_ascii=False)
+        # Save dataset, serializing one sample at a time
+        with open(output_file, 'wb') as f:
+            f.write(b'{\n  "metadata": ' + _dumps(metadata).replace(b"\n", b"\n  ") + b",\n")
+            _write_samples(f, "positive_samples", positive_samples)
+            f.write(b",\n")
+            _write_samples(f, "negative_samples", negative_samples)
+            f.write(b"\n}")
         
         logger.info("=" * 60)
         logger.info("Dataset Build Complete!")
@@ -325,17 +423,21 @@ async def build_ground_truth_dataset():
         if positive_samples:
             logger.info("\nSample positive paper:")
             sample = positive_samples[0]
-            logger.info(f"  PMID: {sample['pmid']}")
-            logger.info(f"  Title: {sample['title'][:80]}...")
-            logger.info(f"  Patterns: {sample.get('matched_patterns', [])}")
+            logger.info(f"  PMID: {sample.pmid}")
+            logger.info(f"  Title: {sample.title[:80]}...")
+            logger.info(f"  Patterns: {sample.matched_patterns or []}")
         
         if negative_samples:
             logger.info("\nSample negative paper:")
             sample = negative_samples[0]
-            logger.info(f"  PMID: {sample['pmid']}")
-            logger.info(f"  Title: {sample['title'][:80]}...")
+            logger.info(f"  PMID: {sample.pmid}")
+            logger.info(f"  Title: {sample.title[:80]}...")
         
-        return dataset
+        return {
+            "metadata": metadata,
+            "positive_samples": positive_samples,
+            "negative_samples": negative_samples
+        }
         
     finally:
         client.close()
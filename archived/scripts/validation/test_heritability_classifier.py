@@ -5,21 +5,35 @@ Test Heritability Classifier Accuracy
 Runs the Paper Classifier against the Heritability Ground Truth dataset
 and calculates performance metrics (Recall, Precision, F1, Accuracy).
 
-Output: Console report + data/test_results/heritability_classifier_test_*.json
+Output: Console report + data/test_results/heritability_classifier_test_*.json (summary)
+        and a matching .jsonl file with one result per paper
 
 Usage:
-    python scripts/test_heritability_classifier.py
+    python scripts/test_heritability_classifier.py [--batch-api] [--no-cache]
 """
 
 import sys
 import os
 import json
+import time
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Iterable, List, Dict, Any, Tuple
 import logging
 
+import numpy as np
+
+try:
+    import ijson
+except ImportError:  # Fall back to loading the whole file with json
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
@@ -28,7 +42,7 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from modules.literature.paper_classifier import PaperClassifier
-from modules.literature.entities import PaperMetadata
+from modules.literature.entities import PaperMetadata, PaperCategory
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,54 +51,82 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_ground_truth() -> Dict[str, Any]:
-    """Load the heritability ground truth dataset."""
-    gt_path = Path(__file__).parent.parent / "data" / "validation" / "heritability_gold_standard.json"
-    
-    if not gt_path.exists():
-        raise FileNotFoundError(
-            f"Ground truth file not found: {gt_path}\n"
-            "Please run build_heritability_ground_truth.py first."
+def _add_samples(
+    samples: Iterable[Dict[str, Any]],
+    label: bool,
+    papers: List[PaperMetadata],
+    expected_labels: Dict[str, bool]
+) -> int:
+    """Append samples as papers with the given expected label; return how many were added."""
+    count = 0
+    for sample in samples:
+        paper = PaperMetadata(
+            pmid=sample["pmid"],
+            title=sample["title"],
+            abstract=sample["abstract"],
+            publication_date=sample.get("publication_date")
         )
-    
-    with open(gt_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        papers.append(paper)
+        expected_labels[sample["pmid"]] = label
+        count += 1
+    return count
 
 
-def prepare_papers(ground_truth: Dict[str, Any]) -> Tuple[List[PaperMetadata], Dict[str, bool]]:
+def load_ground_truth() -> Tuple[List[PaperMetadata], Dict[str, bool], int, int, Dict[str, Any]]:
     """
-    Prepare papers and expected labels from ground truth.
+    Load the heritability ground truth dataset as papers and expected labels.
+    
+    With ijson installed the samples are streamed one at a time, so the parsed
+    JSON document is never held in memory alongside the papers.
     
     Returns:
-        Tuple of (papers, expected_labels)
+        Tuple of (papers, expected_labels, n_positive, n_negative, metadata)
         where expected_labels maps PMID to expected is_heritability value
     """
-    papers = []
-    expected_labels = {}
+    gt_path = Path(__file__).parent.parent / "data" / "validation" / "heritability_gold_standard.json"
     
-    # Process positive samples
-    for sample in ground_truth.get("positive_samples", []):
-        paper = PaperMetadata(
-            pmid=sample["pmid"],
-            title=sample["title"],
-            abstract=sample["abstract"],
-            publication_date=sample.get("publication_date")
+    if not gt_path.exists():
+        raise FileNotFoundError(
+            f"Ground truth file not found: {gt_path}\n"
+            "Please run build_heritability_ground_truth.py first."
         )
-        papers.append(paper)
-        expected_labels[sample["pmid"]] = True
     
-    # Process negative samples
-    for sample in ground_truth.get("negative_samples", []):
-        paper = PaperMetadata(
-            pmid=sample["pmid"],
-            title=sample["title"],
-            abstract=sample["abstract"],
-            publication_date=sample.get("publication_date")
-        )
-        papers.append(paper)
-        expected_labels[sample["pmid"]] = False
+    papers: List[PaperMetadata] = []
+    expected_labels: Dict[str, bool] = {}
+    counts = {}
     
-    return papers, expected_labels
+    if ijson is not None:
+        with open(gt_path, 'rb') as f:
+            metadata = next(ijson.items(f, 'metadata', use_float=True), {})
+        for key, label in (("positive_samples", True), ("negative_samples", False)):
+            with open(gt_path, 'rb') as f:
+                samples = ijson.items(f, f'{key}.item', use_float=True)
+                counts[key] = _add_samples(samples, label, papers, expected_labels)
+    else:
+        if orjson is not None:
+            ground_truth = orjson.loads(gt_path.read_bytes())
+        else:
+            with open(gt_path, 'r', encoding='utf-8') as f:
+                ground_truth = json.load(f)
+        metadata = ground_truth.get("metadata", {})
+        for key, label in (("positive_samples", True), ("negative_samples", False)):
+            counts[key] = _add_samples(ground_truth.get(key, []), label, papers, expected_labels)
+    
+    return papers, expected_labels, counts["positive_samples"], counts["negative_samples"], metadata
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one newline-terminated JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
 
 
 def calculate_metrics(predictions: Dict[str, bool], expected: Dict[str, bool]) -> Dict[str, float]:
@@ -94,19 +136,13 @@ def calculate_metrics(predictions: Dict[str, bool], expected: Dict[str, bool]) -
     Returns:
         Dict with TP, TN, FP, FN, Recall, Precision, F1, Accuracy, Specificity
     """
-    tp = tn = fp = fn = 0
+    y_true = np.fromiter((bool(v) for v in expected.values()), dtype=bool, count=len(expected))
+    y_pred = np.fromiter((bool(predictions.get(pmid, False)) for pmid in expected), dtype=bool, count=len(expected))
     
-    for pmid, expected_value in expected.items():
-        predicted_value = predictions.get(pmid, False)
-        
-        if expected_value and predicted_value:
-            tp += 1
-        elif not expected_value and not predicted_value:
-            tn += 1
-        elif not expected_value and predicted_value:
-            fp += 1
-        elif expected_value and not predicted_value:
-            fn += 1
+    tp = int(np.count_nonzero(y_true & y_pred))
+    tn = int(np.count_nonzero(~y_true & ~y_pred))
+    fp = int(np.count_nonzero(~y_true & y_pred))
+    fn = int(np.count_nonzero(y_true & ~y_pred))
     
     # Calculate metrics (handle division by zero)
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -128,80 +164,96 @@ def calculate_metrics(predictions: Dict[str, bool], expected: Dict[str, bool]) -
     }
 
 
-async def run_classifier_test():
-    """Main function to run the classifier test."""
+async def run_classifier_test(use_batch_api: bool = False, use_cache: bool = True):
+    """
+    Main function to run the classifier test.
+    
+    Args:
+        use_batch_api: Submit all papers as one OpenAI Batch API job (half the
+            cost, but may take hours) instead of concurrent requests
+        use_cache: Reuse classifications cached by earlier runs (same model and
+            prompts); fresh results are cached either way
+    """
     logger.info("=" * 70)
     logger.info("Heritability Classifier Accuracy Test")
     logger.info("=" * 70)
     
-    # Load ground truth
+    # Load ground truth as papers and expected labels
     logger.info("Loading ground truth dataset...")
-    ground_truth = load_ground_truth()
-    
-    n_positive = len(ground_truth.get("positive_samples", []))
-    n_negative = len(ground_truth.get("negative_samples", []))
+    papers, expected_labels, n_positive, n_negative, gt_metadata = load_ground_truth()
     logger.info(f"Ground truth: {n_positive} positive, {n_negative} negative samples")
-    
-    # Prepare papers and expected labels
-    papers, expected_labels = prepare_papers(ground_truth)
     logger.info(f"Prepared {len(papers)} papers for classification")
     
     # Initialize classifier
-    classifier = PaperClassifier()
+    cache_dir = Path(__file__).parent.parent / "data" / "cache" / "classifier"
+    classifier = PaperClassifier(cache_dir=cache_dir, refresh_cache=not use_cache)
     logger.info(f"Using model: {classifier.model_name}")
     
-    # Run classification with progress callback
+    # Run classification; progress is reported at most once per second
     def progress_callback(completed: int, total: int):
-        if completed % 20 == 0 or completed == total:
-            logger.info(f"Progress: {completed}/{total} ({100*completed/total:.1f}%)")
+        logger.info(f"Progress: {completed}/{total} ({100*completed/total:.1f}%)")
     
     logger.info("Starting classification...")
-    start_time = datetime.now()
+    start_time = time.monotonic()
     
-    results = classifier.classify_batch(papers, progress_callback=progress_callback)
+    if use_batch_api:
+        # One Batch API job; progress is logged while polling
+        results = await classifier.classify_batch_async(papers)
+    else:
+        results = await classifier.aclassify_batch(papers, progress_callback=progress_callback)
     
-    elapsed = (datetime.now() - start_time).total_seconds()
+    elapsed = time.monotonic() - start_time
     logger.info(f"Classification completed in {elapsed:.1f} seconds")
     
+    # Per-paper results are streamed to a JSONL file next to the summary report
+    output_dir = Path(__file__).parent.parent / "data" / "test_results"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    test_date = datetime.now(timezone.utc)
+    timestamp = test_date.strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"heritability_classifier_test_{timestamp}.json"
+    details_file = output_dir / f"heritability_classifier_test_{timestamp}.jsonl"
+    
     # Extract predictions
     predictions = {}
-    detailed_results = []
+    false_negatives = []
+    false_positives = []
     
-    for result in results:
-        pmid = result.pmid
-        # Get has_heritability from the classification result (it's a property method)
-        is_heritability = result.has_heritability
-        
-        # Get heritability confidence from categories
-        herit_confidence = 0.0
-        from modules.literature.entities import PaperCategory
-        for cat in result.categories:
-            if cat.category == PaperCategory.HERITABILITY:
-                herit_confidence = cat.confidence
-                break
-        
-        predictions[pmid] = is_heritability
-        
-        expected = expected_labels.get(pmid, None)
-        is_correct = (is_heritability == expected) if expected is not None else None
-        
-        detailed_results.append({
-            "pmid": pmid,
-            "expected_is_heritability": expected,
-            "predicted_is_heritability": is_heritability,
-            "heritability_confidence": round(herit_confidence, 3) if herit_confidence else 0.0,
-            "is_correct": is_correct,
-            "reasoning": result.llm_reasoning or "",
-            "primary_category": result.primary_category.value if result.primary_category else "unknown"
-        })
+    with details_file.open("wb") as details:
+        for result in results:
+            pmid = result.pmid
+            # Get has_heritability from the classification result (it's a property method)
+            is_heritability = result.has_heritability
+            
+            # Get heritability confidence from categories
+            category_confidence = {cat.category: cat.confidence for cat in result.categories}
+            herit_confidence = category_confidence.get(PaperCategory.HERITABILITY, 0.0)
+            
+            predictions[pmid] = is_heritability
+            
+            expected = expected_labels.get(pmid, None)
+            is_correct = (is_heritability == expected) if expected is not None else None
+            
+            record = {
+                "pmid": pmid,
+                "expected_is_heritability": expected,
+                "predicted_is_heritability": is_heritability,
+                "heritability_confidence": round(herit_confidence, 3) if herit_confidence else 0.0,
+                "is_correct": is_correct,
+                "reasoning": result.llm_reasoning or "",
+                "primary_category": result.primary_category.value if result.primary_category else "unknown"
+            }
+            details.write(_dumps_line(record))
+            
+            # Keep failures for analysis
+            if expected is True and not is_heritability:
+                false_negatives.append(record)
+            elif expected is False and is_heritability:
+                false_positives.append(record)
     
     # Calculate metrics
     metrics = calculate_metrics(predictions, expected_labels)
     
-    # Identify failures for analysis
-    false_negatives = [r for r in detailed_results if r["expected_is_heritability"] == True and r["predicted_is_heritability"] == False]
-    false_positives = [r for r in detailed_results if r["expected_is_heritability"] == False and r["predicted_is_heritability"] == True]
-    
     # Print results
     logger.info("\n" + "=" * 70)
     logger.info("RESULTS SUMMARY")
@@ -235,19 +287,13 @@ async def run_classifier_test():
         for fp in false_positives[:5]:  # Show first 5
             logger.info(f"  PMID:{fp['pmid']} - Conf:{fp['heritability_confidence']}")
     
-    # Save detailed results
-    output_dir = Path(__file__).parent.parent / "data" / "test_results"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"heritability_classifier_test_{timestamp}.json"
-    
+    # Save summary report
     test_report = {
         "metadata": {
-            "test_date": datetime.now().isoformat(),
+            "test_date": test_date.isoformat(),
             "model": classifier.model_name,
             "elapsed_seconds": round(elapsed, 2),
-            "ground_truth_version": ground_truth.get("metadata", {}).get("version", "unknown")
+            "ground_truth_version": gt_metadata.get("version", "unknown")
         },
         "summary": {
             "total_papers": len(papers),
@@ -255,19 +301,34 @@ async def run_classifier_test():
             "negative_samples": n_negative
         },
         "metrics": metrics,
-        "false_negatives": false_negatives,
-        "false_positives": false_positives,
-        "detailed_results": detailed_results
+        "false_negatives": len(false_negatives),
+        "false_positives": len(false_positives),
+        "detailed_results_file": str(details_file)
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(test_report, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(_dumps(test_report))
     
-    logger.info(f"\nDetailed results saved to: {output_file}")
+    logger.info(f"\nSummary saved to: {output_file}")
+    logger.info(f"Detailed results saved to: {details_file}")
     logger.info("=" * 70)
     
     return test_report
 
 
 if __name__ == "__main__":
-    asyncio.run(run_classifier_test())
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Test the heritability classifier against the ground truth")
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Classify via one OpenAI Batch API job instead of concurrent requests"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-classify every paper instead of reusing cached classifications"
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(run_classifier_test(use_batch_api=args.batch_api, use_cache=not args.no_cache))
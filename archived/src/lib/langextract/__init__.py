@@ -1,3 +1,3 @@
-from .core import LangExtractor, Chunk, Evidence
+from .core import LangExtractor, Chunk, Evidence, EvidenceIndex, SectionType
 
-__all__ = ["LangExtractor", "Chunk", "Evidence"]
+__all__ = ["LangExtractor", "Chunk", "Evidence", "EvidenceIndex", "SectionType"]
@@ -1,8 +1,20 @@
 import dataclasses
+from bisect import bisect_right
 from typing import List, Optional, Dict
 import html
 from enum import Enum
 import re
+import threading
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # Fall back to difflib
+    fuzz = None
+
+try:
+    import hyperscan
+except ImportError:  # Fall back to the compiled re alternation
+    hyperscan = None
 
 class SectionType(str, Enum):
     ABSTRACT = "abstract"
@@ -15,13 +27,22 @@ class SectionType(str, Enum):
 
 @dataclasses.dataclass
 class Chunk:
-    """Represents a chunk of text from a document."""
-    text: str
+    """
+    Represents a chunk of text from a document.
+    
+    Only the offsets into the shared document are stored; the chunk's text is
+    sliced out when accessed.
+    """
+    document: str = dataclasses.field(repr=False, compare=False)
     start_char: int
     end_char: int
     id: int
     section_type: SectionType = SectionType.UNKNOWN
     metadata: Dict[str, str] = dataclasses.field(default_factory=dict)
+    
+    @property
+    def text(self) -> str:
+        return self.document[self.start_char:self.end_char]
 
 @dataclasses.dataclass
 class Evidence:
@@ -41,6 +62,136 @@ class Evidence:
         
         return f'<div class="evidence-snippet">...{safe_before}<mark class="highlight">{safe_quote}</mark>{safe_after}...</div>'
 
+_TOKEN_RE = re.compile(r'\S+')
+_WS_RUN_RE = re.compile(r'\s+')
+
+def _find_token_sequence(text: str, tokens: List[str]) -> Optional[tuple[int, int]]:
+    """
+    Finds tokens in text, in order, separated only by whitespace runs,
+    ignoring case. Returns (start_index, end_index) or None.
+    
+    Anchors on str.find of the longest (usually rarest) token and checks its
+    neighbours in place, so no regex is compiled per quote.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Lowercasing changed some characters' length: offsets would not map
+        lowered = text
+    else:
+        tokens = [token.lower() for token in tokens]
+    anchor_at = max(range(len(tokens)), key=lambda i: len(tokens[i]))
+    anchor = tokens[anchor_at]
+    before = tokens[:anchor_at][::-1]
+    after = tokens[anchor_at + 1:]
+    
+    pos = lowered.find(anchor)
+    while pos != -1:
+        # Walk back over the preceding tokens
+        start = pos
+        for token in before:
+            gap_start = start
+            while gap_start > 0 and lowered[gap_start - 1].isspace():
+                gap_start -= 1
+            if gap_start == start or not lowered.endswith(token, 0, gap_start):
+                break
+            start = gap_start - len(token)
+        else:
+            # Walk forward over the following tokens
+            end = pos + len(anchor)
+            for token in after:
+                gap = _WS_RUN_RE.match(lowered, end)
+                if gap is None or not lowered.startswith(token, gap.end()):
+                    break
+                end = gap.end() + len(token)
+            else:
+                return start, end
+        pos = lowered.find(anchor, pos + 1)
+    return None
+
+class EvidenceIndex:
+    """
+    A document prepared for repeated evidence lookups.
+    
+    On first use it builds a lowercased copy of the text with every whitespace
+    run collapsed to one space, plus the token offsets mapping it back to the
+    original. A case- and whitespace-insensitive quote lookup is then a plain
+    str.find instead of a freshly compiled regex scan per quote.
+    """
+    def __init__(self, text: str):
+        self.text = text
+        self._normalized: Optional[str] = None
+        self._norm_starts: List[int] = []
+        self._orig_starts: List[int] = []
+
+    def _build(self):
+        norm_starts, orig_starts, tokens = [], [], []
+        pos = 0
+        for match in _TOKEN_RE.finditer(self.text):
+            token = match.group()
+            norm_starts.append(pos)
+            orig_starts.append(match.start())
+            tokens.append(token)
+            pos += len(token) + 1
+        normalized = " ".join(tokens).lower()
+        # Lowercasing a few non-ASCII characters changes their length, which
+        # would break the offset mapping; such documents are not indexed
+        if len(normalized) != max(pos - 1, 0):
+            normalized = ""
+        self._norm_starts, self._orig_starts = norm_starts, orig_starts
+        self._normalized = normalized
+
+    def _to_original(self, pos: int) -> int:
+        k = bisect_right(self._norm_starts, pos) - 1
+        return self._orig_starts[k] + (pos - self._norm_starts[k])
+
+    def find(self, quote: str) -> Optional[tuple[int, int]]:
+        """
+        Finds quote ignoring case and whitespace differences.
+        Returns (start_index, end_index) in the original text or None.
+        """
+        if self._normalized is None:
+            self._build()
+        clean_quote = " ".join(quote.split()).lower()
+        if not clean_quote or not self._normalized:
+            return None
+        idx = self._normalized.find(clean_quote)
+        if idx == -1:
+            return None
+        return self._to_original(idx), self._to_original(idx + len(clean_quote) - 1) + 1
+
+def _collect_match_id(match_id: int, start: int, end: int, flags: int, context: set):
+    """Hyperscan match handler: record which pattern matched."""
+    context.add(match_id)
+
+def _chunk_offsets(text: str, chunk_size: int, overlap: int) -> List[tuple[int, int]]:
+    """
+    Computes the (start, end) offsets of overlapping chunks of text.
+    
+    Chunks end after the last space in their second half when there is one.
+    Kept separate from Chunk construction so the loop only does integer
+    arithmetic and C-level rfind calls.
+    """
+    offsets = []
+    text_len = len(text)
+    stride = chunk_size - overlap
+    min_break = chunk_size * 0.5
+    current_pos = 0
+    
+    while current_pos < text_len:
+        end_pos = min(current_pos + chunk_size, text_len)
+        
+        if end_pos < text_len:
+            last_space = text.rfind(' ', current_pos, end_pos)
+            if last_space != -1 and last_space > current_pos + min_break:
+                end_pos = last_space + 1
+        
+        offsets.append((current_pos, end_pos))
+        
+        next_pos = current_pos + stride
+        current_pos = next_pos if next_pos > current_pos else end_pos
+    
+    return offsets
+
 class LangExtractor:
     """
     Core engine for LangExtract.
@@ -50,15 +201,36 @@ class LangExtractor:
         self.chunk_size = chunk_size
         self.overlap = overlap
         
-        # Simple heuristics for section headers
-        self.section_patterns = {
-            SectionType.ABSTRACT: re.compile(r'^\s*(abstract|summary)\s*$', re.I | re.M),
-            SectionType.INTRODUCTION: re.compile(r'^\s*(introduction|background)\s*$', re.I | re.M),
-            SectionType.METHODS: re.compile(r'^\s*(methods|methodology|materials and methods)\s*$', re.I | re.M),
-            SectionType.RESULTS: re.compile(r'^\s*(results|findings)\s*$', re.I | re.M),
-            SectionType.DISCUSSION: re.compile(r'^\s*(discussion|conclusion)\s*$', re.I | re.M),
-            SectionType.REFERENCES: re.compile(r'^\s*(references|bibliography)\s*$', re.I | re.M),
+        # Simple heuristics for section headers, in priority order
+        section_headers = {
+            SectionType.ABSTRACT: r'abstract|summary',
+            SectionType.INTRODUCTION: r'introduction|background',
+            SectionType.METHODS: r'methods|methodology|materials and methods',
+            SectionType.RESULTS: r'results|findings',
+            SectionType.DISCUSSION: r'discussion|conclusion',
+            SectionType.REFERENCES: r'references|bibliography',
         }
+        # One alternation with a named group per section, so a window is scanned once
+        self._section_re = re.compile(
+            r'^\s*(?:' + '|'.join(f'(?P<{section.value}>{headers})' for section, headers in section_headers.items()) + r')\s*$',
+            re.I | re.M
+        )
+        self._section_priority = {section.value: rank for rank, section in enumerate(section_headers)}
+        
+        # Hyperscan scans all header patterns in one SIMD pass; pattern ids are
+        # the priority ranks. Scans share the database's scratch space, so they
+        # are serialized.
+        self._section_db = None
+        if hyperscan is not None:
+            self._sections = list(section_headers)
+            self._section_db = hyperscan.Database()
+            self._section_db.compile(
+                expressions=[rf'^\s*(?:{headers})\s*$'.encode('ascii') for headers in section_headers.values()],
+                ids=list(range(len(section_headers))),
+                elements=len(section_headers),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE] * len(section_headers)
+            )
+            self._section_db_lock = threading.Lock()
 
     def chunk_text(self, text: str) -> List[Chunk]:
         """
@@ -67,68 +239,117 @@ class LangExtractor:
         chunks = []
         if not text:
             return chunks
-            
-        current_pos = 0
-        chunk_id = 0
-        text_len = len(text)
+        
+        detect_section = self._detect_section
         current_section = SectionType.UNKNOWN
         
-        while current_pos < text_len:
-            end_pos = min(current_pos + self.chunk_size, text_len)
-            
-            if end_pos < text_len:
-                last_space = text.rfind(' ', current_pos, end_pos)
-                if last_space != -1 and last_space > current_pos + (self.chunk_size * 0.5):
-                    end_pos = last_space + 1
-            
-            chunk_text = text[current_pos:end_pos]
-            
-            # Detect section change within this chunk or implied from previous
-            found_section = self._detect_section(chunk_text)
+        for chunk_id, (start, end) in enumerate(_chunk_offsets(text, self.chunk_size, self.overlap)):
+            # Detect section change within this chunk or implied from previous;
+            # only the header window is copied out of the document
+            found_section = detect_section(text[start:min(end, start + 500)])
             if found_section != SectionType.UNKNOWN:
                 current_section = found_section
             
             chunks.append(Chunk(
-                text=chunk_text,
-                start_char=current_pos,
-                end_char=end_pos,
+                document=text,
+                start_char=start,
+                end_char=end,
                 id=chunk_id,
                 section_type=current_section
             ))
             
-            current_pos += (self.chunk_size - self.overlap)
-            if current_pos <= chunks[-1].start_char:
-                 current_pos = chunks[-1].end_char 
-            
-            chunk_id += 1
-            
         return chunks
 
+    def split_sections(self, text: str) -> List[Chunk]:
+        """
+        Splits text at section header lines into one chunk per section.
+        
+        Unlike chunk_text, which only looks for headers at the start of each
+        chunk, every header line is found. Text before the first header is
+        UNKNOWN.
+        """
+        sections = []
+        start = 0
+        section = SectionType.UNKNOWN
+        for match in self._section_re.finditer(text):
+            if match.start() > start:
+                sections.append(Chunk(
+                    document=text,
+                    start_char=start,
+                    end_char=match.start(),
+                    id=len(sections),
+                    section_type=section
+                ))
+            start = match.start()
+            section = SectionType(match.lastgroup)
+        
+        if start < len(text):
+            sections.append(Chunk(
+                document=text,
+                start_char=start,
+                end_char=len(text),
+                id=len(sections),
+                section_type=section
+            ))
+        return sections
+
     def _detect_section(self, text: str) -> SectionType:
         """Simple heuristic to detect if a chunk establishes a new section."""
-        # Check first 500 chars for headers
-        header_window = text[:500]
-        for section, pattern in self.section_patterns.items():
-            if pattern.search(header_window):
-                return section
-        return SectionType.UNKNOWN
-
-    def locate_evidence(self, text: str, quote: str, context_window: int = 100) -> Optional[Evidence]:
+        # Check first 500 chars for headers; if several match, the highest-priority one wins
+        if self._section_db is not None:
+            matched = set()
+            with self._section_db_lock:
+                self._section_db.scan(
+                    text[:500].encode('utf-8'),
+                    match_event_handler=_collect_match_id,
+                    context=matched
+                )
+            return self._sections[min(matched)] if matched else SectionType.UNKNOWN
+        
+        best = None
+        for match in self._section_re.finditer(text[:500]):
+            if best is None or self._section_priority[match.lastgroup] < self._section_priority[best]:
+                best = match.lastgroup
+        return SectionType(best) if best else SectionType.UNKNOWN
+
+    def build_index(self, text: str) -> EvidenceIndex:
+        """
+        Prepares a document for locating many quotes in it.
+        Pass the result to locate_evidence for every quote from the same text.
+        """
+        return EvidenceIndex(text)
+
+    def locate_evidence(
+        self,
+        text: str,
+        quote: str,
+        context_window: int = 100,
+        index: Optional[EvidenceIndex] = None,
+        search_range: Optional[tuple[int, int]] = None
+    ) -> Optional[Evidence]:
         """
         Locates a quote in the full text and returns an Evidence object.
         Uses exact match first, then falls back to fuzzy matching.
+        An index built from the same text speeds up the flexible-whitespace match.
+        If the caller knows roughly where the quote is (e.g. the bounds of its
+        source chunk), search_range=(start, end) limits the exact match to that
+        span; the whole text is searched only if it is not found there.
         """
         if not quote or not text:
             return None
-            
-        start_idx = text.find(quote)
+        
+        start_idx = -1
+        if search_range is not None:
+            start_idx = text.find(quote, max(0, search_range[0]), search_range[1])
+        if start_idx == -1:
+            start_idx = text.find(quote)
         end_idx = -1
         
         if start_idx != -1:
             end_idx = start_idx + len(quote)
         else:
             # Fallback to fuzzy matching
-            match = self._find_fuzzy_match(text, quote)
+            match = self._find_fuzzy_match(text, quote, index=index)
             if match:
                 start_idx, end_idx = match
         
@@ -153,7 +374,13 @@ class LangExtractor:
             context_after=context_after
         )
 
-    def _find_fuzzy_match(self, text: str, quote: str, threshold: float = 0.8) -> Optional[tuple[int, int]]:
+    def _find_fuzzy_match(
+        self,
+        text: str,
+        quote: str,
+        threshold: float = 0.8,
+        index: Optional[EvidenceIndex] = None
+    ) -> Optional[tuple[int, int]]:
         """
         Finds the best fuzzy match of quote in text. 
         Returns (start_index, end_index) or None.
@@ -169,25 +396,36 @@ class LangExtractor:
         if len(clean_quote) < 10: 
             return None # Too short for fuzzy match risk
             
-        # Quick heuristic: Regex search with flexible whitespace
+        # Quick heuristic: case-insensitive match with flexible whitespace
         # This handles newlines/spaces differences which are most common
-        try:
-            # Escape regex chars but replace spaces with \s+
-            regex_pattern = re.escape(clean_quote)
-            regex_pattern = regex_pattern.replace(r'\ ', r'\s+')
-            match = re.search(regex_pattern, text, re.IGNORECASE)
-            if match:
-                return match.span()
-        except Exception:
-            pass # Fallback to slower difflib
+        if index is not None:
+            span = index.find(clean_quote)
+        else:
+            span = _find_token_sequence(text, clean_quote.split())
+        if span:
+            return span
 
-        # Difflib approach
+        # rapidfuzz approach: best-scoring window of the text, in C++
+        if fuzz is not None:
+            alignment = fuzz.partial_ratio_alignment(clean_quote, text, score_cutoff=threshold * 100)
+            if alignment is not None:
+                return (alignment.dest_start, alignment.dest_end)
+            return None
+
+        # Difflib approach (rapidfuzz not installed)
         # We look for a block in text that matches quote.
-        # SequenceMatcher finds longest common substring, but we need the specific valid block.
-        matcher = difflib.SequenceMatcher(None, text, quote, autojunk=False)
-        match = matcher.find_longest_match(0, len(text), 0, len(quote))
+        # SequenceMatcher finds the longest common run of whole tokens; matching
+        # tokens rather than characters keeps both sequences several times shorter.
+        text_tokens = list(_TOKEN_RE.finditer(text))
+        quote_tokens = clean_quote.split()
+        matcher = difflib.SequenceMatcher(None, [m.group() for m in text_tokens], quote_tokens, autojunk=False)
+        match = matcher.find_longest_match(0, len(text_tokens), 0, len(quote_tokens))
+        if not match.size:
+            return None
         
-        if match.size / len(quote) > threshold:
-             return (match.a, match.a + match.size)
+        # Length of the matched run in the single-spaced quote
+        matched_len = sum(map(len, quote_tokens[match.b:match.b + match.size])) + match.size - 1
+        if matched_len / len(clean_quote) > threshold:
+            return (text_tokens[match.a].start(), text_tokens[match.a + match.size - 1].end())
              
         return None
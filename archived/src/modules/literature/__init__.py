@@ -19,49 +19,67 @@ Prompt Design:
 - Quality Guards for LLM behavior
 """
 
-# Data models (entities)
-from .entities import (
-    PaperMetadata,
-    ClassificationResult,
-    CategoryScore,
-    PaperCategory,
-    PRSModelExtraction,
-    HeritabilityExtraction,
-    GeneticCorrelationExtraction,
-    ExtractionResult,
-    ValidationResult,
-    ValidationIssue,
-    ValidationStatus,
-    WorkflowState,
-    DataSource,
-    PRSMethod,
-    HeritabilityMethod,
-    GeneticCorrelationMethod,
-)
+import importlib
 
-# PubMed client
-from .pubmed import PubMedClient
+# Public names are imported from their submodules on first access (PEP 562),
+# so importing one light symbol (e.g. PaperMetadata) does not pull in the
+# LLM clients, extractors and pipeline. Maps name -> (submodule, attribute).
+_LAZY = {
+    # Data models (entities)
+    "PaperMetadata": (".entities", "PaperMetadata"),
+    "ClassificationResult": (".entities", "ClassificationResult"),
+    "CategoryScore": (".entities", "CategoryScore"),
+    "PaperCategory": (".entities", "PaperCategory"),
+    "PRSModelExtraction": (".entities", "PRSModelExtraction"),
+    "HeritabilityExtraction": (".entities", "HeritabilityExtraction"),
+    "GeneticCorrelationExtraction": (".entities", "GeneticCorrelationExtraction"),
+    "ExtractionResult": (".entities", "ExtractionResult"),
+    "ValidationResult": (".entities", "ValidationResult"),
+    "ValidationIssue": (".entities", "ValidationIssue"),
+    "ValidationStatus": (".entities", "ValidationStatus"),
+    "WorkflowState": (".entities", "WorkflowState"),
+    "DataSource": (".entities", "DataSource"),
+    "PRSMethod": (".entities", "PRSMethod"),
+    "HeritabilityMethod": (".entities", "HeritabilityMethod"),
+    "GeneticCorrelationMethod": (".entities", "GeneticCorrelationMethod"),
+    # PubMed client
+    "PubMedClient": (".pubmed", "PubMedClient"),
+    # Classifiers
+    "PaperClassifier": (".paper_classifier", "PaperClassifier"),
+    "RuleBasedClassifier": (".paper_classifier", "RuleBasedClassifier"),
+    # Extractors
+    "PRSExtractor": (".information_extractor", "PRSExtractor"),
+    "H2Extractor": (".information_extractor", "HeritabilityExtractor"),
+    "RgExtractor": (".information_extractor", "GeneticCorrelationExtractor"),
+    "CombinedExtractor": (".information_extractor", "CombinedExtractor"),
+    "ExtractorFactory": (".information_extractor", "ExtractorFactory"),
+    "ExtractionCache": (".extraction_cache", "ExtractionCache"),
+    # Validator
+    "Validator": (".validator", "Validator"),
+    # Workflow
+    "LiteratureMiningWorkflow": (".pipeline", "LiteratureMiningWorkflow"),
+    "mine_literature": (".pipeline", "mine_literature"),
+    # Prompts and Schemas (for advanced users)
+    "get_prompt": (".prompts", "get_prompt"),
+    "format_user_prompt": (".prompts", "format_user_prompt"),
+    "PROMPTS": (".prompts", "PROMPTS"),
+    "get_schema": (".schemas", "get_schema"),
+    "ALL_SCHEMAS": (".schemas", "ALL_SCHEMAS"),
+}
 
-# Classifiers
-from .paper_classifier import PaperClassifier, RuleBasedClassifier
 
-# Extractors
-from .information_extractor import (
-    PRSExtractor,
-    HeritabilityExtractor as H2Extractor,
-    GeneticCorrelationExtractor as RgExtractor,
-    ExtractorFactory,
-)
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
 
-# Validator
-from .validator import Validator
 
-# Workflow
-from .pipeline import LiteratureMiningWorkflow, mine_literature
-
-# Prompts and Schemas (for advanced users)
-from .prompts import get_prompt, format_user_prompt, PROMPTS
-from .schemas import get_schema, ALL_SCHEMAS
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     # Data Models
@@ -88,7 +106,9 @@ __all__ = [
     "PRSExtractor",
     "H2Extractor",
     "RgExtractor",
+    "CombinedExtractor",
     "ExtractorFactory",
+    "ExtractionCache",
     "Validator",
     "LiteratureMiningWorkflow",
     "mine_literature",
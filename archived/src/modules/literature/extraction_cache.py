@@ -0,0 +1,113 @@
+"""
+Extraction Response Cache
+
+Content-addressable cache of parsed extraction responses, so re-running an
+extractor on a paper it has already processed costs no LLM call.
+
+Entries are keyed by a SHA-256 over everything that determines the response
+(provider, model, task, prompt version, paper and its text) and stored as
+JSON files under <root>/<model>/<sha[:2]>/<sha>.json. Recently used entries
+are also kept in memory.
+"""
+
+import os
+import json
+import struct
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pennprs"
+
+
+class ExtractionCache:
+    """
+    Disk cache of extraction response data with an in-memory LRU in front.
+
+    Usage:
+        cache = ExtractionCache()
+        key = ExtractionCache.make_key("openai", model, task, version, pmid, text)
+        data = cache.get(model, key)
+        if data is None:
+            data = ...  # LLM call
+            cache.put(model, key, data)
+    """
+
+    def __init__(self, root: Optional[Path] = None, memory_size: int = 256):
+        """
+        Args:
+            root: Cache directory (default ~/.cache/pennprs)
+            memory_size: Number of entries kept in memory
+        """
+        self.root = Path(root) if root is not None else DEFAULT_CACHE_DIR
+        self.memory_size = memory_size
+        self._memory: OrderedDict = OrderedDict()
+        self._memory_lock = threading.Lock()  # Cache may be shared across threads
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        SHA-256 hex digest of the parts.
+
+        Each part is length-prefixed, so no two different part lists
+        produce the same byte stream.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            data = str(part).encode("utf-8")
+            digest.update(struct.pack(">Q", len(data)))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, model: str, key: str) -> Path:
+        return self.root / model.replace("/", "_") / key[:2] / f"{key}.json"
+
+    def get(self, model: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response data for key, or None on a miss."""
+        memory_key = (model, key)
+        with self._memory_lock:
+            if memory_key in self._memory:
+                self._memory.move_to_end(memory_key)
+                return self._memory[memory_key]
+
+        try:
+            data = json.loads(self._path(model, key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable cached extraction {key}: {e}")
+            return None
+
+        self._remember(memory_key, data)
+        return data
+
+    def put(self, model: str, key: str, data: Dict[str, Any]):
+        """Store response data under key."""
+        path = self._path(model, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and rename it into place, so concurrent
+        # readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._remember((model, key), data)
+
+    def _remember(self, memory_key: tuple, data: Dict[str, Any]):
+        with self._memory_lock:
+            self._memory[memory_key] = data
+            self._memory.move_to_end(memory_key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
@@ -5,6 +5,7 @@ LLM-based extractors for structured data from paper full text:
 - PRSExtractor: Extract PRS model performance metrics
 - HeritabilityExtractor: Extract SNP-heritability estimates
 - GeneticCorrelationExtractor: Extract rg values between traits
+- CombinedExtractor: All three in a single LLM call per paper
 
 Uses structured prompting with JSON Schema constrained output.
 Each extractor runs independently and can be parallelized.
@@ -14,11 +15,33 @@ Classifier uses abstracts for initial classification; Extractors use full text f
 """
 
 import json
+import time
+import random
+import asyncio
 import logging
 import re
-from typing import List, Optional, Dict, Any, TypeVar
+import functools
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Callable, TypeVar
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # Fall back to not validating JSON-mode responses
+    fastjsonschema = None
+
+try:
+    import tiktoken
+except ImportError:  # Fall back to estimating 4 characters per token
+    tiktoken = None
+
 from .entities import (
     PaperMetadata,
     PRSModelExtraction,
@@ -29,17 +52,177 @@ from .entities import (
     GeneticCorrelationMethod,
     DataSource
 )
-from .prompts import get_prompt, format_user_prompt
+from .prompts import PROMPTS, get_prompt, format_user_prompt
 from .schemas import (
     PRS_EXTRACTION_SCHEMA,
     HERITABILITY_EXTRACTION_SCHEMA,
-    GENETIC_CORRELATION_EXTRACTION_SCHEMA
+    GENETIC_CORRELATION_EXTRACTION_SCHEMA,
+    COMBINED_EXTRACTION_SCHEMA,
+    ALL_SCHEMAS,
+    get_multi_paper_extraction_schema
 )
-from langchain_core.messages import SystemMessage, HumanMessage
-from src.lib.langextract import LangExtractor
+from .extraction_cache import ExtractionCache
+from .rate_limit import CHARS_PER_TOKEN, RequestThrottle, estimate_tokens, retry_after
+from openai import RateLimitError
+from src.lib.langextract import LangExtractor, EvidenceIndex, SectionType
 
 logger = logging.getLogger(__name__)
 
+# Sections that carry the reported estimates; from other sections only
+# paragraphs with numeric results are sent to the LLM (see contains_numeric)
+_RELEVANT_SECTIONS = frozenset({SectionType.METHODS, SectionType.RESULTS, SectionType.DISCUSSION})
+
+_NUMERIC_RESULT_RE = re.compile(
+    r"\d\.?\d*\s*(?:%|h2|h²|r2|auc)|(?:h2|h²|r2|rg|auc)\s*[=:]\s*-?\d",
+    re.IGNORECASE
+)
+
+
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+# A response wrapped in a markdown code block, e.g. ```json ... ``` or ```JSON ... ```
+_FENCE_RE = re.compile(r"^\s*```(?:json)?[ \t]*\n?(.*?)\s*```\s*$", re.DOTALL | re.IGNORECASE)
+
+
+def contains_numeric(text: str) -> bool:
+    """Whether text reports a numeric result (a percentage, h², r², rg or AUC value)."""
+    return _NUMERIC_RESULT_RE.search(text) is not None
+
+
+def _compile_task(task: str, schema: Optional[Dict[str, Any]]) -> tuple[Dict[str, str], Optional[str]]:
+    """
+    Build the system message and JSON-mode schema instructions for a task.
+    
+    Returns:
+        (system message, suffix appended to the user prompt in JSON mode or
+        None when the task has no schema)
+    """
+    system_message = {"role": "system", "content": get_prompt(task, "developer")}
+    if not schema:
+        return system_message, None
+    schema_json = json.dumps(schema["json_schema"]["schema"], indent=2)
+    schema_suffix = f"\n\nYou must output valid JSON strictly following this schema:\n```json\n{schema_json}\n```"
+    return system_message, schema_suffix
+
+
+@functools.lru_cache(maxsize=None)
+def _prompt_fingerprint(task: str) -> str:
+    """Hash of a task's prompts and schema: editing either invalidates cached extractions."""
+    return ExtractionCache.make_key(
+        get_prompt(task, "developer"),
+        get_prompt(task, "user_template"),
+        json.dumps(ALL_SCHEMAS.get(task), sort_keys=True)
+    )[:12]
+
+@functools.lru_cache(maxsize=None)
+def _get_client(config_key: str) -> tuple:
+    """
+    (config, model name, OpenAI client) for a config key.
+    
+    Shared by all extractors of the key, so they reuse one connection pool.
+    """
+    from openai import OpenAI
+    try:
+        from src.core.llm_config import get_config
+        config = get_config(config_key)
+        model_name = config.model
+        logger.debug(f"{config_key} using model: {model_name}")
+    except ImportError as e:
+        logger.warning(f"Could not import llm_config: {e}. Using default.")
+        config = None
+        model_name = "gpt-4o-mini"
+    return config, model_name, OpenAI()
+
+
+# Event loop -> {config key: AsyncOpenAI client}. An async client's connection
+# pool is bound to the loop it was first used in, so clients are shared per loop.
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(config_key: str, loop: asyncio.AbstractEventLoop):
+    """AsyncOpenAI client for a config key, shared within an event loop."""
+    clients = _ASYNC_CLIENTS.setdefault(loop, {})
+    if config_key not in clients:
+        from openai import AsyncOpenAI
+        clients[config_key] = AsyncOpenAI()
+    return clients[config_key]
+
+
+# Appended to paper text cut to fit the model's context window
+TRUNCATION_MARKER = "\n\n[TRUNCATED]"
+
+
+# (model, task) -> tokens of the prompt without the paper text
+_PROMPT_OVERHEAD_TOKENS: Dict[tuple, int] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding(model: str):
+    """
+    Tokenizer of a model, or None without tiktoken (or its encoding files).
+    
+    Cached, so each model's encoding is loaded (and a failure logged) once.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:  # Model unknown to this tiktoken version
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tokenizer for {model}, estimating tokens from length: {e}")
+        return None
+
+
+def _count_tokens(model: str, text: str) -> int:
+    """Number of tokens in text for a model (estimated without a tokenizer)."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@functools.lru_cache(maxsize=None)
+def _multi_paper_schema_suffix(task: str, n_papers: int) -> str:
+    """JSON-mode schema instructions for running a task on n_papers papers in one request."""
+    schema_json = json.dumps(get_multi_paper_extraction_schema(task, n_papers), indent=2)
+    return f"\n\nYou must output valid JSON strictly following this schema:\n```json\n{schema_json}\n```"
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_validator(task: str):
+    """Compiled validator for a task's schema; None without fastjsonschema or a known schema."""
+    schema = ALL_SCHEMAS.get(task)
+    if fastjsonschema is None or schema is None:
+        return None
+    return fastjsonschema.compile(schema["json_schema"]["schema"])
+
+
+def _to_float(value: Any, convert_percent: bool = True) -> Optional[float]:
+    """Float value of a response field, or None; percentages in (1, 100] become fractions."""
+    if value is None:
+        return None
+    try:
+        f = float(value)
+        if convert_percent and f > 1 and f <= 100:
+            f = f / 100
+        return f
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Integer value of a response field (thousands separators allowed), or None."""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, str):
+            value = value.replace(",", "").replace(" ", "")
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
 T = TypeVar('T', PRSModelExtraction, HeritabilityExtraction, GeneticCorrelationExtraction)
 
 
@@ -62,35 +245,84 @@ class BaseExtractor(ABC):
     # Each subclass defines its task name for prompt lookup
     MAX_RETRIES: int = 3
     TASK_NAME: str = ""
+    # Bump when a change outside the prompts/schema (e.g. the text sent)
+    # should invalidate cached responses
+    PROMPT_VERSION: str = "1"
     CONFIG_KEY: str = "literature_extractor"
     SCHEMA: Dict[str, Any] = None
     
+    # Batch extraction limits; the CONFIG_KEY config may override each one
+    # with an attribute of the same name in lower case.
+    # BATCH_SIZE papers share one request unless their texts together exceed
+    # MULTI_PAPER_MAX_CHARS (a paper longer than that is sent alone).
+    BATCH_SIZE: int = 4
+    MULTI_PAPER_MAX_CHARS: int = 100_000
+    MAX_CONCURRENCY: int = 8
+    # Paper text is truncated so prompt plus expected output fit in
+    # MAX_INPUT_TOKENS, keeping RESERVED_OUTPUT_TOKENS for the response
+    MAX_INPUT_TOKENS: int = 100_000
+    RESERVED_OUTPUT_TOKENS: int = 8_000
+    MAX_REQUESTS_PER_MINUTE: int = 500
+    MAX_TOKENS_PER_MINUTE: int = 200_000
+    
+    # Papers whose text is shorter than MIN_TEXT_CHARS, or has no match for
+    # KEYWORD_RE (None: no keyword screen), are not sent to the LLM
+    MIN_TEXT_CHARS: int = 200
+    KEYWORD_RE: Optional[re.Pattern] = None
+    
+    # Built once per subclass from TASK_NAME and SCHEMA (see __init_subclass__)
+    _SYSTEM_MESSAGE: Dict[str, str] = None
+    _SCHEMA_PROMPT_SUFFIX: Optional[str] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """Compile the subclass's system message and JSON-mode schema instructions."""
+        super().__init_subclass__(**kwargs)
+        if cls.TASK_NAME:
+            cls._SYSTEM_MESSAGE, cls._SCHEMA_PROMPT_SUFFIX = _compile_task(cls.TASK_NAME, cls.SCHEMA)
+    
 
-    def __init__(self):
-        """Initialize the extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None):
+        """
+        Initialize the extractor.
+        
+        Args:
+            cache: Optional cache of response data; papers already extracted
+                with the same model, prompts and text skip the LLM call
+        """
+        self.cache = cache
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
+        self._throttle = None
         self._model_name = None
         self._config = None
         self.lang_extractor = LangExtractor()
+        # (index, quote -> evidence HTML) of the last paper text evidence was
+        # located in; replaced as a whole, so threads never mix two papers' state
+        self._evidence: Optional[tuple[EvidenceIndex, Dict[str, Optional[str]]]] = None
     
     @property
     def client(self):
         """Lazy initialization of OpenAI client from centralized config."""
         if self._client is None:
-            try:
-                from src.core.llm_config import get_config
-                from openai import OpenAI
-                self._config = get_config(self.CONFIG_KEY)
-                self._model_name = self._config.model
-                self._client = OpenAI()
-                logger.debug(f"{self.__class__.__name__} using model: {self._model_name}")
-            except ImportError as e:
-                logger.warning(f"Could not import llm_config: {e}. Using default.")
-                from openai import OpenAI
-                self._client = OpenAI()
-                self._model_name = "gpt-4o-mini"
+            self._config, self._model_name, self._client = _get_client(self.CONFIG_KEY)
         return self._client
     
+    @property
+    def async_client(self):
+        """
+        Lazy initialization of the AsyncOpenAI client used by aextract.
+        
+        Its connection pool is bound to the event loop it was first used in,
+        so a client is shared per loop (e.g. per extract_batch call).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            _ = self.client  # Load config and model name
+            self._async_client = _get_async_client(self.CONFIG_KEY, loop)
+            self._async_client_loop = loop
+        return self._async_client
+    
     @property
     def model_name(self) -> str:
         """Get the model name being used."""
@@ -98,106 +330,543 @@ class BaseExtractor(ABC):
             _ = self.client
         return self._model_name or "unknown"
     
+    def _setting(self, name: str) -> Any:
+        """Batch limit `name` from the LLM config, or the class default."""
+        _ = self.client  # Load config
+        return getattr(self._config, name.lower(), getattr(self, name))
+    
+    @property
+    def throttle(self) -> RequestThrottle:
+        """Requests/tokens-per-minute limiter shared by this extractor's async requests."""
+        if self._throttle is None:
+            self._throttle = RequestThrottle(
+                self._setting("MAX_REQUESTS_PER_MINUTE"),
+                self._setting("MAX_TOKENS_PER_MINUTE")
+            )
+        return self._throttle
+    
     @abstractmethod
     def _parse_response(self, paper: PaperMetadata, response_data: Dict) -> List[T]:
         """Parse LLM response into extraction objects."""
         pass
     
-    def extract(self, paper: PaperMetadata) -> List[T]:
-        """
-        Extract structured data from a paper.
+    def _text_content(self, paper: PaperMetadata) -> str:
+        """Text sent to the LLM for a paper."""
+        # Use the relevant parts of the full text if available, otherwise fall back to abstract
+        if hasattr(paper, 'full_text') and paper.full_text:
+            text_content = self._relevant_text(paper.full_text)
+        else:
+            text_content = paper.abstract
+        if not text_content:
+            return "(No content available)"
+        return self._truncate(text_content)
+    
+    def _prompt_overhead_tokens(self) -> int:
+        """Tokens of the single-paper prompt apart from the paper text."""
+        key = (self.model_name, self.TASK_NAME)
+        overhead = _PROMPT_OVERHEAD_TOKENS.get(key)
+        if overhead is None:
+            fixed_text = (
+                self._SYSTEM_MESSAGE["content"]
+                + (self._SCHEMA_PROMPT_SUFFIX or "")
+                + get_prompt(self.TASK_NAME, "user_template")
+            )
+            overhead = _PROMPT_OVERHEAD_TOKENS[key] = _count_tokens(self.model_name, fixed_text)
+        return overhead
+    
+    def _truncate(self, text: str) -> str:
+        """Cut text to the token budget left by the prompt and reserved output."""
+        budget = (
+            self._setting("MAX_INPUT_TOKENS")
+            - self._prompt_overhead_tokens()
+            - self._setting("RESERVED_OUTPUT_TOKENS")
+        )
+        # A token is at least one character, so short texts need no tokenizing
+        if len(text) <= budget:
+            return text
         
-        Args:
-            paper: Paper metadata with title and full text content
+        encoding = _encoding(self.model_name)
+        if encoding is None:
+            if len(text) <= budget * CHARS_PER_TOKEN:
+                return text
+            truncated = text[:budget * CHARS_PER_TOKEN]
+        else:
+            tokens = encoding.encode(text, disallowed_special=())
+            if len(tokens) <= budget:
+                return text
+            truncated = encoding.decode(tokens[:budget])
         
-        Returns:
-            List of extracted data objects (may be empty)
+        logger.warning(f"{self.__class__.__name__}: Truncated paper text to {budget} tokens")
+        return truncated + TRUNCATION_MARKER
+    
+    def _build_request(self, paper: PaperMetadata) -> Dict[str, Any]:
         """
-        # Get prompts
-        developer_prompt = get_prompt(self.TASK_NAME, "developer")
+        Build the chat completion arguments for extracting from a paper.
         
-        # Use full text if available, otherwise fall back to abstract
-        text_content = paper.full_text if hasattr(paper, 'full_text') and paper.full_text else paper.abstract
-        if not text_content:
-            text_content = "(No content available)"
+        Returns:
+            Keyword arguments for chat.completions.create (strict-mode
+            requests are sent through the Responses API, see _complete)
+        """
+        model = self.model_name  # Loads the config, which selects strict mode
         
         user_prompt = format_user_prompt(
             self.TASK_NAME,
             pmid=paper.pmid,
             title=paper.title,
-            text=text_content,  # Full text or abstract as fallback
+            text=self._text_content(paper),  # Full text or abstract as fallback
             journal=paper.journal or "Unknown",
             year=paper.publication_date.year if paper.publication_date else "Unknown"
         )
         
-        try:
-            messages = [
-                {"role": "system", "content": developer_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-            
-            # Use structured output to enforce schema if available
-            if self.SCHEMA:
-                # Check for strict mode configuration
-                is_strict = getattr(self._config, 'strict', False)
-                
-                if is_strict:
-                    # STRICT MODE: Use standard create with json_schema response_format
-                    response = self.client.chat.completions.create(
-                        model=self.model_name,
-                        messages=messages,
-                        response_format=self.SCHEMA
-                    )
-                    
-                    content = response.choices[0].message.content
-                    data = self._parse_json(content)
-                        
-                else:
-                    # LEGACY JSON MODE
-                    # Add schema instructions to prompt for robust text-based extraction
-                    schema_json = json.dumps(self.SCHEMA["json_schema"]["schema"], indent=2)
-                    prompt_suffix = f"\n\nYou must output valid JSON strictly following this schema:\n```json\n{schema_json}\n```"
-                    
-                    # Append to the last user message
-                    if isinstance(messages[-1], HumanMessage):
-                        messages[-1].content += prompt_suffix
-                    elif isinstance(messages[-1], dict) and messages[-1].get("role") == "user":
-                        messages[-1]["content"] += prompt_suffix
-                    
-                    response = self.client.chat.completions.create(
-                        model=self.model_name,
-                        messages=messages,
-                        response_format={"type": "json_object"}
-                    )
-                    
-                    content = response.choices[0].message.content
-                    data = self._parse_json(content)
-
-            else:
-                # No schema - standard generation
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=messages
-                )
-                content = response.choices[0].message.content
-                data = self._parse_json(content)
-                
-            if data is None:
-                return []
+        messages = [
+            self._SYSTEM_MESSAGE,
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        # Use structured output to enforce schema if available
+        if not self.SCHEMA:
+            # No schema - standard generation
+            return {"model": model, "messages": messages}
+        
+        # Check for strict mode configuration
+        if getattr(self._config, 'strict', False):
+            # STRICT MODE: The API enforces the json_schema response_format
+            return {"model": model, "messages": messages, "response_format": self.SCHEMA}
+        
+        # LEGACY JSON MODE
+        # Add schema instructions to the user prompt for robust text-based extraction
+        messages[-1]["content"] += self._SCHEMA_PROMPT_SUFFIX
+        
+        return {"model": model, "messages": messages, "response_format": {"type": "json_object"}}
+    
+    def _cache_key(self, paper: PaperMetadata) -> str:
+        """
+        Cache key of a paper's response under the current model and prompts.
+        
+        Covers the text actually sent (after section filtering and truncation)
+        and the response mode, so changing either misses the cache.
+        """
+        model = self.model_name  # Loads the config, which selects strict mode
+        return ExtractionCache.make_key(
+            "openai",
+            model,
+            self.TASK_NAME,
+            f"{self.PROMPT_VERSION}:{_prompt_fingerprint(self.TASK_NAME)}",
+            "strict" if getattr(self._config, 'strict', False) else "json",
+            paper.pmid,
+            self._text_content(paper)
+        )
+    
+    def _request(self, paper: PaperMetadata) -> Optional[Dict]:
+        """
+        Send the paper to the LLM and return the parsed JSON response.
+        
+        Returns:
+            Response data, or None if the response is not valid JSON
+        """
+        if self.cache is not None:
+            key = self._cache_key(paper)
+            cached = self.cache.get(self.model_name, key)
+            if cached is not None:
+                return cached
+        
+        request = self._build_request(paper)
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                content = self._complete(request)
+            except RateLimitError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(self._backoff(paper, attempt, e))
+                continue
             
-            results = self._parse_response(paper, data)
-
+            data, error = self._check_response(request, content)
+            if error is None:
+                break
+            logger.warning(f"Invalid response for PMID:{paper.pmid} (attempt {attempt + 1}): {error}")
+            request = self._with_feedback(request, content, error)
+        
+        if self.cache is not None and data is not None and error is None:
+            self.cache.put(self.model_name, key, data)
+        return data
+    
+    async def _arequest(self, paper: PaperMetadata) -> Optional[Dict]:
+        """Async counterpart of _request, throttled to the configured rate limits."""
+        if self.cache is not None:
+            key = self._cache_key(paper)
+            cached = self.cache.get(self.model_name, key)
+            if cached is not None:
+                return cached
+        
+        request = self._build_request(paper)
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self.throttle.acquire(estimate_tokens(request["messages"]))
+            try:
+                content = await self._acomplete(request)
+            except RateLimitError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self._backoff(paper, attempt, e))
+                continue
             
-            logger.info(
+            data, error = self._check_response(request, content)
+            if error is None:
+                break
+            logger.warning(f"Invalid response for PMID:{paper.pmid} (attempt {attempt + 1}): {error}")
+            request = self._with_feedback(request, content, error)
+        
+        if self.cache is not None and data is not None and error is None:
+            self.cache.put(self.model_name, key, data)
+        return data
+    
+    @staticmethod
+    def _responses_kwargs(request: Dict[str, Any]) -> Dict[str, Any]:
+        """Responses API arguments for a strict-mode chat completion request."""
+        json_schema = request["response_format"]["json_schema"]
+        return {
+            "model": request["model"],
+            "input": request["messages"],
+            "text": {
+                "format": {
+                    "type": "json_schema",
+                    "name": json_schema["name"],
+                    "schema": json_schema["schema"],
+                    "strict": json_schema.get("strict", True)
+                }
+            }
+        }
+    
+    def _complete(self, request: Dict[str, Any]) -> str:
+        """
+        Send a request built by _build_request and return the response text.
+        
+        Strict-mode requests use the Responses API's native structured output,
+        which constrains decoding to the schema; others use chat completions.
+        """
+        if request.get("response_format", {}).get("type") == "json_schema":
+            response = self.client.responses.create(**self._responses_kwargs(request))
+            return response.output_text
+        response = self.client.chat.completions.create(**request)
+        return response.choices[0].message.content
+    
+    async def _acomplete(self, request: Dict[str, Any]) -> str:
+        """Async counterpart of _complete."""
+        if request.get("response_format", {}).get("type") == "json_schema":
+            response = await self.async_client.responses.create(**self._responses_kwargs(request))
+            return response.output_text
+        response = await self.async_client.chat.completions.create(**request)
+        return response.choices[0].message.content
+    
+    @staticmethod
+    def _backoff(paper: PaperMetadata, attempt: int, error: RateLimitError) -> float:
+        """Delay after a rate-limited attempt: the API's Retry-After, else exponential backoff with jitter."""
+        delay = retry_after(error)
+        if delay is None:
+            delay = 2 ** attempt + random.random()
+        logger.warning(f"Rate limit hit for PMID:{paper.pmid}, retrying in {delay:.1f}s")
+        return delay
+    
+    def _check_response(self, request: Dict[str, Any], content: Optional[str]) -> tuple[Optional[Dict], Optional[str]]:
+        """
+        Parse a response and check it against the task schema.
+        
+        Returns:
+            (data, error), where error is None for a usable response
+        """
+        try:
+            data = self._load_json(content or "")
+        except json.JSONDecodeError as e:  # Also raised by orjson
+            return None, f"invalid JSON ({e})"
+        return data, self._schema_error(request, data)
+    
+    def _schema_error(self, request: Dict[str, Any], data: Optional[Dict]) -> Optional[str]:
+        """
+        Check JSON-mode response data against the task schema.
+        
+        Strict mode is enforced by the API, so only JSON-mode responses are
+        checked, and only when fastjsonschema is installed.
+        
+        Returns:
+            The violation message, or None if the data conforms or is not checked
+        """
+        if data is None or request.get("response_format") != {"type": "json_object"}:
+            return None
+        validate = _schema_validator(self.TASK_NAME)
+        if validate is None:
+            return None
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException as e:
+            return e.message
+        return None
+    
+    @staticmethod
+    def _with_feedback(request: Dict[str, Any], content: str, error: str) -> Dict[str, Any]:
+        """The request extended with the rejected response and a correction turn."""
+        return {
+            **request,
+            "messages": [
+                *request["messages"],
+                {"role": "assistant", "content": content or ""},
+                {"role": "user", "content": f"Your JSON output had an error: {error}. Fix it and reply with valid JSON only."}
+            ]
+        }
+    
+    def _no_results(self) -> List[T]:
+        """Result of an extraction that produced nothing."""
+        return []
+    
+    def _results_from(self, paper: PaperMetadata, data: Optional[Dict]) -> List[T]:
+        """Parse response data into extractions and log the count."""
+        if data is None:
+            return self._no_results()
+        
+        results = self._parse_response(paper, data)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 f"{self.__class__.__name__}: Extracted {len(results)} items "
                 f"from PMID:{paper.pmid}"
             )
-            
-            return results
-            
+        
+        return results
+    
+    def _item_counts(self, extractions: List[T]) -> Counter:
+        """Number of extracted items of a paper, by item type."""
+        return Counter(items=len(extractions))
+    
+    def _log_batch_summary(self, extractions_by_index: List[Any]):
+        """Log one line with the items extracted from a batch of papers."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        totals = Counter()
+        papers_with_items = 0
+        for extractions in extractions_by_index:
+            counts = self._item_counts(extractions or self._no_results())
+            totals.update(counts)
+            papers_with_items += any(counts.values())
+        logger.info(
+            f"{self.__class__.__name__}: Extracted "
+            + ", ".join(f"{count} {name}" for name, count in totals.items())
+            + f" from {papers_with_items} of {len(extractions_by_index)} papers"
+        )
+    
+    def _is_extractable(self, text: Optional[str]) -> bool:
+        """Whether a paper's text can plausibly contain the task's results."""
+        if not text or len(text) < self.MIN_TEXT_CHARS:
+            return False
+        return self.KEYWORD_RE is None or self.KEYWORD_RE.search(text) is not None
+    
+    def _skip(self, paper: PaperMetadata) -> bool:
+        """True (and logged) if a paper is not worth an LLM request."""
+        if self._is_extractable(self._evidence_text(paper)):
+            return False
+        logger.debug(f"{self.__class__.__name__}: Skipping PMID:{paper.pmid}, no extractable text")
+        return True
+    
+    def extract(self, paper: PaperMetadata) -> List[T]:
+        """
+        Extract structured data from a paper.
+        
+        Args:
+            paper: Paper metadata with title and full text content
+        
+        Returns:
+            List of extracted data objects (may be empty)
+        """
+        if self._skip(paper):
+            return self._no_results()
+        try:
+            return self._results_from(paper, self._request(paper))
+        except Exception as e:
+            logger.error(f"Extraction error for PMID:{paper.pmid}: {e}")
+            return self._no_results()
+    
+    async def aextract(self, paper: PaperMetadata) -> List[T]:
+        """
+        Extract structured data from a paper on the AsyncOpenAI client.
+        
+        Same prompts and parsing as extract(); the request waits for the
+        extractor's rate-limit throttle.
+        """
+        if self._skip(paper):
+            return self._no_results()
+        try:
+            return self._results_from(paper, await self._arequest(paper))
         except Exception as e:
             logger.error(f"Extraction error for PMID:{paper.pmid}: {e}")
-            return []
+            return self._no_results()
+    
+    def _build_multi_request(self, papers: List[PaperMetadata]) -> Dict[str, Any]:
+        """Build the JSON-mode chat completion arguments for extracting from several papers at once."""
+        papers_text = "\n\n".join(
+            f"--- PAPER {paper.pmid} START ---\n"
+            f"TITLE: {paper.title}\n"
+            f"PUBLICATION: {paper.journal or 'Unknown'}, "
+            f"{paper.publication_date.year if paper.publication_date else 'Unknown'}\n\n"
+            f"{self._text_content(paper)}\n"
+            f"--- PAPER {paper.pmid} END ---"
+            for paper in papers
+        )
+        user_prompt = get_prompt(self.TASK_NAME, "multi_user_template").format(
+            n_papers=len(papers),
+            papers_text=papers_text
+        )
+        
+        return {
+            "model": self.model_name,
+            "messages": [
+                self._SYSTEM_MESSAGE,
+                {"role": "user", "content": user_prompt + _multi_paper_schema_suffix(self.TASK_NAME, len(papers))}
+            ],
+            "response_format": {"type": "json_object"}
+        }
+    
+    async def aextract_chunk(self, papers: List[PaperMetadata]) -> List[List[T]]:
+        """
+        Extract from several papers with a single LLM request.
+        
+        The developer prompt and schema are sent once for the whole chunk
+        instead of once per paper; cached papers are left out of the request.
+        Papers the response does not cover or covers with invalid data (or
+        all of them, if the request fails) are extracted individually with
+        aextract, which also returns no results for papers _is_extractable
+        rejects (these are left out of the request).
+        
+        Args:
+            papers: Papers to extract from together
+        
+        Returns:
+            Extractions of each paper, in the same order as input papers
+        """
+        data_by_pmid: Dict[str, Dict] = {}
+        if self.cache is not None:
+            for paper in papers:
+                cached = self.cache.get(self.model_name, self._cache_key(paper))
+                if cached is not None:
+                    data_by_pmid[paper.pmid] = cached
+        pending = [
+            paper for paper in papers
+            if paper.pmid not in data_by_pmid and self._is_extractable(self._evidence_text(paper))
+        ]
+        
+        if len(pending) > 1:
+            try:
+                request = self._build_multi_request(pending)
+                await self.throttle.acquire(estimate_tokens(request["messages"]))
+                data = self._parse_json(await self._acomplete(request))
+                
+                pmids = {paper.pmid for paper in pending}
+                validate = _schema_validator(self.TASK_NAME)
+                for entry in (data or {}).get("papers", []):
+                    pmid = str(entry.pop("pmid", ""))
+                    if pmid not in pmids:
+                        continue
+                    if validate is not None:
+                        try:
+                            validate(entry)
+                        except fastjsonschema.JsonSchemaException as e:
+                            logger.warning(f"Schema violation for PMID:{pmid} in {len(pending)}-paper chunk: {e.message}")
+                            continue
+                    data_by_pmid[pmid] = entry
+                
+                if self.cache is not None:
+                    for paper in pending:
+                        if paper.pmid in data_by_pmid:
+                            self.cache.put(self.model_name, self._cache_key(paper), data_by_pmid[paper.pmid])
+            
+            except Exception as e:
+                logger.warning(f"Error extracting from {len(pending)}-paper chunk, falling back to single papers: {e}")
+        
+        results = []
+        for paper in papers:
+            data = data_by_pmid.get(paper.pmid)
+            if data is None:
+                results.append(await self.aextract(paper))
+            else:
+                results.append(self._results_from(paper, data))
+        return results
+    
+    def _chunks(self, papers: List[PaperMetadata]) -> List[List[PaperMetadata]]:
+        """
+        Group papers into request chunks within BATCH_SIZE and MULTI_PAPER_MAX_CHARS.
+        
+        Multi-paper requests use JSON mode, so in strict mode every paper is
+        its own chunk and keeps the API-enforced schema.
+        """
+        batch_size = self._setting("BATCH_SIZE")
+        max_chars = self._setting("MULTI_PAPER_MAX_CHARS")  # Also loads the config
+        if (
+            batch_size <= 1
+            or getattr(self._config, 'strict', False)
+            or "multi_user_template" not in PROMPTS.get(self.TASK_NAME, {})
+        ):
+            return [[paper] for paper in papers]
+        
+        chunks = []
+        chunk: List[PaperMetadata] = []
+        chunk_chars = 0
+        for paper in papers:
+            # Length before section filtering: an upper bound on the text sent
+            chars = len((paper.full_text if hasattr(paper, 'full_text') and paper.full_text else paper.abstract) or "")
+            if chunk and (len(chunk) >= batch_size or chunk_chars + chars > max_chars):
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            chunk.append(paper)
+            chunk_chars += chars
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
+    async def aextract_batch(
+        self,
+        papers: List[PaperMetadata],
+        progress_callback: Optional[callable] = None
+    ) -> Dict[str, List[T]]:
+        """
+        Extract from multiple papers concurrently.
+        
+        Papers are grouped into chunks of up to BATCH_SIZE, each extracted
+        with one request (aextract_chunk). At most MAX_CONCURRENCY requests
+        are in flight, within the MAX_REQUESTS_PER_MINUTE /
+        MAX_TOKENS_PER_MINUTE limits.
+        
+        Args:
+            papers: List of papers to process
+            progress_callback: Optional callback(completed, total), called as
+                each chunk finishes (in completion order)
+        
+        Returns:
+            Dict mapping PMID to list of extractions, in input order
+        """
+        total = len(papers)
+        sem = asyncio.Semaphore(self._setting("MAX_CONCURRENCY"))
+        
+        async def extract_at(start: int, chunk: List[PaperMetadata]):
+            async with sem:
+                return start, await self.aextract_chunk(chunk)
+        
+        extractions_by_index = [None] * total
+        tasks = []
+        start = 0
+        for chunk in self._chunks(papers):
+            tasks.append(extract_at(start, chunk))
+            start += len(chunk)
+        
+        completed = 0
+        for next_done in asyncio.as_completed(tasks):
+            start, chunk_extractions = await next_done
+            extractions_by_index[start:start + len(chunk_extractions)] = chunk_extractions
+            completed += len(chunk_extractions)
+            if progress_callback:
+                progress_callback(completed, total)
+        
+        self._log_batch_summary(extractions_by_index)
+        return {
+            paper.pmid: extractions
+            for paper, extractions in zip(papers, extractions_by_index)
+            if extractions
+        }
     
     def extract_batch(
         self,
@@ -207,40 +876,54 @@ class BaseExtractor(ABC):
         """
         Extract from multiple papers.
         
+        Runs aextract_batch in a new event loop. When called from inside a
+        running event loop (e.g. a notebook), where that is impossible, papers
+        are extracted with extract() on up to MAX_CONCURRENCY threads instead;
+        async callers should await aextract_batch.
+        
         Args:
             papers: List of papers to process
-            progress_callback: Optional callback(current, total)
+            progress_callback: Optional callback(completed, total)
         
         Returns:
-            Dict mapping PMID to list of extractions
+            Dict mapping PMID to list of extractions, in input order
         """
-        results = {}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aextract_batch(papers, progress_callback))
+        
         total = len(papers)
+        extractions_by_index = [None] * total
         
-        for i, paper in enumerate(papers):
-            extractions = self.extract(paper)
-            if extractions:
-                results[paper.pmid] = extractions
-            
-            if progress_callback:
-                progress_callback(i + 1, total)
+        # Requests spend their time waiting on the API with the GIL released,
+        # so threads overlap them nearly linearly
+        with ThreadPoolExecutor(max_workers=self._setting("MAX_CONCURRENCY")) as executor:
+            futures = {executor.submit(self.extract, paper): i for i, paper in enumerate(papers)}
+            for completed, future in enumerate(as_completed(futures), 1):
+                extractions_by_index[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(completed, total)
         
-        return results
+        self._log_batch_summary(extractions_by_index)
+        return {
+            paper.pmid: extractions
+            for paper, extractions in zip(papers, extractions_by_index)
+            if extractions
+        }
+    
+    @staticmethod
+    def _load_json(content: str) -> Any:
+        """Decode a JSON response, unwrapping a markdown code block; raises JSONDecodeError."""
+        match = _FENCE_RE.match(content)
+        text = match.group(1) if match else content.strip()
+        return orjson.loads(text) if orjson is not None else json.loads(text)
     
     def _parse_json(self, content: str) -> Optional[Dict]:
         """Parse JSON from LLM response, handling code blocks."""
         try:
-            # Handle markdown code blocks
-            text = content.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            
-            return json.loads(text.strip())
-        except json.JSONDecodeError as e:
+            return self._load_json(content)
+        except json.JSONDecodeError as e:  # Also raised by orjson
             logger.warning(f"JSON parse error: {e}")
             logger.debug(f"Content: {content[:500]}")
             return None
@@ -251,45 +934,147 @@ class BaseExtractor(ABC):
     
     def _parse_float(self, value: Any, convert_percent: bool = True) -> Optional[float]:
         """Safely parse a float value."""
-        if value is None:
-            return None
-        try:
-            f = float(value)
-            if convert_percent and f > 1 and f <= 100:
-                f = f / 100
-            return f
-        except (ValueError, TypeError):
-            return None
+        return _to_float(value, convert_percent)
     
     def _parse_int(self, value: Any) -> Optional[int]:
         """Safely parse an integer value."""
-        if value is None:
-            return None
-        try:
-            if isinstance(value, str):
-                value = value.replace(",", "").replace(" ", "")
-            return int(float(value))
-        except (ValueError, TypeError):
-            return None
+        return _to_int(value)
 
-    def _get_evidence_html(self, paper: PaperMetadata, snippet: Optional[str]) -> Optional[str]:
-        """Generate HTML evidence snippet if text is available."""
+    def _relevant_text(self, full_text: str) -> str:
+        """
+        Reduce full text to the parts likely to hold extractable data.
+        
+        Keeps the Methods, Results and Discussion sections whole and, from the
+        other sections, only paragraphs with numeric results (e.g. tables).
+        Papers without any of those section headers are kept whole, since
+        their structure is unknown.
+        """
+        sections = self.lang_extractor.split_sections(full_text)
+        if not any(section.section_type in _RELEVANT_SECTIONS for section in sections):
+            return full_text
+        
+        parts = []
+        for section in sections:
+            if section.section_type in _RELEVANT_SECTIONS:
+                parts.append(section.text.strip())
+            else:
+                parts.extend(
+                    paragraph.strip()
+                    for paragraph in _PARAGRAPH_BREAK_RE.split(section.text)
+                    if contains_numeric(paragraph)
+                )
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _evidence_text(paper: PaperMetadata) -> Optional[str]:
+        """Text in which extraction quotes are located: the full text, else the abstract."""
+        return paper.full_text if hasattr(paper, 'full_text') and paper.full_text else paper.abstract
+    
+    def _get_evidence_html(
+        self,
+        paper: PaperMetadata,
+        snippet: Optional[str],
+        text_content: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Generate HTML evidence snippet if text is available.
+        
+        Args:
+            paper: Paper the snippet was extracted from
+            snippet: Quoted source text
+            text_content: The paper's _evidence_text, if the caller already has it
+        """
         if not snippet:
             return None
         
-        text_content = paper.full_text if hasattr(paper, 'full_text') and paper.full_text else paper.abstract
+        if text_content is None:
+            text_content = self._evidence_text(paper)
         if not text_content:
             return None
             
-        evidence = self.lang_extractor.locate_evidence(text_content, snippet)
-        if evidence:
-            return evidence.to_html_snippet()
-        return None
+        # Every extraction from a paper locates its quote in the same text,
+        # so the index is built once per paper and reused, and a quote cited
+        # by several extractions (e.g. one table row for AUC and R²) is
+        # located only once
+        state = self._evidence
+        if state is None or state[0].text is not text_content:
+            state = self._evidence = (self.lang_extractor.build_index(text_content), {})
+        index, html_by_quote = state
+        if snippet in html_by_quote:
+            return html_by_quote[snippet]
+        
+        evidence = self.lang_extractor.locate_evidence(text_content, snippet, index=index)
+        html = evidence.to_html_snippet() if evidence else None
+        html_by_quote[snippet] = html
+        return html
 
 # ============================================================================
 # PRS Extractor
 # ============================================================================
 
+def _normalize_prs_method(method: str) -> str:
+    """Method name compared case-, hyphen- and plus-insensitively ("C+T" -> "CT")."""
+    return method.upper().replace("-", "").replace("+", "")
+
+
+# Normalized method name -> enum, so parsing a method is one dict lookup
+_PRS_METHODS = {
+    _normalize_prs_method(name): method
+    for name, method in {
+        "PRS-CS": PRSMethod.PRS_CS,
+        "LDpred2": PRSMethod.LDPRED2,
+        "C+T": PRSMethod.CT,
+        "P+T": PRSMethod.CT,
+        "lassosum": PRSMethod.LASSOSUM,
+        "PRSice": PRSMethod.PRSICE,
+        "SBayesR": PRSMethod.SBAYESR,
+    }.items()
+}
+
+def _to_prs_method(method: Optional[str]) -> Optional[PRSMethod]:
+    """PRS method enum of a method name (OTHER if unknown)."""
+    if not method:
+        return None
+    return _PRS_METHODS.get(_normalize_prs_method(method), PRSMethod.OTHER)
+
+
+# PRSModelExtraction field, (object, key) path of its value in a response item,
+# and the coercion applied to the value (None to keep it as is)
+_PRS_FIELD_SPEC: List[tuple[str, tuple[str, str], Optional[Callable[[Any], Any]]]] = [
+    ("auc", ("performance_metrics", "auc"), _to_float),
+    ("r2", ("performance_metrics", "r2"), _to_float),
+    ("c_index", ("performance_metrics", "c_index"), _to_float),
+    ("or_per_sd", ("performance_metrics", "or_per_sd"), functools.partial(_to_float, convert_percent=False)),
+    ("variants_number", ("model_characteristics", "variants_number"), _to_int),
+    ("method", ("model_characteristics", "method"), _to_prs_method),
+    ("method_detail", ("model_characteristics", "method_detail"), None),
+    ("sample_size", ("population", "sample_size"), _to_int),
+    ("ancestry", ("population", "ancestry"), None),
+    ("cohort", ("population", "cohort"), None),
+    ("gwas_id", ("gwas_source", "gwas_id"), None),
+]
+
+
+def _group_field_spec(spec: List[tuple]) -> Dict[str, List[tuple]]:
+    """Field spec grouped as {object: [(field, key, coercion), ...]}."""
+    groups: Dict[str, List[tuple]] = {}
+    for name, (obj, key), coerce in spec:
+        groups.setdefault(obj, []).append((name, key, coerce))
+    return groups
+
+
+# Walked once per extraction, looking up each object of the item only once.
+# This is not a pydantic model with AliasPath fields and BeforeValidator
+# coercions: the coercions run as Python functions either way, and calling
+# them from pydantic-core is about 1.4x slower than this loop.
+_PRS_FIELDS = _group_field_spec(_PRS_FIELD_SPEC)
+
+# Terms at least one of which any paper reporting PRS performance mentions
+_PRS_KEYWORD_RE = re.compile(
+    r"\b(?:AUC|AUROC|R\^?2|R²|c-?index|c-?statistic|polygenic|PRS|PGS)",
+    re.IGNORECASE
+)
+
 class PRSExtractor(BaseExtractor):
     """
     Extract PRS model performance data from papers.
@@ -299,6 +1084,7 @@ class PRSExtractor(BaseExtractor):
     
     TASK_NAME = "prs_extraction"
     SCHEMA = PRS_EXTRACTION_SCHEMA
+    KEYWORD_RE = _PRS_KEYWORD_RE
     
     def _parse_response(
         self,
@@ -309,50 +1095,39 @@ class PRSExtractor(BaseExtractor):
         results = []
         extractions = response_data.get("extractions", [])
         
+        # Values shared by every extraction from this paper
+        pmid = paper.pmid
+        publication_year = paper.publication_date.year if paper.publication_date else None
+        publication = f"{paper.journal}, {publication_year or ''}"
+        text_content = self._evidence_text(paper)
+        
         for i, item in enumerate(extractions):
             try:
-                # Extract performance metrics
-                metrics = item.get("performance_metrics", {})
-                auc = self._parse_float(metrics.get("auc"))
-                r2 = self._parse_float(metrics.get("r2"))
-                c_index = self._parse_float(metrics.get("c_index"))
-                or_per_sd = self._parse_float(metrics.get("or_per_sd"), convert_percent=False)
+                fields = {}
+                for obj, obj_fields in _PRS_FIELDS.items():
+                    values = item.get(obj) or {}
+                    for name, key, coerce in obj_fields:
+                        value = values.get(key)
+                        fields[name] = value if coerce is None else coerce(value)
                 
                 # Skip if no metrics
-                if not any([auc, r2, c_index, or_per_sd]):
-                    logger.debug(f"Skipping extraction without metrics for PMID:{paper.pmid}")
+                if not (fields["auc"] or fields["r2"] or fields["c_index"] or fields["or_per_sd"]):
+                    logger.debug(f"Skipping extraction without metrics for PMID:{pmid}")
                     continue
                 
-                # Extract model characteristics
-                model_chars = item.get("model_characteristics", {})
-                method = self._parse_prs_method(model_chars.get("method"))
-                
-                # Extract population info
-                population = item.get("population", {})
-                
                 # Extract metadata
-                metadata = item.get("extraction_metadata", {})
+                metadata = item.get("extraction_metadata") or {}
                 
                 extraction = PRSModelExtraction(
-                    pmid=paper.pmid,
+                    pmid=pmid,
                     source=DataSource.LITERATURE_MINING,
                     trait=item.get("trait", ""),
-                    auc=auc,
-                    r2=r2,
-                    c_index=c_index,
-                    or_per_sd=or_per_sd,
-                    variants_number=self._parse_int(model_chars.get("variants_number")),
-                    method=method,
-                    method_detail=model_chars.get("method_detail"),
-                    sample_size=self._parse_int(population.get("sample_size")),
-                    ancestry=population.get("ancestry"),
-                    cohort=population.get("cohort"),
-                    gwas_id=item.get("gwas_source", {}).get("gwas_id"),
-                    publication=f"{paper.journal}, {paper.publication_date.year if paper.publication_date else ''}",
-                    publication_year=paper.publication_date.year if paper.publication_date else None,
+                    **fields,
+                    publication=publication,
+                    publication_year=publication_year,
                     extraction_confidence=float(metadata.get("confidence", 0.7)),
                     raw_text_snippet=metadata.get("source_text", "")[:500],
-                    evidence_html=self._get_evidence_html(paper, metadata.get("source_text"))
+                    evidence_html=self._get_evidence_html(paper, metadata.get("source_text"), text_content)
                 )
                 
                 extraction.generate_id(sequence=i + 1)
@@ -366,34 +1141,27 @@ class PRSExtractor(BaseExtractor):
     
     def _parse_prs_method(self, method_str: Optional[str]) -> Optional[PRSMethod]:
         """Parse PRS method string to enum."""
-        if not method_str:
-            return None
-        
-        method_map = {
-            "PRS-CS": PRSMethod.PRS_CS,
-            "PRSCS": PRSMethod.PRS_CS,
-            "LDpred2": PRSMethod.LDPRED2,
-            "LDPRED2": PRSMethod.LDPRED2,
-            "C+T": PRSMethod.CT,
-            "P+T": PRSMethod.CT,
-            "CT": PRSMethod.CT,
-            "lassosum": PRSMethod.LASSOSUM,
-            "PRSice": PRSMethod.PRSICE,
-            "SBayesR": PRSMethod.SBAYESR,
-        }
-        
-        method_upper = method_str.upper().replace("-", "").replace("+", "")
-        for key, value in method_map.items():
-            if key.upper().replace("-", "").replace("+", "") == method_upper:
-                return value
-        
-        return PRSMethod.OTHER
+        return _to_prs_method(method_str)
 
 
 # ============================================================================
 # Heritability Extractor
 # ============================================================================
 
+# Upper-case method name without hyphens -> enum
+_H2_METHODS = {
+    "LDSC": HeritabilityMethod.LDSC,
+    "GCTA": HeritabilityMethod.GCTA,
+    "GREML": HeritabilityMethod.GREML,
+    "BOLTREML": HeritabilityMethod.BOLT_REML,
+}
+
+# Terms at least one of which any paper reporting SNP-heritability mentions
+_H2_KEYWORD_RE = re.compile(
+    r"heritabilit|\bh\^?2|h²|\b(?:LDSC|GCTA|GREML)\b",
+    re.IGNORECASE
+)
+
 class HeritabilityExtractor(BaseExtractor):
     """
     Extract SNP-heritability (h²) estimates from papers.
@@ -403,6 +1171,7 @@ class HeritabilityExtractor(BaseExtractor):
     
     TASK_NAME = "heritability_extraction"
     SCHEMA = HERITABILITY_EXTRACTION_SCHEMA
+    KEYWORD_RE = _H2_KEYWORD_RE
     
     def _parse_response(
         self,
@@ -413,6 +1182,11 @@ class HeritabilityExtractor(BaseExtractor):
         results = []
         extractions = response_data.get("extractions", [])
         
+        # Values shared by every extraction from this paper
+        publication_year = paper.publication_date.year if paper.publication_date else None
+        publication = f"{paper.journal}, {publication_year or ''}"
+        text_content = self._evidence_text(paper)
+        
         for i, item in enumerate(extractions):
             try:
                 # Extract heritability estimate
@@ -454,11 +1228,11 @@ class HeritabilityExtractor(BaseExtractor):
                     sample_size=self._parse_int(population.get("sample_size")),
                     ancestry=population.get("ancestry"),
                     prevalence=self._parse_float(population.get("prevalence"), convert_percent=True),
-                    publication=f"{paper.journal}, {paper.publication_date.year if paper.publication_date else ''}",
-                    publication_year=paper.publication_date.year if paper.publication_date else None,
+                    publication=publication,
+                    publication_year=publication_year,
                     extraction_confidence=float(metadata.get("confidence", 0.7)),
                     raw_text_snippet=metadata.get("source_text", "")[:500],
-                    evidence_html=self._get_evidence_html(paper, metadata.get("source_text"))
+                    evidence_html=self._get_evidence_html(paper, metadata.get("source_text"), text_content)
                 )
                 
                 results.append(extraction)
@@ -488,26 +1262,30 @@ class HeritabilityExtractor(BaseExtractor):
         if not method_str:
             return None
         
-        method_map = {
-            "LDSC": HeritabilityMethod.LDSC,
-            "GCTA": HeritabilityMethod.GCTA,
-            "GREML": HeritabilityMethod.GREML,
-            "BOLT-REML": HeritabilityMethod.BOLT_REML,
-            "BOLTREML": HeritabilityMethod.BOLT_REML,
-        }
-        
-        method_upper = method_str.upper().replace("-", "")
-        for key, value in method_map.items():
-            if key.replace("-", "") == method_upper:
-                return value
-        
-        return HeritabilityMethod.OTHER
+        return _H2_METHODS.get(method_str.upper().replace("-", ""), HeritabilityMethod.OTHER)
 
 
 # ============================================================================
 # Genetic Correlation Extractor
 # ============================================================================
 
+# Upper-case method name -> enum
+_RG_METHODS = {
+    "LDSC": GeneticCorrelationMethod.LDSC,
+    "HDL": GeneticCorrelationMethod.HDL,
+    "GNOVA": GeneticCorrelationMethod.GNOVA,
+    "SUPERGNOVA": GeneticCorrelationMethod.SUPERGNOVA,
+}
+
+# "x 10^-8" style exponents in p-values, rewritten to float's "e-8"
+_POWER_OF_TEN_RE = re.compile(r'\s*10\^?\s*')
+
+# Terms at least one of which any paper reporting genetic correlations mentions
+_RG_KEYWORD_RE = re.compile(
+    r"genetic(?:al)?\s+correlat|\br_?g\b|\b(?:LDSC|HDL|GNOVA|SUPERGNOVA)\b",
+    re.IGNORECASE
+)
+
 class GeneticCorrelationExtractor(BaseExtractor):
     """
     Extract genetic correlation (rg) data from papers.
@@ -517,6 +1295,7 @@ class GeneticCorrelationExtractor(BaseExtractor):
     
     TASK_NAME = "genetic_correlation_extraction"
     SCHEMA = GENETIC_CORRELATION_EXTRACTION_SCHEMA
+    KEYWORD_RE = _RG_KEYWORD_RE
     
     def _parse_response(
         self,
@@ -527,6 +1306,11 @@ class GeneticCorrelationExtractor(BaseExtractor):
         results = []
         extractions = response_data.get("extractions", [])
         
+        # Values shared by every extraction from this paper
+        publication_year = paper.publication_date.year if paper.publication_date else None
+        publication = f"{paper.journal}, {publication_year or ''}"
+        text_content = self._evidence_text(paper)
+        
         for i, item in enumerate(extractions):
             try:
                 # Extract trait pair
@@ -566,11 +1350,11 @@ class GeneticCorrelationExtractor(BaseExtractor):
                     method=method,
                     sample_size=self._parse_int(population.get("sample_size_trait1")),
                     ancestry=population.get("ancestry"),
-                    publication=f"{paper.journal}, {paper.publication_date.year if paper.publication_date else ''}",
-                    publication_year=paper.publication_date.year if paper.publication_date else None,
+                    publication=publication,
+                    publication_year=publication_year,
                     extraction_confidence=float(metadata.get("confidence", 0.7)),
                     raw_text_snippet=metadata.get("source_text", "")[:500],
-                    evidence_html=self._get_evidence_html(paper, metadata.get("source_text"))
+                    evidence_html=self._get_evidence_html(paper, metadata.get("source_text"), text_content)
                 )
                 
                 results.append(extraction)
@@ -600,7 +1384,7 @@ class GeneticCorrelationExtractor(BaseExtractor):
         try:
             if isinstance(value, str):
                 value = value.lower().replace("×", "e").replace("x", "e")
-                value = re.sub(r'\s*10\^?\s*', 'e', value)
+                value = _POWER_OF_TEN_RE.sub('e', value)
             p = float(value)
             if 0 <= p <= 1:
                 return p
@@ -613,16 +1397,80 @@ class GeneticCorrelationExtractor(BaseExtractor):
         if not method_str:
             return None
         
-        method_map = {
-            "LDSC": GeneticCorrelationMethod.LDSC,
-            "HDL": GeneticCorrelationMethod.HDL,
-            "GNOVA": GeneticCorrelationMethod.GNOVA,
-            "SuperGNOVA": GeneticCorrelationMethod.SUPERGNOVA,
-            "SUPERGNOVA": GeneticCorrelationMethod.SUPERGNOVA,
+        return _RG_METHODS.get(method_str.upper(), GeneticCorrelationMethod.OTHER)
+
+
+# ============================================================================
+# Combined Extractor
+# ============================================================================
+
+class CombinedExtractor(BaseExtractor):
+    """
+    Extract PRS, heritability and genetic correlation data in one LLM call.
+    
+    The full text dominates the prompt, so sending it once instead of once per
+    extractor cuts requests and input tokens roughly threefold. Each section of
+    the response is parsed by the corresponding single-task extractor.
+    """
+    
+    TASK_NAME = "combined_extraction"
+    SCHEMA = COMBINED_EXTRACTION_SCHEMA
+    # Any section's terms
+    KEYWORD_RE = re.compile(
+        "|".join(pattern.pattern for pattern in (_PRS_KEYWORD_RE, _H2_KEYWORD_RE, _RG_KEYWORD_RE)),
+        re.IGNORECASE
+    )
+    
+    def __init__(self, cache: Optional[ExtractionCache] = None):
+        """Initialize the extractor and the per-section parsers."""
+        super().__init__(cache)
+        self.extractors: Dict[str, BaseExtractor] = {
+            "prs": PRSExtractor(),
+            "heritability": HeritabilityExtractor(),
+            "genetic_correlation": GeneticCorrelationExtractor(),
         }
+        for extractor in self.extractors.values():
+            extractor.lang_extractor = self.lang_extractor
+    
+    def _parse_response(self, paper: PaperMetadata, response_data: Dict) -> Dict[str, List[Any]]:
+        """Split the combined response and parse each section."""
+        results = {}
+        for name, extractor in self.extractors.items():
+            # All sections quote the same text, so they share one evidence index
+            extractor._evidence = self._evidence
+            results[name] = extractor._parse_response(paper, response_data.get(name) or {})
+            self._evidence = extractor._evidence
+        return results
+    
+    def _no_results(self) -> Dict[str, List[Any]]:
+        """Result of an extraction that produced nothing: every type empty."""
+        return {name: [] for name in self.extractors}
+    
+    def _results_from(self, paper: PaperMetadata, data: Optional[Dict]) -> Dict[str, List[Any]]:
+        """
+        Parse response data into extractions and log the counts.
         
-        method_upper = method_str.upper()
-        return method_map.get(method_upper, GeneticCorrelationMethod.OTHER)
+        Returns:
+            Dict mapping "prs", "heritability" and "genetic_correlation" to
+            their extractions (lists may be empty)
+        """
+        if data is None:
+            return self._no_results()
+        
+        results = self._parse_response(paper, data)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"{self.__class__.__name__}: Extracted "
+                + ", ".join(f"{len(items)} {name}" for name, items in results.items())
+                + f" items from PMID:{paper.pmid}"
+            )
+        
+        return results
+    
+    def _item_counts(self, extractions: Dict[str, List[Any]]) -> Counter:
+        """Number of extracted items of a paper, by extraction type."""
+        return Counter({name: len(items) for name, items in extractions.items()})
 
 
 # ============================================================================
@@ -642,12 +1490,13 @@ class ExtractorFactory:
     }
     
     @classmethod
-    def create(cls, extractor_type: str) -> BaseExtractor:
+    def create(cls, extractor_type: str, cache: Optional[ExtractionCache] = None) -> BaseExtractor:
         """
         Create an extractor instance.
         
         Args:
             extractor_type: One of "prs", "heritability", "genetic_correlation"
+            cache: Optional response cache shared by the created extractors
         
         Returns:
             Extractor instance (uses centralized LLM config)
@@ -655,12 +1504,21 @@ class ExtractorFactory:
         if extractor_type not in cls._extractors:
             raise ValueError(f"Unknown extractor type: {extractor_type}")
         
-        return cls._extractors[extractor_type]()
+        return cls._extractors[extractor_type](cache)
     
     @classmethod
-    def create_all(cls) -> Dict[str, BaseExtractor]:
-        """Create all extractor instances."""
+    def create_all(cls, combined: bool = False, cache: Optional[ExtractionCache] = None) -> Dict[str, BaseExtractor]:
+        """
+        Create all extractor instances.
+        
+        Args:
+            combined: Return a single CombinedExtractor (key "combined") that
+                extracts all types with one LLM call per paper
+            cache: Optional response cache shared by the created extractors
+        """
+        if combined:
+            return {"combined": CombinedExtractor(cache)}
         return {
-            name: cls.create(name)
+            name: cls.create(name, cache)
             for name in cls._extractors
         }
@@ -10,25 +10,124 @@ LLM-based multi-label classifier that categorizes papers into:
 Uses structured prompting with JSON Schema constrained output.
 """
 
+import os
+import re
 import json
+import time
+import random
+import asyncio
+import hashlib
+import inspect
 import logging
+import functools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from openai import APITimeoutError, RateLimitError
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
 from .entities import (
     PaperMetadata,
     ClassificationResult,
     CategoryScore,
     PaperCategory
 )
-from .prompts import get_prompt, format_user_prompt
-from .schemas import PAPER_CLASSIFICATION_SCHEMA
-from langchain_core.messages import SystemMessage, HumanMessage
+from .prompts import PROMPTS, get_prompt, format_user_prompt
+from .schemas import PAPER_CLASSIFICATION_SCHEMA, get_multi_paper_classification_schema
+from .rate_limit import RequestThrottle, estimate_tokens, retry_after
 
 logger = logging.getLogger(__name__)
 
+# Bump when a change outside the prompts/schema (e.g. how they are laid out
+# across the chat messages) should invalidate cached classifications
+MESSAGE_LAYOUT_VERSION = "2"
+
+# Fingerprint of the classification prompts, schema and message layout: part
+# of every cache key, so editing any of them invalidates cached classifications
+PROMPT_VERSION = hashlib.sha1(
+    json.dumps(
+        [PROMPTS["classification"], PAPER_CLASSIFICATION_SCHEMA, MESSAGE_LAYOUT_VERSION],
+        sort_keys=True
+    ).encode("utf-8")
+).hexdigest()[:12]
+
+# A response wrapped in a markdown code block
+_FENCE_RE = re.compile(r"^\s*```(?:json)?[ \t]*\n?(.*?)\s*```\s*$", re.DOTALL | re.IGNORECASE)
+
+
+def _loads(text) -> Any:
+    """Decode JSON text or bytes; raises json.JSONDecodeError (orjson's subclasses it)."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _cached_classification(method):
+    """
+    Serve a per-paper classify method (sync or async) from the classifier's result cache.
+    
+    Misses are classified and stored unless classification failed.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, paper: PaperMetadata, *args, **kwargs) -> ClassificationResult:
+            cached = self._load_cached(paper)
+            if cached is not None:
+                return cached
+            result = await method(self, paper, *args, **kwargs)
+            self._store_cached(paper, result)
+            return result
+        return async_wrapper
+    
+    @functools.wraps(method)
+    def wrapper(self, paper: PaperMetadata, *args, **kwargs) -> ClassificationResult:
+        cached = self._load_cached(paper)
+        if cached is not None:
+            return cached
+        result = method(self, paper, *args, **kwargs)
+        self._store_cached(paper, result)
+        return result
+    return wrapper
+
+
+async def _progress_logger(
+    queue: asyncio.Queue,
+    total: int,
+    progress_callback: callable,
+    interval: float = 1.0
+):
+    """
+    Drain completion counts from `queue` and report them at most once per interval.
+    
+    Runs until cancelled or until all `total` papers are reported; on
+    cancellation any counts still queued are reported before returning.
+    """
+    completed = 0
+    
+    def drain() -> bool:
+        nonlocal completed
+        drained = False
+        while not queue.empty():
+            completed += queue.get_nowait()
+            drained = True
+        if drained:
+            progress_callback(completed, total)
+        return drained
+    
+    try:
+        while completed < total:
+            await asyncio.sleep(interval)
+            drain()
+    except asyncio.CancelledError:
+        drain()
+
 
 # ============================================================================
 # Paper Classifier (Structured Output Version)
@@ -47,15 +146,53 @@ class PaperClassifier:
     - JSON Schema: Constrains LLM output for reliable parsing
     """
     
-    def __init__(self):
+    # API limits shared by all concurrent requests of a classifier
+    MAX_REQUESTS_PER_MINUTE: int = 500
+    MAX_TOKENS_PER_MINUTE: int = 200_000
+    
+    # classify_batch_async classifies fewer uncached papers than this in real
+    # time: a batch job can take hours, which only pays off for large jobs
+    MIN_BATCH_JOB_SIZE: int = 20
+    
+    # Cached classifications older than this are classified again
+    CACHE_TTL_DAYS: float = 90
+    
+    def __init__(
+        self,
+        micro_batch_size: int = 8,
+        cache_dir: Optional[Path] = None,
+        refresh_cache: bool = False
+    ):
         """
         Initialize the classifier.
         
         Uses centralized LLM configuration from src/core/llm_config.py
+        
+        Args:
+            micro_batch_size: Papers merged into one prompt by aclassify_batch
+                (1 sends one request per paper)
+            cache_dir: Directory caching classification results as one JSON
+                file per (model, prompt version, paper) for CACHE_TTL_DAYS;
+                None disables it
+            refresh_cache: Ignore cached results but still store the fresh ones
         """
+        self.micro_batch_size = micro_batch_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.refresh_cache = refresh_cache
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
+        self._throttle = None
         self._model_name = None
         self._config = None
+        self._is_strict = False
+        # System messages, built once so every request starts with the same
+        # bytes (see _system_content)
+        self._developer_prompt = get_prompt("classification", "developer")
+        self._json_mode_system_content = self._system_content(PAPER_CLASSIFICATION_SCHEMA["json_schema"]["schema"])
+        self._multi_system_content: Dict[int, str] = {}
     
     @property
     def client(self):
@@ -66,6 +203,7 @@ class PaperClassifier:
                 from openai import OpenAI
                 self._config = get_config("literature_classifier")
                 self._model_name = self._config.model
+                self._is_strict = getattr(self._config, 'strict', False)
                 # Initialize OpenAI client with API key from environment
                 self._client = OpenAI()
                 logger.debug(f"PaperClassifier using model: {self._model_name}")
@@ -76,6 +214,33 @@ class PaperClassifier:
                 self._model_name = "gpt-4.1-nano"
         return self._client
     
+    @property
+    def async_client(self):
+        """
+        Lazy initialization of the AsyncOpenAI client used by classify_one.
+        
+        Its connection pool is bound to the event loop it was first used in,
+        so a new client is created for each loop (e.g. each classify_batch call).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from openai import AsyncOpenAI
+            _ = self.client  # Load config and model name
+            self._async_client = AsyncOpenAI()
+            self._async_client_loop = loop
+        return self._async_client
+    
+    @property
+    def throttle(self) -> RequestThrottle:
+        """Requests/tokens-per-minute limiter shared by this classifier's async requests."""
+        if self._throttle is None:
+            self._throttle = RequestThrottle(self.MAX_REQUESTS_PER_MINUTE, self.MAX_TOKENS_PER_MINUTE)
+        return self._throttle
+    
+    async def _throttled(self, messages: List[Dict[str, str]]):
+        """Wait for the rate-limit throttle before sending `messages`."""
+        await self.throttle.acquire(estimate_tokens(messages))
+    
     @property
     def model_name(self) -> str:
         """Get the model name being used."""
@@ -83,6 +248,13 @@ class PaperClassifier:
             _ = self.client  # Trigger lazy init
         return self._model_name or "unknown"
     
+    @property
+    def is_strict(self) -> bool:
+        """Whether the config requests strict (schema-enforced) structured outputs."""
+        _ = self.client  # Trigger lazy init
+        return self._is_strict
+    
+    @_cached_classification
     def classify(self, paper: PaperMetadata, max_retries: int = 3) -> ClassificationResult:
         """
         Classify a single paper using structured prompting.
@@ -94,208 +266,170 @@ class PaperClassifier:
         Returns:
             ClassificationResult with categories and confidence scores
         """
-        import time
-        import random
-        
-        # Get prompts
-        developer_prompt = get_prompt("classification", "developer")
-        user_prompt = format_user_prompt(
-            "classification",
-            pmid=paper.pmid,
-            title=paper.title,
-            abstract=paper.abstract[:4000] if paper.abstract else "(No abstract available)",
-            journal=paper.journal or "Unknown",
-            year=paper.publication_date.year if paper.publication_date else "Unknown"
-        )
-        
-        # Check for strict mode configuration
-        is_strict = getattr(self._config, 'strict', False)
-        
-        if is_strict:
-            # STRICT MODE: Use new beta parse API
-            # Note: We don't need to append the schema to the prompt in strict mode, 
-            # as the API handles it, but keeping the prompt structure is generally fine.
-            # However, prompt-based schema instructions might be redundant/confusing for strict mode models?
-            # Usually it's safer to rely on the API.
-            
-            messages = [
-                {"role": "system", "content": developer_prompt},
-                {"role": "user", "content": user_prompt} # Use original user prompt without manual schema injection
-            ]
-            
-            # Retry loop for rate limit
-            last_error = None
-            for attempt in range(max_retries + 1):
-                try:
-                    logger.debug(f"Calling beta.chat.completions.parse for PMID:{paper.pmid} (attempt {attempt + 1})")
-                    
-                    response = self.client.beta.chat.completions.parse(
-                        model=self.model_name,
-                        messages=messages,
-                        response_format=PAPER_CLASSIFICATION_SCHEMA["json_schema"]["schema"],
-                        temperature=0.1,
-                        max_tokens=1500
-                    )
-                    
-                    if hasattr(response.choices[0].message, 'parsed'):
-                        data = response.choices[0].message.parsed
-                        # Convert to dict if needed (depends on if schema was pydantic or dict)
-                        if hasattr(data, 'model_dump'):
-                             data = data.model_dump()
-                        elif hasattr(data, 'dict'):
-                             data = data.dict()
-                    else:
-                         # Fallback
-                         content = response.choices[0].message.content
-                         data = json.loads(content)
-                    
-                    # Process result
-                    # We need to adapt the logic from _parse_response to work with the dict directly
-                    # reusing _parse_response by re-serializing is inefficient but safe for specific method logic preservation
-                    # OR better: refactor _parse_response to accept dict.
-                    # For minimal change risk: modify _parse_response to accept dict OR str?
-                    # Let's check _parse_response... it explicitly takes content string.
-                    # To reuse _parse_response logic without changes:
-                    result = self._parse_response_dict(paper.pmid, data)
-                    
-                    logger.info(
-                        f"Classified PMID:{paper.pmid} -> {result.primary_category.value} "
-                        f"(confidence: {result.overall_confidence:.2f})"
-                    )
-                    return result
-
-                except Exception as e:
-                    last_error = e
-                    # ... (Rate limit handling logic similar to below) ...
-                    error_str = str(e)
-                    if "429" in error_str or "rate_limit" in error_str.lower():
-                         if attempt < max_retries:
-                            wait_time = (2 ** attempt) + random.uniform(0.5, 1.5)
-                            logger.warning(f"Rate limit hit, retrying in {wait_time:.1f}s")
-                            time.sleep(wait_time)
-                            continue
-                    
-                    logger.error(f"Error classifying paper {paper.pmid}: {e}")
-                    break
-            
-            return self._create_error_result(paper.pmid, str(last_error))
-
-        # ==========================================
-        # LEGACY JSON MODE
-        # ==========================================
-        
-        # Add schema instructions to prompt
-        schema_json = json.dumps(PAPER_CLASSIFICATION_SCHEMA["json_schema"]["schema"], indent=2)
-        full_user_prompt = user_prompt + f"\n\nYou must output valid JSON strictly following this schema:\n```json\n{schema_json}\n```"
+        messages = self._strict_messages(paper) if self.is_strict else self._json_mode_messages(paper)
         
-        messages = [
-            {"role": "system", "content": developer_prompt},
-            {"role": "user", "content": full_user_prompt}
-        ]
-        
-        # Retry loop for rate limit and parse error handling
         last_error = None
         for attempt in range(max_retries + 1):
             try:
-                logger.debug(f"Calling chat.completions.create for PMID:{paper.pmid} (attempt {attempt + 1})")
-                
-                # Use chat.completions.create with JSON mode for guaranteed valid JSON
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=messages,
-                    response_format={"type": "json_object"},
-                    temperature=0.1,
-                    max_tokens=1500
-                )
-                
-                content = response.choices[0].message.content
-                
-                if not content:
-                    raise ValueError("Empty response content")
-                
-                logger.debug(f"LLM Response for {paper.pmid}:\n{content[:500]}...")
-                
-                # Parse structured response - this should now always succeed with JSON mode
-                result = self._parse_response(paper.pmid, content)
-                
-                # Check if parsing actually succeeded (confidence > 0 means valid parse)
-                if result.overall_confidence == 0.0 and "error" in result.llm_reasoning.lower():
-                    raise ValueError(f"Parse error: {result.llm_reasoning}")
-                
+                logger.debug(f"Requesting classification for PMID:{paper.pmid} (attempt {attempt + 1})")
+                result = self._invoke_once(paper.pmid, messages)
                 logger.info(
                     f"Classified PMID:{paper.pmid} -> {result.primary_category.value} "
                     f"(confidence: {result.overall_confidence:.2f})"
                 )
-                
                 return result
-                
-            except json.JSONDecodeError as e:
-                # JSON parse error - retry with fresh request
-                last_error = e
-                if attempt < max_retries:
-                    wait_time = 0.5 + random.uniform(0.1, 0.5)
-                    logger.warning(
-                        f"JSON parse error for PMID:{paper.pmid}, "
-                        f"retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(wait_time)
-                    continue
-                    
+            
             except Exception as e:
                 last_error = e
-                error_str = str(e)
-                
-                # Check for rate limit error (429)
-                if "429" in error_str or "rate_limit" in error_str.lower():
-                    if attempt < max_retries:
-                        # Exponential backoff with jitter
-                        wait_time = (2 ** attempt) + random.uniform(0.5, 1.5)
-                        logger.warning(
-                            f"Rate limit hit for PMID:{paper.pmid}, "
-                            f"retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})"
-                        )
-                        time.sleep(wait_time)
-                        continue
-                
-                # Check for parse-related errors
-                if "parse" in error_str.lower() or "json" in error_str.lower():
-                    if attempt < max_retries:
-                        wait_time = 0.5 + random.uniform(0.1, 0.5)
-                        logger.warning(
-                            f"Parse error for PMID:{paper.pmid}, "
-                            f"retrying (attempt {attempt + 1}/{max_retries})"
-                        )
-                        time.sleep(wait_time)
-                        continue
-                
-                # For other errors, log and break
-                logger.error(f"Error classifying paper {paper.pmid}: {e}")
-                break
+                wait_time = self._retry_delay(paper, e, attempt, max_retries)
+                if wait_time is None:
+                    break
+                time.sleep(wait_time)
         
         # All retries failed
         return self._create_error_result(paper.pmid, str(last_error))
     
+    def _invoke_once(self, pmid: str, messages: List[Dict[str, str]]) -> ClassificationResult:
+        """Send one classification request; raises on API errors and unusable responses."""
+        if self.is_strict:
+            response = self.client.beta.chat.completions.parse(
+                model=self.model_name,
+                messages=messages,
+                response_format=PAPER_CLASSIFICATION_SCHEMA["json_schema"]["schema"],
+                temperature=0.1,
+                max_tokens=1500
+            )
+        else:
+            # JSON mode guarantees syntactically valid JSON
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=0.1,
+                max_tokens=1500
+            )
+        return self._result_from_response(pmid, response)
+    
+    async def _ainvoke_once(self, pmid: str, messages: List[Dict[str, str]]) -> ClassificationResult:
+        """Async counterpart of _invoke_once, throttled to the configured rate limits."""
+        client = self.async_client
+        await self._throttled(messages)
+        if self.is_strict:
+            response = await client.beta.chat.completions.parse(
+                model=self.model_name,
+                messages=messages,
+                response_format=PAPER_CLASSIFICATION_SCHEMA["json_schema"]["schema"],
+                temperature=0.1,
+                max_tokens=1500
+            )
+        else:
+            response = await client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=0.1,
+                max_tokens=1500
+            )
+        return self._result_from_response(pmid, response)
+    
+    def _result_from_response(self, pmid: str, response) -> ClassificationResult:
+        """Turn a chat completion into a ClassificationResult; raises if it cannot be parsed."""
+        self._log_cached_tokens(f"PMID:{pmid}", response)
+        message = response.choices[0].message
+        
+        if self.is_strict:
+            data = getattr(message, 'parsed', None)
+            if data is None:
+                data = _loads(message.content)
+            elif hasattr(data, 'model_dump'):
+                data = data.model_dump()
+            return self._parse_response_dict(pmid, data)
+        
+        content = message.content
+        if not content:
+            raise ValueError("Empty response content")
+        logger.debug(f"LLM Response for {pmid}:\n{content[:500]}...")
+        
+        result = self._parse_response(pmid, content)
+        # Check if parsing actually succeeded (confidence > 0 means valid parse)
+        if result.overall_confidence == 0.0 and "error" in result.llm_reasoning.lower():
+            raise ValueError(f"Parse error: {result.llm_reasoning}")
+        return result
+    
+    @staticmethod
+    def _rate_limit_delay(error: Exception, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait after a rate-limited attempt, or None if `error` is no rate limit.
+        
+        Waits as long as the response's Retry-After header asks, falling back
+        to exponential backoff with jitter.
+        """
+        error_str = str(error).lower()
+        if not (isinstance(error, RateLimitError) or "429" in error_str or "rate_limit" in error_str):
+            return None
+        delay = retry_after(error)
+        return delay if delay is not None else (2 ** attempt) + random.uniform(0.5, 1.5)
+    
+    def _retry_delay(
+        self,
+        paper: PaperMetadata,
+        error: Exception,
+        attempt: int,
+        max_retries: int
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying a failed classification, or None to give up.
+        
+        Rate limits and timeouts back off, parse errors are retried with a
+        fresh request after a short pause, and other errors are final.
+        """
+        if attempt < max_retries:
+            delay = self._rate_limit_delay(error, attempt)
+            if delay is not None:
+                reason = "Rate limit hit"
+            elif isinstance(error, APITimeoutError):
+                reason, delay = "Request timed out", (2 ** attempt) + random.uniform(0.5, 1.5)
+            elif isinstance(error, json.JSONDecodeError) or "parse" in str(error).lower() or "json" in str(error).lower():
+                reason, delay = "Parse error", 0.5 + random.uniform(0.1, 0.5)
+            
+            if delay is not None:
+                logger.warning(
+                    f"{reason} for PMID:{paper.pmid}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+                )
+                return delay
+        
+        logger.error(f"Error classifying paper {paper.pmid}: {error}")
+        return None
+    
     def classify_batch(
         self,
         papers: List[PaperMetadata],
         progress_callback: Optional[callable] = None,
-        max_workers: Optional[int] = None
+        max_workers: Optional[int] = None,
+        confidence_gate: Optional[float] = 0.0
     ) -> List[ClassificationResult]:
         """
         Classify multiple papers with intelligent rate limiting.
         
-        Uses proactive rate control to avoid 429 errors entirely.
+        Runs aclassify_batch in a new event loop, with up to max_workers
+        concurrent requests. When called from inside a running event loop
+        (where that is impossible) papers are classified with classify on
+        max_workers threads, starting at most ~2 requests per second; async
+        callers should await aclassify_batch instead.
         API limits: 200K TPM (~80-100 requests/min) and 500 RPM
         
         Args:
             papers: List of papers to classify
             progress_callback: Optional callback(current, total) for progress
-            max_workers: Ignored - uses smart sequential processing
+            max_workers: Maximum number of concurrent requests (default 16)
+            confidence_gate: Papers whose rule-based keyword score is at most
+                this are classified NOT_RELEVANT without the LLM; None sends
+                every paper to the LLM
         
         Returns:
             List of ClassificationResults in the same order as input papers
         """
-        import time
         import threading
         
         total = len(papers)
@@ -303,6 +437,16 @@ class PaperClassifier:
         if total == 0:
             return []
         
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aclassify_batch(
+                papers,
+                concurrency=max_workers or 16,
+                progress_callback=progress_callback,
+                confidence_gate=confidence_gate
+            ))
+        
         # Rate limiting configuration
         # API: 200K TPM, ~2500 tokens/request = 80 requests/min = 1.33 req/sec
         # Using 2 requests per second (120/min, still under limit for fast models)
@@ -310,40 +454,263 @@ class PaperClassifier:
         
         logger.info(f"Classifying {total} papers with smart rate limiting (~2 req/sec)")
         
-        results: List[ClassificationResult] = []
+        results = self._prefilter(papers, confidence_gate)
+        pending = [i for i, result in enumerate(results) if result is None]
+        completed = total - len(pending)
+        if progress_callback and completed:
+            progress_callback(completed, total)
+        
         last_request_time = 0.0
         lock = threading.Lock()
         
-        start_time = time.perf_counter()
-        
-        for i, paper in enumerate(papers):
-            # Smart rate limiting: ensure minimum interval between requests
+        def paced_classify(paper: PaperMetadata) -> ClassificationResult:
+            # Smart rate limiting: ensure minimum interval between request
+            # starts across all workers
+            nonlocal last_request_time
             with lock:
-                current_time = time.perf_counter()
-                elapsed = current_time - last_request_time
+                elapsed = time.perf_counter() - last_request_time
                 if elapsed < MIN_REQUEST_INTERVAL:
-                    sleep_time = MIN_REQUEST_INTERVAL - elapsed
-                    time.sleep(sleep_time)
+                    time.sleep(MIN_REQUEST_INTERVAL - elapsed)
                 last_request_time = time.perf_counter()
-            
             # Classify with retries built into classify()
-            result = self.classify(paper)
-            results.append(result)
-            
-            # Progress reporting
-            completed = i + 1
-            if progress_callback:
-                progress_callback(completed, total)
-            
-            # Log progress every 50 papers
-            if completed % 50 == 0 or completed == total:
-                elapsed = time.perf_counter() - start_time
-                rate = completed / elapsed if elapsed > 0 else 0
-                eta = (total - completed) / rate if rate > 0 else 0
+            return self.classify(paper)
+        
+        start_time = time.perf_counter()
+        
+        # Requests spend their time waiting on the API with the GIL released,
+        # so threads overlap them nearly linearly
+        with ThreadPoolExecutor(max_workers=max_workers or 16) as executor:
+            futures = {executor.submit(paced_classify, papers[i]): i for i in pending}
+            for future in as_completed(futures):
+                # One paper's failure must not discard the results already paid for
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    paper = papers[futures[future]]
+                    logger.error(f"Error classifying PMID:{paper.pmid}: {e}")
+                    results[futures[future]] = self._create_error_result(paper.pmid, str(e))
+                
+                # Progress reporting
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total)
+                
+                # Log progress every 50 papers
+                if completed % 50 == 0 or completed == total:
+                    elapsed = time.perf_counter() - start_time
+                    rate = completed / elapsed if elapsed > 0 else 0
+                    eta = (total - completed) / rate if rate > 0 else 0
+                    logger.info(
+                        f"Progress: {completed}/{total} ({completed/total*100:.1f}%) "
+                        f"- {rate:.2f} papers/sec - ETA: {eta:.0f}s"
+                    )
+        
+        total_time = time.perf_counter() - start_time
+        logger.info(
+            f"Completed classification of {total} papers in {total_time:.1f}s "
+            f"({total_time/total*1000:.0f}ms/paper)"
+        )
+        
+        return results
+    
+    @_cached_classification
+    async def classify_one(self, paper: PaperMetadata, max_retries: int = 3) -> ClassificationResult:
+        """
+        Classify a single paper on the AsyncOpenAI client.
+        
+        Async counterpart of classify(): same prompts, parsing and retry
+        policy, but backoff waits yield to the event loop so many papers can
+        be in flight at once.
+        
+        Args:
+            paper: Paper metadata with title and abstract
+            max_retries: Maximum number of retries for rate limit or parse errors
+        
+        Returns:
+            ClassificationResult with categories and confidence scores
+        """
+        messages = self._strict_messages(paper) if self.is_strict else self._json_mode_messages(paper)
+        
+        last_error = None
+        for attempt in range(max_retries + 1):
+            try:
+                result = await self._ainvoke_once(paper.pmid, messages)
                 logger.info(
-                    f"Progress: {completed}/{total} ({completed/total*100:.1f}%) "
-                    f"- {rate:.2f} papers/sec - ETA: {eta:.0f}s"
+                    f"Classified PMID:{paper.pmid} -> {result.primary_category.value} "
+                    f"(confidence: {result.overall_confidence:.2f})"
                 )
+                return result
+            
+            except Exception as e:
+                last_error = e
+                wait_time = self._retry_delay(paper, e, attempt, max_retries)
+                if wait_time is None:
+                    break
+                await asyncio.sleep(wait_time)
+        
+        # All retries failed
+        return self._create_error_result(paper.pmid, str(last_error))
+    
+    async def classify_chunk(
+        self,
+        papers: List[PaperMetadata],
+        max_retries: int = 3
+    ) -> List[ClassificationResult]:
+        """
+        Classify several papers with a single LLM request.
+        
+        The developer prompt and schema are sent once for the whole chunk
+        instead of once per paper; cached papers are left out of the request.
+        Papers the response does not cover (or all of them, if the request
+        keeps failing) are classified individually with classify_one.
+        
+        The multi-paper request uses JSON mode, so with a strict config every
+        paper goes through classify_one instead, keeping the API-enforced
+        schema (and the cache free of unenforced results).
+        
+        Args:
+            papers: Papers to classify together
+            max_retries: Maximum number of retries for rate limit or parse errors
+        
+        Returns:
+            List of ClassificationResults in the same order as input papers
+        """
+        by_pmid: Dict[str, ClassificationResult] = {}
+        for paper in papers:
+            cached = self._load_cached(paper)
+            if cached is not None:
+                by_pmid[paper.pmid] = cached
+        pending = [paper for paper in papers if paper.pmid not in by_pmid]
+        
+        if len(pending) == 1 or self.is_strict:
+            # One at a time: the chunk holds a single concurrency slot
+            for paper in pending:
+                by_pmid[paper.pmid] = await self.classify_one(paper, max_retries)
+            return [by_pmid[paper.pmid] for paper in papers]
+        if not pending:
+            return [by_pmid[paper.pmid] for paper in papers]
+        
+        client = self.async_client
+        messages = self._build_multi_paper_prompt(pending)
+        pmids = {paper.pmid for paper in pending}
+        
+        for attempt in range(max_retries + 1):
+            try:
+                await self._throttled(messages)
+                response = await client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.1,
+                    max_tokens=1500 * len(pending)
+                )
+                self._log_cached_tokens(f"{len(pending)}-paper chunk", response)
+                content = response.choices[0].message.content
+                if not content:
+                    raise ValueError("Empty response content")
+                
+                for item in _loads(content).get("classifications", []):
+                    pmid = str(item.get("pmid", ""))
+                    if pmid in pmids:
+                        by_pmid[pmid] = self._parse_response_dict(pmid, item)
+                for paper in pending:
+                    if paper.pmid in by_pmid:
+                        self._store_cached(paper, by_pmid[paper.pmid])
+                break
+            
+            except Exception as e:
+                wait_time = self._rate_limit_delay(e, attempt) if attempt < max_retries else None
+                if wait_time is not None:
+                    logger.warning(f"Rate limit hit for {len(pending)}-paper chunk, retrying in {wait_time:.1f}s")
+                    await asyncio.sleep(wait_time)
+                    continue
+                logger.warning(f"Error classifying {len(pending)}-paper chunk, falling back to single papers: {e}")
+                break
+        
+        results = []
+        for paper in papers:
+            result = by_pmid.get(paper.pmid)
+            if result is None:
+                result = await self.classify_one(paper, max_retries)
+            results.append(result)
+        return results
+    
+    async def aclassify_batch(
+        self,
+        papers: List[PaperMetadata],
+        concurrency: int = 16,
+        progress_callback: Optional[callable] = None,
+        confidence_gate: Optional[float] = 0.0
+    ) -> List[ClassificationResult]:
+        """
+        Classify multiple papers concurrently.
+        
+        Papers are grouped into chunks of self.micro_batch_size, each
+        classified with one request (classify_chunk). At most `concurrency`
+        requests are in flight at a time, within the MAX_REQUESTS_PER_MINUTE /
+        MAX_TOKENS_PER_MINUTE limits; rate-limit errors that still occur are
+        absorbed by the per-request backoff.
+        
+        Args:
+            papers: List of papers to classify
+            concurrency: Maximum number of simultaneous LLM requests
+            progress_callback: Optional callback(completed, total), called at
+                most once per second from a separate task, and once more with
+                the final count
+            confidence_gate: Papers whose rule-based keyword score is at most
+                this are classified NOT_RELEVANT without the LLM; None sends
+                every paper to the LLM
+        
+        Returns:
+            List of ClassificationResults in the same order as input papers
+        """
+        total = len(papers)
+        
+        if total == 0:
+            return []
+        
+        results = self._prefilter(papers, confidence_gate)
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        chunk_size = max(1, self.micro_batch_size)
+        logger.info(
+            f"Classifying {len(pending)} papers in chunks of {chunk_size} "
+            f"with up to {concurrency} concurrent requests"
+        )
+        
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def classify_at(indices: List[int]):
+            async with sem:
+                return indices, await self.classify_chunk([papers[i] for i in indices])
+        
+        tasks = []
+        index_iter = iter(pending)
+        while indices := list(islice(index_iter, chunk_size)):
+            tasks.append(classify_at(indices))
+        
+        start_time = time.perf_counter()
+        
+        # Completions are only queued here; reporting them (usually log
+        # writes) happens in one task so it never stalls the fan-out
+        progress_queue: asyncio.Queue = asyncio.Queue()
+        progress_queue.put_nowait(total - len(pending))
+        progress_task = None
+        if progress_callback:
+            progress_task = asyncio.create_task(
+                _progress_logger(progress_queue, total, progress_callback)
+            )
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indices, chunk_results = await next_done
+                for i, result in zip(indices, chunk_results):
+                    results[i] = result
+                progress_queue.put_nowait(len(chunk_results))
+        finally:
+            if progress_task is not None:
+                progress_task.cancel()
+                await asyncio.gather(progress_task, return_exceptions=True)
         
         total_time = time.perf_counter() - start_time
         logger.info(
@@ -353,19 +720,321 @@ class PaperClassifier:
         
         return results
     
+    def _prefilter(
+        self,
+        papers: List[PaperMetadata],
+        confidence_gate: Optional[float]
+    ) -> List[Optional[ClassificationResult]]:
+        """
+        Classify papers without relevant keywords using RuleBasedClassifier.
+        
+        Returns:
+            One entry per paper: the rule-based NOT_RELEVANT result for papers
+            whose best keyword score is at most confidence_gate, None for
+            papers that need the LLM (all of them if confidence_gate is None)
+        """
+        if confidence_gate is None:
+            return [None] * len(papers)
+        
+        rule_based = RuleBasedClassifier()
+        results = [
+            rule_based.classify(paper) if rule_based.max_score(paper) <= confidence_gate else None
+            for paper in papers
+        ]
+        skipped = sum(result is not None for result in results)
+        logger.info(
+            f"Keyword pre-filter: {skipped}/{len(papers)} papers "
+            f"({skipped/len(papers)*100:.1f}%) classified NOT_RELEVANT without the LLM"
+        )
+        return results
+    
+    async def classify_batch_async(
+        self,
+        papers: List[PaperMetadata],
+        poll_interval: float = 30.0,
+        confidence_gate: Optional[float] = 0.0
+    ) -> List[ClassificationResult]:
+        """
+        Classify multiple papers as a single OpenAI Batch API job.
+        
+        All requests are uploaded as one JSONL file with the PMID as custom_id,
+        the job is polled until it ends, and the output file is mapped back
+        onto the papers. Batch jobs cost half as much as synchronous calls but
+        may take up to the 24h completion window, so this suits offline
+        evaluations rather than interactive use.
+        
+        Cached papers and papers the keyword pre-filter rules out (see
+        aclassify_batch) are not submitted, and if fewer than
+        MIN_BATCH_JOB_SIZE papers remain they are classified with
+        aclassify_batch instead. With a strict config every request carries
+        the json_schema response_format.
+        
+        Args:
+            papers: List of papers to classify
+            poll_interval: Seconds to wait between job status checks
+            confidence_gate: Papers whose rule-based keyword score is at most
+                this are classified NOT_RELEVANT without the LLM; None sends
+                every paper to the LLM
+        
+        Returns:
+            List of ClassificationResults in the same order as input papers
+            (papers the job did not answer get an error result)
+        """
+        if not papers:
+            return []
+        
+        # custom_id must be unique within a job: duplicate PMIDs share a request
+        results_by_pmid: Dict[str, ClassificationResult] = {}
+        pending: Dict[str, PaperMetadata] = {}
+        for paper in papers:
+            if paper.pmid in results_by_pmid or paper.pmid in pending:
+                continue
+            cached = self._load_cached(paper)
+            if cached is not None:
+                results_by_pmid[paper.pmid] = cached
+            else:
+                pending[paper.pmid] = paper
+        
+        # Same pre-filter as aclassify_batch, so labels do not depend on job size
+        if pending:
+            candidates = list(pending.values())
+            for paper, result in zip(candidates, self._prefilter(candidates, confidence_gate)):
+                if result is not None:
+                    results_by_pmid[paper.pmid] = result
+                    del pending[paper.pmid]
+        
+        if len(pending) < self.MIN_BATCH_JOB_SIZE:
+            if pending:
+                classified = await self.aclassify_batch(list(pending.values()), confidence_gate=None)
+                for paper, result in zip(pending.values(), classified):
+                    results_by_pmid[paper.pmid] = result
+            return [results_by_pmid[paper.pmid] for paper in papers]
+        
+        if self.is_strict:
+            messages, response_format = self._strict_messages, PAPER_CLASSIFICATION_SCHEMA
+        else:
+            messages, response_format = self._json_mode_messages, {"type": "json_object"}
+        requests = {
+            pmid: {
+                "custom_id": pmid,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_name,
+                    "messages": messages(paper),
+                    "response_format": response_format,
+                    "temperature": 0.1,
+                    "max_tokens": 1500
+                }
+            }
+            for pmid, paper in pending.items()
+        }
+        jsonl = "".join(json.dumps(request) + "\n" for request in requests.values())
+        
+        batch_input = await asyncio.to_thread(
+            self.client.files.create,
+            file=("paper_classification.jsonl", jsonl.encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await asyncio.to_thread(
+            self.client.batches.create,
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} classification requests")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await asyncio.to_thread(self.client.batches.retrieve, batch.id)
+            counts = batch.request_counts
+            if counts is not None:
+                logger.info(
+                    f"Batch {batch.id}: {batch.status} - "
+                    f"{counts.completed}/{counts.total} completed, {counts.failed} failed"
+                )
+        
+        if batch.status != "completed":
+            logger.error(f"Batch {batch.id} ended with status: {batch.status}")
+        
+        # Expired or cancelled jobs still return the requests that finished
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await asyncio.to_thread(self.client.files.content, file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                # A malformed line costs only its own paper, not the whole job
+                try:
+                    record = _loads(line)
+                    pmid = str(record["custom_id"])
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.error(f"Skipping unreadable line of batch {batch.id}: {e}")
+                    continue
+                try:
+                    result = self._parse_batch_line(pmid, record)
+                except Exception as e:
+                    logger.error(f"Could not parse batch result for PMID:{pmid}: {e}")
+                    result = self._create_error_result(pmid, f"Unparseable batch result: {e}")
+                results_by_pmid[pmid] = result
+                if pmid in pending:
+                    self._store_cached(pending[pmid], result)
+        
+        return [
+            results_by_pmid.get(paper.pmid)
+            or self._create_error_result(paper.pmid, f"No batch result (batch status: {batch.status})")
+            for paper in papers
+        ]
+    
+    def _format_user_prompt(self, paper: PaperMetadata) -> str:
+        """Format the classification user prompt for a paper."""
+        return format_user_prompt(
+            "classification",
+            pmid=paper.pmid,
+            title=paper.title,
+            abstract=paper.abstract[:4000] if paper.abstract else "(No abstract available)",
+            journal=paper.journal or "Unknown",
+            year=paper.publication_date.year if paper.publication_date else "Unknown"
+        )
+    
+    def _cache_path(self, paper: PaperMetadata) -> Path:
+        """Cache file for a paper's classification under the current model, prompts and response mode."""
+        mode = "strict" if self.is_strict else "json"
+        key = hashlib.sha1(
+            f"{self.model_name}|{PROMPT_VERSION}|{mode}|{paper.pmid}|{paper.title}|{paper.abstract}".encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _load_cached(self, paper: PaperMetadata) -> Optional[ClassificationResult]:
+        """Return the cached classification for a paper, if caching is enabled and it exists and has not expired."""
+        if self.cache_dir is None or self.refresh_cache:
+            return None
+        path = self._cache_path(paper)
+        try:
+            if time.time() - path.stat().st_mtime > self.CACHE_TTL_DAYS * 86400:
+                return None
+            return ClassificationResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable cached classification for PMID:{paper.pmid}: {e}")
+            return None
+    
+    def _store_cached(self, paper: PaperMetadata, result: ClassificationResult):
+        """
+        Cache a classification unless caching is disabled or it is an error result.
+        
+        A failed write is logged and otherwise ignored: the classification
+        has already been paid for and is still returned.
+        """
+        if self.cache_dir is None or (result.llm_reasoning or "").startswith("Error during classification"):
+            return
+        path = self._cache_path(paper)
+        try:
+            # Write to a temporary file and rename it into place, so concurrent
+            # readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(result.model_dump_json())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not cache classification for PMID:{paper.pmid}: {e}")
+    
+    def _system_content(self, schema: Dict[str, Any]) -> str:
+        """
+        Build a JSON-mode system message: the developer prompt followed by the schema.
+        
+        It holds no per-paper text, so it is a prefix shared by every request
+        with the same schema, which the API serves from its prompt cache at a
+        discount once it exceeds 1024 tokens.
+        """
+        schema_json = json.dumps(schema, indent=2)
+        return (
+            self._developer_prompt
+            + f"\n\nYou must output valid JSON strictly following this schema:\n```json\n{schema_json}\n```"
+        )
+    
+    @staticmethod
+    def _log_cached_tokens(label: str, response):
+        """Log how many prompt tokens of a response were served from the prompt cache."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is not None:
+            logger.debug(f"{label}: {details.cached_tokens}/{usage.prompt_tokens} prompt tokens cached")
+    
+    def _build_multi_paper_prompt(self, papers: List[PaperMetadata]) -> List[Dict[str, str]]:
+        """Build the JSON-mode chat messages classifying several papers in one request."""
+        papers_json = json.dumps([
+            {
+                "pmid": paper.pmid,
+                "title": paper.title,
+                "abstract": paper.abstract[:4000] if paper.abstract else "(No abstract available)",
+                "journal": paper.journal or "Unknown",
+                "year": paper.publication_date.year if paper.publication_date else "Unknown"
+            }
+            for paper in papers
+        ], indent=2, ensure_ascii=False)
+        user_prompt = get_prompt("classification", "multi_user_template").format(
+            n_papers=len(papers),
+            papers_json=papers_json
+        )
+        
+        # The schema fixes the number of papers, so chunks of the same size share a prefix
+        system_content = self._multi_system_content.get(len(papers))
+        if system_content is None:
+            system_content = self._system_content(get_multi_paper_classification_schema(len(papers)))
+            self._multi_system_content[len(papers)] = system_content
+        
+        return [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": user_prompt}
+        ]
+    
+    def _strict_messages(self, paper: PaperMetadata) -> List[Dict[str, str]]:
+        """Build the strict-mode chat messages; the API enforces the schema, so the prompt omits it."""
+        return [
+            {"role": "system", "content": self._developer_prompt},
+            {"role": "user", "content": self._format_user_prompt(paper)}
+        ]
+    
+    def _json_mode_messages(self, paper: PaperMetadata) -> List[Dict[str, str]]:
+        """Build the JSON-mode chat messages: the cacheable system prefix, then the paper."""
+        return [
+            {"role": "system", "content": self._json_mode_system_content},
+            {"role": "user", "content": self._format_user_prompt(paper)}
+        ]
+    
+    def _parse_batch_line(self, pmid: str, line: Dict[str, Any]) -> ClassificationResult:
+        """Parse one line (for `pmid`) of a Batch API output or error file; raises if malformed."""
+        response = line.get("response") or {}
+        if line.get("error") or response.get("status_code") != 200:
+            error = line.get("error") or response.get("body", {}).get("error")
+            logger.error(f"Batch request failed for PMID:{pmid}: {error}")
+            return self._create_error_result(pmid, str(error))
+        
+        content = response["body"]["choices"][0]["message"]["content"]
+        if not content:
+            return self._create_error_result(pmid, "Empty response content")
+        return self._parse_response(pmid, content)
+    
     def _parse_response(self, pmid: str, response_content: str) -> ClassificationResult:
         """Parse structured LLM response into ClassificationResult."""
         try:
-            # Handle potential markdown code blocks
-            content = response_content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            data = json.loads(content.strip())
+            try:
+                data = _loads(response_content)
+            except json.JSONDecodeError:
+                # JSON mode returns bare JSON; only other modes may wrap it in a code block
+                match = _FENCE_RE.match(response_content)
+                if match is None:
+                    raise
+                data = _loads(match.group(1))
             return self._parse_response_dict(pmid, data)
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON for PMID:{pmid}: {e}")
@@ -568,7 +1237,7 @@ class RuleBasedClassifier:
     
     def classify(self, paper: PaperMetadata) -> ClassificationResult:
         """Classify paper using keyword matching."""
-        text = f"{paper.title} {paper.abstract}".lower()
+        text = self._text(paper)
         
         categories = []
         
@@ -606,6 +1275,19 @@ class RuleBasedClassifier:
             model_used="rule-based"
         )
     
+    def max_score(self, paper: PaperMetadata) -> float:
+        """Highest keyword score of a paper over all categories (0.0 if no keyword matches)."""
+        text = self._text(paper)
+        return max(
+            self._calculate_score(text, keywords)[0]
+            for keywords in (self.PRS_KEYWORDS, self.H2_KEYWORDS, self.RG_KEYWORDS)
+        )
+    
+    @staticmethod
+    def _text(paper: PaperMetadata) -> str:
+        """Lowercased text searched for keywords."""
+        return f"{paper.title} {paper.abstract}".lower()
+    
     def _calculate_score(
         self, 
         text: str, 
@@ -615,6 +1297,10 @@ class RuleBasedClassifier:
         score = 0.0
         matched = []
         
+        # One `in` per term: for ~40 short terms and an abstract, CPython's
+        # substring search beats a single pass of a compiled alternation
+        # regex (about 7x faster than the `(?=(a|b|...))` form needed to
+        # report overlapping terms, 3x faster than plain `a|b|...`)
         for weight, terms in keywords.items():
             for term in terms:
                 if term.lower() in text:
@@ -17,6 +17,7 @@ Prompt Design Principles (from expert prompt engineering):
 - Leakage control (what NOT to extract)
 """
 
+import functools
 from typing import Dict, Any
 
 
@@ -137,6 +138,20 @@ Analyze this paper and determine:
 4. What quantitative data is potentially extractable"""
 
 
+CLASSIFICATION_MULTI_USER_PROMPT_TEMPLATE = """Classify each of the following {n_papers} papers for genetic data extraction.
+
+The papers are given as a JSON array of objects with pmid, title, abstract, journal and year:
+
+{papers_json}
+
+Classify every paper independently, exactly as if it were the only paper given. For each paper determine:
+1. Which categories (PRS_PERFORMANCE, HERITABILITY, GENETIC_CORRELATION, NOT_RELEVANT) apply
+2. Your confidence for each applicable category
+3. The key evidence (phrases/terms) supporting each classification
+
+Return one classification per paper, in the input order, each carrying the paper's pmid."""
+
+
 # ============================================================================
 # PRS Extraction Prompt
 # ============================================================================
@@ -469,6 +484,62 @@ Extract ALL genetic correlations reported, including:
 For each extraction, note the direction of correlation and its interpretation."""
 
 
+# ============================================================================
+# Combined Extraction Prompt
+# ============================================================================
+
+COMBINED_EXTRACTION_DEVELOPER_PROMPT = f"""## ROLE AND OBJECTIVE
+You perform three extraction tasks on the same paper in a single pass: PRS model performance, SNP-heritability (h²) and genetic correlation (rg). Follow the instructions of each task below independently, as if it were the only task.
+
+## OUTPUT FORMAT
+Return one JSON object following the provided schema with three keys:
+- prs: the output of TASK 1
+- heritability: the output of TASK 2
+- genetic_correlation: the output of TASK 3
+Use an empty extractions list for a task when the paper reports nothing for it.
+
+# TASK 1: PRS MODEL PERFORMANCE
+
+{PRS_EXTRACTION_DEVELOPER_PROMPT}
+
+# TASK 2: SNP-HERITABILITY
+
+{HERITABILITY_EXTRACTION_DEVELOPER_PROMPT}
+
+# TASK 3: GENETIC CORRELATION
+
+{GENETIC_CORRELATION_EXTRACTION_DEVELOPER_PROMPT}"""
+
+
+COMBINED_EXTRACTION_USER_PROMPT_TEMPLATE = """Extract PRS model performance, SNP-heritability (h²) and genetic correlation (rg) data from the following paper:
+
+**PMID:** {pmid}
+**TITLE:** {title}
+
+**FULL TEXT:**
+{text}
+
+**PUBLICATION:** {journal}, {year}
+
+For each task, extract ALL items reported in this paper and provide the exact source text from the paper.
+Note: We want SNP-heritability, not twin/family heritability."""
+
+
+# ============================================================================
+# Multi-Paper Extraction Prompt (any extraction task)
+# ============================================================================
+
+EXTRACTION_MULTI_USER_PROMPT_TEMPLATE = """Extract data from each of the following {n_papers} papers.
+
+Each paper starts with a `--- PAPER <pmid> START ---` line and ends with a `--- PAPER <pmid> END ---` line:
+
+{papers_text}
+
+Process every paper independently, exactly as if it were the only paper given: extract only what that paper itself reports, and take source text only from that paper.
+
+Return one entry per paper, in the input order, each carrying the paper's pmid."""
+
+
 # ============================================================================
 # Export all prompts
 # ============================================================================
@@ -477,29 +548,40 @@ PROMPTS = {
     "classification": {
         "developer": CLASSIFICATION_DEVELOPER_PROMPT,
         "user_template": CLASSIFICATION_USER_PROMPT_TEMPLATE,
+        "multi_user_template": CLASSIFICATION_MULTI_USER_PROMPT_TEMPLATE,
     },
     "prs_extraction": {
         "developer": PRS_EXTRACTION_DEVELOPER_PROMPT,
         "user_template": PRS_EXTRACTION_USER_PROMPT_TEMPLATE,
+        "multi_user_template": EXTRACTION_MULTI_USER_PROMPT_TEMPLATE,
     },
     "heritability_extraction": {
         "developer": HERITABILITY_EXTRACTION_DEVELOPER_PROMPT,
         "user_template": HERITABILITY_EXTRACTION_USER_PROMPT_TEMPLATE,
+        "multi_user_template": EXTRACTION_MULTI_USER_PROMPT_TEMPLATE,
     },
     "genetic_correlation_extraction": {
         "developer": GENETIC_CORRELATION_EXTRACTION_DEVELOPER_PROMPT,
         "user_template": GENETIC_CORRELATION_EXTRACTION_USER_PROMPT_TEMPLATE,
+        "multi_user_template": EXTRACTION_MULTI_USER_PROMPT_TEMPLATE,
+    },
+    "combined_extraction": {
+        "developer": COMBINED_EXTRACTION_DEVELOPER_PROMPT,
+        "user_template": COMBINED_EXTRACTION_USER_PROMPT_TEMPLATE,
+        "multi_user_template": EXTRACTION_MULTI_USER_PROMPT_TEMPLATE,
     },
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_prompt(task: str, prompt_type: str = "developer") -> str:
     """
     Get a prompt by task and type.
     
     Args:
-        task: One of "classification", "prs_extraction", "heritability_extraction", "genetic_correlation_extraction"
-        prompt_type: "developer" or "user_template"
+        task: One of "classification", "prs_extraction", "heritability_extraction",
+            "genetic_correlation_extraction", "combined_extraction"
+        prompt_type: "developer", "user_template" or "multi_user_template"
     
     Returns:
         The prompt string
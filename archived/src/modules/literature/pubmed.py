@@ -13,6 +13,7 @@ API Documentation: https://www.ncbi.nlm.nih.gov/books/NBK25500/
 import os
 import time
 import logging
+import threading
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -70,6 +71,7 @@ class PubMedClient:
         # Rate limiting
         self._last_request_time = 0.0
         self._min_request_interval = 0.1 if self.api_key else 0.34  # seconds
+        self._rate_lock = threading.Lock()  # Client may be shared across threads
         
         # HTTP client with timeouts
         self.client = httpx.Client(
@@ -79,10 +81,11 @@ class PubMedClient:
     
     def _rate_limit(self):
         """Ensure we don't exceed NCBI rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self._min_request_interval:
+                time.sleep(self._min_request_interval - elapsed)
+            self._last_request_time = time.time()
     
     def _build_params(self, **kwargs) -> Dict[str, str]:
         """Build request parameters with common fields."""
@@ -120,14 +123,17 @@ class PubMedClient:
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
     )
-    def _request_xml(self, endpoint: str, params: Dict[str, str]) -> str:
-        """Make a request expecting XML response."""
+    def _request_xml(self, endpoint: str, params: Dict[str, str], method: str = "GET") -> str:
+        """Make a request expecting XML response (POST sends params as form data)."""
         self._rate_limit()
         url = f"{self.BASE_URL}/{endpoint}"
         params["retmode"] = "xml"
         
         try:
-            response = self.client.get(url, params=params)
+            if method == "POST":
+                response = self.client.post(url, data=params)
+            else:
+                response = self.client.get(url, params=params)
             response.raise_for_status()
             return response.text
         except Exception as e:
@@ -314,8 +320,8 @@ class PubMedClient:
         
         papers = []
         
-        # EFetch has a limit, process in batches
-        batch_size = 100
+        # EFetch has a limit, process in batches (NCBI recommends POST above 200 IDs)
+        batch_size = 200
         for i in range(0, len(pmids), batch_size):
             batch = pmids[i:i+batch_size]
             batch_papers = self._fetch_batch(batch)
@@ -387,7 +393,7 @@ class PubMedClient:
             return None
     
     def _fetch_batch(self, pmids: List[str]) -> List[PaperMetadata]:
-        """Fetch a batch of papers."""
+        """Fetch a batch of papers with a single EFetch POST."""
         params = self._build_params(
             db="pubmed",
             id=",".join(pmids),
@@ -395,7 +401,7 @@ class PubMedClient:
         )
         params["retmode"] = "xml"  # EFetch returns better data in XML
         
-        xml_data = self._request_xml("efetch.fcgi", params)
+        xml_data = self._request_xml("efetch.fcgi", params, method="POST")
         return self._parse_efetch_xml(xml_data)
     
     def _parse_efetch_xml(self, xml_data: str) -> List[PaperMetadata]:
@@ -0,0 +1,73 @@
+"""
+LLM Request Rate Limiting
+
+Sliding-window throttle shared by the async classifier and extractors, so
+concurrent requests queue up client-side instead of tripping the API's
+requests- and tokens-per-minute limits, and the wait the API asks for when
+a request is rate-limited anyway.
+"""
+
+import time
+import asyncio
+from collections import deque
+from typing import Dict, List, Optional
+
+# Characters per token assumed when no tokenizer is used
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Rough token count of chat messages, for throttling without tokenizing."""
+    return sum(len(m["content"]) for m in messages) // CHARS_PER_TOKEN
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Seconds to wait before retrying, from the Retry-After headers of an API error.
+    
+    Returns None if the error has no response or the headers are absent or
+    not a number of seconds (Retry-After may also be an HTTP date).
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    for header, seconds_per_unit in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return max(0.0, float(headers.get(header)) * seconds_per_unit)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class RequestThrottle:
+    """
+    Sliding-window limit on LLM requests and tokens per minute.
+    
+    acquire() waits until one more request of the given size keeps the last
+    minute within both limits, so concurrent requests queue up here
+    instead of tripping the API's rate limits.
+    """
+    
+    WINDOW_SECONDS = 60.0
+    
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int):
+        self.max_requests = max_requests_per_minute
+        self.max_tokens = max_tokens_per_minute
+        self._sent = deque()  # (send time, tokens) within the window
+        self._tokens = 0
+    
+    async def acquire(self, tokens: int):
+        """Wait until a request of `tokens` tokens may be sent, then record it."""
+        # A request larger than the whole budget still goes out, alone
+        tokens = min(tokens, self.max_tokens)
+        while True:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0][0] >= self.WINDOW_SECONDS:
+                self._tokens -= self._sent.popleft()[1]
+            
+            if len(self._sent) < self.max_requests and self._tokens + tokens <= self.max_tokens:
+                self._sent.append((now, tokens))
+                self._tokens += tokens
+                return
+            
+            await asyncio.sleep(self.WINDOW_SECONDS - (now - self._sent[0][0]))
@@ -17,6 +17,7 @@ Schema Design Principles:
 4. additionalProperties: False for strict validation
 """
 
+import functools
 from typing import Dict, Any
 
 # ============================================================================
@@ -573,6 +574,31 @@ GENETIC_CORRELATION_EXTRACTION_SCHEMA: Dict[str, Any] = {
 }
 
 
+# ============================================================================
+# Combined Extraction Schema
+# ============================================================================
+
+# One response holding all three extraction tasks; each section has exactly the
+# shape of that task's own response, so the per-task parsers apply unchanged
+COMBINED_EXTRACTION_SCHEMA: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "combined_extraction",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "prs": PRS_EXTRACTION_SCHEMA["json_schema"]["schema"],
+                "heritability": HERITABILITY_EXTRACTION_SCHEMA["json_schema"]["schema"],
+                "genetic_correlation": GENETIC_CORRELATION_EXTRACTION_SCHEMA["json_schema"]["schema"],
+            },
+            "required": ["prs", "heritability", "genetic_correlation"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
 # ============================================================================
 # Export all schemas
 # ============================================================================
@@ -582,9 +608,64 @@ ALL_SCHEMAS = {
     "prs_extraction": PRS_EXTRACTION_SCHEMA,
     "heritability_extraction": HERITABILITY_EXTRACTION_SCHEMA,
     "genetic_correlation_extraction": GENETIC_CORRELATION_EXTRACTION_SCHEMA,
+    "combined_extraction": COMBINED_EXTRACTION_SCHEMA,
 }
 
 
+def _multi_paper_schema(item: Dict[str, Any], array_key: str, description: str, n_papers: int) -> Dict[str, Any]:
+    """
+    Schema for n_papers results of the single-paper schema `item`, each tagged
+    with its paper's PMID.
+    
+    The array is wrapped in an object because JSON mode requires a top-level object.
+    """
+    return {
+        "type": "object",
+        "properties": {
+            array_key: {
+                "type": "array",
+                "description": description,
+                "items": {
+                    **item,
+                    "properties": {
+                        "pmid": {
+                            "type": "string",
+                            "description": "PMID of the paper this entry is for."
+                        },
+                        **item["properties"]
+                    },
+                    "required": ["pmid", *item["required"]]
+                },
+                "minItems": n_papers,
+                "maxItems": n_papers
+            }
+        },
+        "required": [array_key],
+        "additionalProperties": False
+    }
+
+
+def get_multi_paper_classification_schema(n_papers: int) -> Dict[str, Any]:
+    """Get the schema for classifying n_papers papers in a single response."""
+    return _multi_paper_schema(
+        PAPER_CLASSIFICATION_SCHEMA["json_schema"]["schema"],
+        "classifications",
+        "One classification per input paper, in input order.",
+        n_papers
+    )
+
+
+def get_multi_paper_extraction_schema(schema_name: str, n_papers: int) -> Dict[str, Any]:
+    """Get the schema for running extraction `schema_name` on n_papers papers in a single response."""
+    return _multi_paper_schema(
+        get_schema(schema_name)["json_schema"]["schema"],
+        "papers",
+        "One extraction result per input paper, in input order.",
+        n_papers
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def get_schema(schema_name: str) -> Dict[str, Any]:
     """Get a schema by name."""
     if schema_name not in ALL_SCHEMAS: